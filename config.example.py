@@ -28,6 +28,30 @@ SCAN_INTERVAL = 1800  # 30분
 SCAN_US_MARKET = True   # 미국 주식 스캔 여부
 SCAN_KR_MARKET = True   # 한국 주식 스캔 여부
 
+# 파이프라인 스캔 (조회 → 분석 → 알림)
+US_FETCH_CONCURRENCY = 2   # 미국 주식 동시 조회 수 (묶음 단위)
+KR_FETCH_CONCURRENCY = 4   # 한국 주식 동시 조회 수 (종목 단위)
+SCAN_ANALYSIS_WORKERS = 0  # 분석 작업 스레드 수 (0이면 CPU 수)
+QUEUE_SIZE = 64            # 단계 사이 대기열 크기
+NOTIFY_INTERVAL = 1.0      # 신호 알림 전송 간격 (초, 알림 단계에서만 대기)
+
+
+# ========================================
+# 데이터 설정
+# ========================================
+
+# 일봉 로컬 캐시 디렉토리 ("" 이면 캐시 비활성화)
+BAR_CACHE_DIR = "cache/bars"
+
+# 미국 주식 묶음 조회
+US_BATCH_SIZE = 100     # 한 번에 요청할 종목 수
+US_BATCH_THREADS = 8    # 다운로드 스레드 수
+
+# 한국 주식 수집 방식
+#   "ticker": 종목별 조회 (수정주가)
+#   "snapshot": 거래일별 전종목 스냅샷 조회 (요청 수가 종목 수와 무관, 수정주가 미반영)
+KR_INGEST_MODE = "ticker"
+
 
 # ========================================
 # 감시 종목 설정
@@ -11,6 +11,7 @@ import sys
 
 from .bot import BreakoutDetector
 from .config import load_settings
+from .data import configure_bar_store
 
 
 def main():
@@ -22,6 +23,13 @@ def main():
 예제:
     python -m oneil_breakout              # 봇 실행
     python -m oneil_breakout backtest     # 백테스트 실행
+    python -m oneil_breakout backtest --jobs 8  # 신호 계산 8개 프로세스 병렬
+    python -m oneil_breakout backtest --no-cache  # 결과 캐시 없이 다시 계산
+    python -m oneil_breakout backtest --start 2020-01-01 --checkpoint cache/us_checkpoint.npz  # 지난 실행 이후 거래일만 처리
+    python -m oneil_breakout backtest sweep --grid volume_surge_min=40,50,60 --grid stop_loss_pct=-6,-8
+    python -m oneil_breakout backtest exits --grid stop_loss_pct=-5,-8,-10 --grid take_profit_pct=15,20,30
+    python -m oneil_breakout backtest montecarlo --simulations 10000
+    python -m oneil_breakout backtest walkforward --start 2015-01-01 --grid volume_surge_min=40,50,60 --jobs 8
     python -m oneil_breakout scan         # 즉시 1회 스캔
     python -m oneil_breakout scan --us    # 미국만 스캔
     python -m oneil_breakout scan --kr    # 한국만 스캔
@@ -40,15 +48,45 @@ def main():
 
     # backtest 명령
     backtest_parser = subparsers.add_parser('backtest', help='백테스트 실행')
+    backtest_parser.add_argument('mode', nargs='?', choices=['run', 'sweep', 'exits', 'montecarlo', 'walkforward'],
+                                 default='run',
+                                 help='run: 백테스트 (기본), sweep: 파라미터 스윕, exits: 청산 규칙 분석, '
+                                      'montecarlo: 거래 순서 몬테카를로 분석, walkforward: 워크포워드 최적화')
     backtest_parser.add_argument('--market', choices=['US', 'KR'], default='US',
                                  help='시장 선택 (기본: US)')
     backtest_parser.add_argument('--start', type=str, help='시작일 (YYYY-MM-DD)')
     backtest_parser.add_argument('--end', type=str, help='종료일 (YYYY-MM-DD)')
     backtest_parser.add_argument('--capital', type=float, default=100_000_000,
                                  help='초기 자본 (기본: 1억)')
+    backtest_parser.add_argument('--jobs', type=int, default=1,
+                                 help='신호 계산/스윕 프로세스 수 (기본: 1)')
+    backtest_parser.add_argument('--grid', action='append', default=[], metavar='KEY=V1,V2',
+                                 help='스윕/청산 분석 설정 값 (예: volume_surge_min=40,50,60, 반복 지정)')
+    backtest_parser.add_argument('--samples', type=int,
+                                 help='스윕 조합 무작위 표본 수 (기본: 전체 조합)')
+    backtest_parser.add_argument('--seed', type=int, default=42,
+                                 help='스윕 표본 추출/몬테카를로 시드 (기본: 42)')
+    backtest_parser.add_argument('--simulations', type=int, default=10_000,
+                                 help='몬테카를로 시뮬레이션 수 (기본: 10000)')
+    backtest_parser.add_argument('--method', choices=['bootstrap', 'permute'], default='bootstrap',
+                                 help='몬테카를로 방식 (bootstrap: 복원 추출, permute: 순서 섞기)')
+    backtest_parser.add_argument('--train-days', type=int, default=504,
+                                 help='워크포워드 학습 구간 거래일 수 (기본: 504)')
+    backtest_parser.add_argument('--test-days', type=int, default=126,
+                                 help='워크포워드 검증 구간 거래일 수 (기본: 126)')
+    backtest_parser.add_argument('--metric', default='total_return_pct',
+                                 help='워크포워드 학습 구간 선택 지표 (기본: total_return_pct, 예: sharpe)')
+    backtest_parser.add_argument('--no-cache', action='store_true',
+                                 help='백테스트 결과 캐시 사용 안 함')
+    backtest_parser.add_argument('--checkpoint', type=str, metavar='PATH',
+                                 help='체크포인트 경로 (있으면 이후 거래일만 이어서 실행하고 갱신, --start 필요)')
 
     args = parser.parse_args()
 
+    # 기본 시작일(1년 전)은 매일 바뀌어 체크포인트 설정과 맞지 않으므로 고정 시작일 필요
+    if args.command == 'backtest' and args.checkpoint and not args.start:
+        backtest_parser.error("--checkpoint는 --start와 함께 사용해야 합니다 (예: --start 2020-01-01)")
+
     # 기본 명령어 (인자 없이 실행)
     if args.command is None or args.command == 'run':
         run_bot()
@@ -96,7 +134,7 @@ def run_scan(args):
 
 def run_backtest(args):
     """백테스트 실행"""
-    from .backtest import BacktestEngine
+    from .backtest import BacktestEngine, ResultCache
     from datetime import datetime, timedelta
 
     print("=" * 60)
@@ -104,6 +142,7 @@ def run_backtest(args):
     print("=" * 60)
 
     settings = load_settings()
+    configure_bar_store(settings.data.cache_dir)
 
     # 기간 설정
     end_date = args.end or datetime.now().strftime('%Y-%m-%d')
@@ -115,19 +154,203 @@ def run_backtest(args):
     else:
         tickers = settings.watchlist.kr_stocks[:20]
 
-    # 백테스트 실행
-    engine = BacktestEngine(initial_capital=args.capital)
+    if args.mode == 'sweep':
+        run_sweep(args, settings, tickers, start_date, end_date)
+        return
+    if args.mode == 'exits':
+        run_exit_grid(args, tickers, start_date, end_date)
+        return
+    if args.mode == 'walkforward':
+        run_walk_forward(args, settings, tickers, start_date, end_date)
+        return
+
+    # 백테스트 실행 (같은 데이터/설정이면 캐시된 결과 사용)
+    result_cache = None
+    if not args.no_cache and settings.data.backtest_cache_dir:
+        result_cache = ResultCache(
+            settings.data.backtest_cache_dir,
+            max_bytes=settings.data.backtest_cache_max_mb * 1024 * 1024
+        )
+    engine = BacktestEngine(initial_capital=args.capital, jobs=args.jobs, result_cache=result_cache)
     engine.run_portfolio_backtest(
         tickers=tickers,
         start_date=start_date,
         end_date=end_date,
         market=args.market,
-        patterns=['cup', 'pivot', 'base']
+        patterns=['cup', 'pivot', 'base'],
+        checkpoint_path=args.checkpoint
     )
 
+    if args.mode == 'montecarlo':
+        run_monte_carlo(args, engine, start_date, end_date)
+        return
+
     engine.print_performance_report()
     engine.save_results(f'{args.market.lower()}_backtest_results.csv')
 
 
+def run_sweep(args, settings, tickers, start_date, end_date):
+    """파라미터 스윕 실행"""
+    from .backtest import BacktestEngine
+    from .backtest.sweep import build_combinations, parse_grid, print_sweep_report, run_sweep as sweep
+
+    if not args.grid:
+        print("\n⚠️  스윕할 설정을 --grid KEY=V1,V2 형식으로 지정하세요.")
+        return
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        return
+
+    combos = build_combinations(grid, args.samples, args.seed)
+
+    # 데이터는 한 번만 로드
+    frames = BacktestEngine().load_frames(tickers, start_date, end_date, args.market)
+    if not frames:
+        print("\n❌ 백테스트할 종목이 없습니다.")
+        return
+
+    results = sweep(
+        frames, combos, start_date, end_date,
+        market=args.market,
+        patterns=['cup', 'pivot', 'base'],
+        initial_capital=args.capital,
+        base_pattern=settings.pattern,
+        base_trading=settings.trading,
+        jobs=args.jobs
+    )
+
+    print_sweep_report(results)
+    filename = f'{args.market.lower()}_sweep_results.csv'
+    results.to_csv(filename, index=False, encoding='utf-8-sig')
+    print(f"💾 결과 저장: {filename}")
+
+
+def run_walk_forward(args, settings, tickers, start_date, end_date):
+    """워크포워드 최적화 실행"""
+    from .backtest import BacktestEngine
+    from .backtest.sweep import METRIC_KEYS, build_combinations, parse_grid
+    from .backtest.walkforward import print_walk_forward_report, run_walk_forward as walk_forward
+
+    if args.metric not in METRIC_KEYS:
+        print(f"\n❌ 선택 지표는 {', '.join(METRIC_KEYS)} 중 하나여야 합니다: {args.metric}")
+        return
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        return
+
+    combos = build_combinations(grid, args.samples, args.seed)
+
+    # 데이터는 한 번만 로드 (일봉 캐시 사용)
+    frames = BacktestEngine().load_frames(tickers, start_date, end_date, args.market)
+    if not frames:
+        print("\n❌ 백테스트할 종목이 없습니다.")
+        return
+
+    result = walk_forward(
+        frames, combos,
+        train_bars=args.train_days,
+        test_bars=args.test_days,
+        market=args.market,
+        patterns=['cup', 'pivot', 'base'],
+        initial_capital=args.capital,
+        base_pattern=settings.pattern,
+        base_trading=settings.trading,
+        metric=args.metric,
+        jobs=args.jobs
+    )
+    if result is None:
+        return
+
+    print_walk_forward_report(result)
+    result['engine'].print_performance_report()
+
+    market = args.market.lower()
+    result['folds'].to_csv(f'{market}_walkforward_folds.csv', index=False, encoding='utf-8-sig')
+    print(f"💾 구간별 결과 저장: {market}_walkforward_folds.csv")
+    result['engine'].save_results(f'{market}_walkforward_results.csv')
+
+
+def run_monte_carlo(args, engine, start_date, end_date):
+    """백테스트 거래 내역으로 몬테카를로 분석"""
+    from .backtest.montecarlo import print_monte_carlo_report, run_monte_carlo as monte_carlo
+    from datetime import datetime
+
+    days = (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days
+    years = max(days, 1) / 365.25
+    result = monte_carlo(
+        engine.ledger.to_frame(),
+        initial_capital=engine.initial_capital,
+        position_size_pct=engine.position_size_pct,
+        max_positions=engine.max_positions,
+        years=years,
+        simulations=args.simulations,
+        method=args.method,
+        seed=args.seed
+    )
+
+    print_monte_carlo_report(result)
+    if result is not None:
+        filename = f'{args.market.lower()}_monte_carlo_bands.csv'
+        result['bands'].to_csv(filename, encoding='utf-8-sig')
+        print(f"💾 회차별 평가금액 분포 저장: {filename}")
+
+
+def run_exit_grid(args, tickers, start_date, end_date):
+    """백테스트 진입 내역으로 청산 규칙 그리드 분석"""
+    from .backtest import BacktestEngine
+    from .backtest.exits import entries_from_trades, evaluate_exit_grid, print_exit_grid_report
+
+    grid = {
+        'stop_loss_pct': [-5.0, -6.0, -7.0, -8.0, -10.0, -12.0],
+        'take_profit_pct': [10.0, 15.0, 20.0, 25.0, 30.0, 40.0],
+        'max_holding_days': [10, 20, 30, 45, 60]
+    }
+    for spec in args.grid:
+        key, _, values = spec.partition('=')
+        key = key.strip()
+        if key not in grid:
+            print(f"\n❌ 청산 분석 설정은 {', '.join(grid)} 중 하나여야 합니다: {key}")
+            return
+        cast = type(grid[key][0])
+        try:
+            parsed = [cast(v) for v in values.split(',') if v.strip()]
+        except ValueError:
+            print(f"\n❌ {key} 값은 {'정수' if cast is int else '숫자'}여야 합니다: {values}")
+            return
+        if not parsed:
+            print(f"\n❌ 값이 없는 설정: {key}")
+            return
+        grid[key] = parsed
+
+    # 진입 집합은 기본 청산 규칙의 백테스트에서 추출
+    engine = BacktestEngine(initial_capital=args.capital, jobs=args.jobs)
+    frames = engine.load_frames(tickers, start_date, end_date, args.market)
+    if not frames:
+        print("\n❌ 백테스트할 종목이 없습니다.")
+        return
+    engine.start_date = start_date
+    engine.end_date = end_date
+    engine.simulate_portfolio(frames, engine.detect_signals_parallel(frames), args.market, ['cup', 'pivot', 'base'])
+
+    results = evaluate_exit_grid(
+        frames,
+        entries_from_trades(engine.ledger.to_frame()),
+        grid['stop_loss_pct'],
+        grid['take_profit_pct'],
+        grid['max_holding_days']
+    )
+
+    print_exit_grid_report(results)
+    filename = f'{args.market.lower()}_exit_grid.csv'
+    results.to_csv(filename, index=False, encoding='utf-8-sig')
+    print(f"💾 결과 저장: {filename}")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 """백테스트 모듈"""
+from .cache import ResultCache
 from .engine import BacktestEngine
 
-__all__ = ['BacktestEngine']
\ No newline at end of file
+__all__ = ['BacktestEngine', 'ResultCache']
\ No newline at end of file
@@ -0,0 +1,254 @@
+"""
+백테스트 결과 캐시 (내용 주소 방식)
+- 키: 설정값 + 종목별 일봉 데이터 지문의 해시 (데이터가 바뀌면 키도 바뀜)
+- 종목별 신호와 실행 결과(거래 내역, 평가금액)를 따로 저장해
+  일부 종목 데이터만 바뀌면 그 종목 신호만 다시 계산
+- 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PatternSettings
+from .ledger import trades_from_arrays, trades_to_arrays
+
+# 결과 형식이나 시뮬레이션 규칙이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 2
+
+SIGNAL_KEYS = ('cup', 'pivot', 'base')
+EQUITY_KEYS = ('date', 'cash', 'market_value', 'positions', 'traded')
+
+
+def frame_fingerprint(df: pd.DataFrame, columns: List[str] | None = None, stop: int | None = None) -> str:
+    """
+    일봉 데이터 지문 (인덱스와 가격/거래량 값의 해시)
+
+    Args:
+        df: OHLCV 데이터프레임
+        columns: 지문에 포함할 열 (None이면 전체 열)
+        stop: 앞에서부터 지문에 포함할 봉 수 (None이면 전체)
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    index = pd.DatetimeIndex(df.index)
+    digest.update(str(index.tz).encode())
+    digest.update(index.as_unit('ns').asi8[:stop].tobytes())
+    for column in columns or list(df.columns):
+        digest.update(column.encode())
+        digest.update(np.ascontiguousarray(df[column].to_numpy(dtype=float)[:stop]).tobytes())
+    return digest.hexdigest()
+
+
+def _hash_key(payload: Dict) -> str:
+    """설정 딕셔너리의 해시 키"""
+    text = json.dumps({'version': CACHE_VERSION, **payload}, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=20).hexdigest()
+
+
+class ResultCache:
+    """
+    백테스트 결과 디스크 캐시
+
+    파일 구조:
+        {cache_dir}/signals/{key}.npz: 종목별 패턴 신호 (cup/pivot/base)
+        {cache_dir}/runs/{key}.npz: 실행 결과 (거래 내역 열, 평가금액 열, 최종 현금)
+    """
+
+    def __init__(self, cache_dir: str = "cache/backtest", max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 저장 디렉토리
+            max_bytes: 캐시 전체 크기 상한 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, kind: str, key: str) -> str:
+        """캐시 파일 경로 (kind: 'signals' 또는 'runs')"""
+        return os.path.join(self.cache_dir, kind, f"{key}.npz")
+
+    # ========================================
+    # 키
+    # ========================================
+
+    def signal_key(self, df: pd.DataFrame, settings: PatternSettings) -> str:
+        """종목 신호 키 (신호는 종가/거래량과 패턴 설정에만 의존)"""
+        return _hash_key({
+            'kind': 'signals',
+            'data': frame_fingerprint(df, ['Close', 'Volume']),
+            'pattern': asdict(settings)
+        })
+
+    def run_key(self, frames: Dict[str, pd.DataFrame], config: Dict) -> str:
+        """
+        실행 결과 키
+
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임} (진입 우선순위 순서가 결과에 영향)
+            config: 기간, 시장, 패턴, 자본/거래/패턴 설정 딕셔너리
+
+        Returns:
+            해시 키
+        """
+        return _hash_key({
+            'kind': 'runs',
+            'data': [[ticker, frame_fingerprint(df)] for ticker, df in frames.items()],
+            **config
+        })
+
+    # ========================================
+    # 저장/조회
+    # ========================================
+
+    def _load(self, kind: str, key: str) -> Dict[str, np.ndarray] | None:
+        path = self.path(kind, key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except Exception as e:
+            print(f"⚠️  백테스트 캐시 로드 실패: {e}")
+            self.misses += 1
+            return None
+
+        # 최근 사용 시각 갱신 (삭제 순서 기준)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return arrays
+
+    def _save(self, kind: str, key: str, arrays: Dict[str, np.ndarray]) -> bool:
+        path = self.path(kind, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️  백테스트 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        self.evict()
+        return True
+
+    def load_signals(self, key: str) -> Dict[str, np.ndarray] | None:
+        """캐시된 종목 신호 ({'cup' | 'pivot' | 'base': 신호 배열}) 또는 None"""
+        arrays = self._load('signals', key)
+        if arrays is None:
+            return None
+        return {name: arrays[name] for name in SIGNAL_KEYS}
+
+    def save_signals(self, key: str, signals: Dict[str, np.ndarray]) -> bool:
+        """종목 신호 저장"""
+        return self._save('signals', key, {name: np.asarray(signals[name]) for name in SIGNAL_KEYS})
+
+    def load_run(self, key: str) -> Dict | None:
+        """
+        캐시된 실행 결과
+
+        Returns:
+            {'trades': 거래 내역 데이터프레임, 'equity': 평가금액 열 딕셔너리,
+             'equity_tz': 평가일 tz, 'capital': 최종 현금} 또는 None
+        """
+        arrays = self._load('runs', key)
+        if arrays is None:
+            return None
+
+        return {
+            'trades': trades_from_arrays(arrays),
+            'equity': {name: arrays[f'equity_{name}'].tolist() for name in EQUITY_KEYS},
+            'equity_tz': str(arrays['equity_tz']) or None,
+            'capital': float(arrays['capital'])
+        }
+
+    def save_run(
+        self,
+        key: str,
+        trades: pd.DataFrame,
+        equity: Dict[str, List],
+        equity_tz,
+        capital: float
+    ) -> bool:
+        """
+        실행 결과 저장
+
+        Args:
+            key: run_key 결과
+            trades: 거래 내역 데이터프레임 (TradeLedger.to_frame)
+            equity: 평가금액 열 딕셔너리 (date는 int64 나노초)
+            equity_tz: 평가일 tz (없으면 None)
+            capital: 최종 현금
+        """
+        arrays = trades_to_arrays(trades)
+        arrays['equity_date'] = np.asarray(equity['date'], dtype=np.int64)
+        for name in EQUITY_KEYS[1:]:
+            arrays[f'equity_{name}'] = np.asarray(equity[name], dtype=np.int64 if name == 'positions' else float)
+        arrays['equity_tz'] = np.array(str(equity_tz) if equity_tz is not None else '')
+        arrays['capital'] = np.array(float(capital))
+        return self._save('runs', key, arrays)
+
+    # ========================================
+    # 정리
+    # ========================================
+
+    def size(self) -> int:
+        """캐시 전체 크기 (바이트)"""
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        """(최근 사용 시각, 경로, 크기) 목록"""
+        entries = []
+        for kind in ('signals', 'runs'):
+            directory = os.path.join(self.cache_dir, kind)
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.name.endswith('.npz'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def evict(self) -> int:
+        """
+        크기 상한을 넘으면 오래 사용하지 않은 파일부터 삭제
+
+        Returns:
+            삭제한 파일 수
+        """
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for _, path, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
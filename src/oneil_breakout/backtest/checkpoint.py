@@ -0,0 +1,134 @@
+"""
+증분 백테스트 체크포인트
+- 마지막 거래일의 백테스트종료 정리 직전 상태(현금, 보유 포지션, 거래 내역, 평가금액)를 저장
+- 종목별로 체크포인트 시점까지의 일봉 지문을 함께 저장해, 과거 데이터가 그대로일 때만 이어서 실행
+"""
+import json
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .ledger import trades_from_arrays, trades_to_arrays
+
+# 저장 형식이나 시뮬레이션 규칙이 바뀌면 올려서 기존 체크포인트 무효화
+CHECKPOINT_VERSION = 1
+
+EQUITY_KEYS = ('date', 'cash', 'market_value', 'positions', 'traded')
+POSITION_LABELS = ('ticker', 'market', 'pattern')
+POSITION_VALUES = ('entry_price', 'shares', 'cost', 'stop_loss', 'take_profit')
+
+
+def save_checkpoint(path: str, state: Dict) -> bool:
+    """
+    체크포인트 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        path: 저장 경로 (.npz)
+        state: {'config': 설정 JSON, 'tickers': 종목 리스트, 'fingerprints': 종목별 일봉 지문,
+                'last_bars': 종목별 마지막 봉 (int64 ns), 'capital': 현금,
+                'positions': 보유 포지션 딕셔너리 리스트, 'marks': {종목: 최근 종가},
+                'trades': 거래 내역 데이터프레임, 'equity': 평가금액 열 딕셔너리, 'equity_tz': 평가일 tz}
+
+    Returns:
+        저장 성공 여부
+    """
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'config': state['config'],
+        'tickers': list(state['tickers']),
+        'fingerprints': list(state['fingerprints']),
+        'equity_tz': str(state['equity_tz']) if state['equity_tz'] is not None else ''
+    }
+    arrays = trades_to_arrays(state['trades'])
+    arrays['meta'] = np.array(json.dumps(meta))
+    arrays['last_bars'] = np.asarray(state['last_bars'], dtype=np.int64)
+    arrays['capital'] = np.array(float(state['capital']))
+
+    marks = state['marks']
+    arrays['mark_tickers'] = np.asarray(list(marks), dtype=str)
+    arrays['mark_values'] = np.asarray(list(marks.values()), dtype=float)
+
+    positions = state['positions']
+    for name in POSITION_LABELS:
+        arrays[f'position_{name}'] = np.asarray([p[name] for p in positions], dtype=str)
+    for name in POSITION_VALUES:
+        arrays[f'position_{name}'] = np.asarray(
+            [p[name] for p in positions], dtype=np.int64 if name == 'shares' else float
+        )
+    entry_dates = pd.DatetimeIndex([p['entry_date'] for p in positions])
+    arrays['position_entry_date'] = entry_dates.as_unit('ns').asi8
+    arrays['position_tz'] = np.array(str(entry_dates.tz) if entry_dates.tz is not None else '')
+
+    equity = state['equity']
+    arrays['equity_date'] = np.asarray(equity['date'], dtype=np.int64)
+    for name in EQUITY_KEYS[1:]:
+        arrays[f'equity_{name}'] = np.asarray(equity[name], dtype=np.int64 if name == 'positions' else float)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"⚠️  체크포인트 저장 실패: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def load_checkpoint(path: str) -> Dict | None:
+    """
+    체크포인트 로드
+
+    Args:
+        path: 체크포인트 경로
+
+    Returns:
+        save_checkpoint의 state와 같은 형식 (없거나 버전이 다르면 None)
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        meta = json.loads(str(arrays['meta']))
+    except Exception as e:
+        print(f"⚠️  체크포인트 로드 실패: {e}")
+        return None
+
+    if meta.get('version') != CHECKPOINT_VERSION:
+        return None
+
+    position_tz = str(arrays['position_tz']) or None
+    entry_dates = pd.DatetimeIndex(arrays['position_entry_date'].astype('datetime64[ns]'))
+    if position_tz:
+        entry_dates = entry_dates.tz_localize('UTC').tz_convert(position_tz)
+
+    positions: List[Dict] = []
+    for i, entry_date in enumerate(entry_dates):
+        position = {name: str(arrays[f'position_{name}'][i]) for name in POSITION_LABELS}
+        position['entry_date'] = entry_date
+        for name in POSITION_VALUES:
+            value = arrays[f'position_{name}'][i]
+            position[name] = int(value) if name == 'shares' else float(value)
+        positions.append(position)
+
+    return {
+        'config': meta['config'],
+        'tickers': meta['tickers'],
+        'fingerprints': meta['fingerprints'],
+        'last_bars': arrays['last_bars'].tolist(),
+        'capital': float(arrays['capital']),
+        'positions': positions,
+        'marks': dict(zip(arrays['mark_tickers'].tolist(), arrays['mark_values'].tolist())),
+        'trades': trades_from_arrays(arrays),
+        'equity': {name: arrays[f'equity_{name}'].tolist() for name in EQUITY_KEYS},
+        'equity_tz': meta['equity_tz'] or None
+    }
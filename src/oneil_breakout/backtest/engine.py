@@ -5,15 +5,80 @@
 - 손절/익절 시뮬레이션
 - 성과 분석 및 보고서 생성
 """
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
 from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from ..config.settings import PatternSettings
 from ..data.us_stock import get_us_stock_data_by_date
 from ..data.kr_stock import get_kr_stock_data_by_date
-from ..patterns.pivot import detect_pivot_breakout_at_index
+from ..patterns.base import detect_base_breakout, detect_base_breakout_series
+from ..patterns.cup_handle import detect_cup_and_handle, detect_cup_and_handle_series
+from ..patterns.features import FeatureCache, FeatureSet, get_feature_cache
+from ..patterns.panel import build_panel, detect_breakouts_panel, split_gapped
+from ..patterns.pivot import detect_pivot_breakout_at_index, detect_pivot_breakout_series
+from .cache import ResultCache, frame_fingerprint
+from .checkpoint import load_checkpoint, save_checkpoint
+from .ledger import TradeLedger
+from .metrics import compute_risk_metrics
+
+# 진입 우선순위 순서의 (패턴 키, 패턴명)
+PATTERN_NAMES = (('cup', '컵앤핸들'), ('pivot', '피벗돌파'), ('base', '베이스돌파'))
+
+_DAY_NS = 86_400_000_000_000
+
+# 신호 계산에 필요한 가장 긴 과거 구간 (컵앤핸들 60봉 + 당일)
+SIGNAL_LOOKBACK = 61
+
+
+class Position:
+    """
+    보유 포지션 레코드
+
+    시뮬레이션 루프에서 매 봉 확인하는 값(손절가, 목표가, 진입 시각)을 미리 계산해 둔다.
+    기존 딕셔너리 포지션처럼 position['ticker'] 형태로도 읽을 수 있다.
+    """
+
+    __slots__ = (
+        'ticker', 'market', 'pattern', 'entry_date', 'entry_price',
+        'shares', 'cost', 'stop_loss', 'take_profit', 'entry_ns'
+    )
+
+    def __init__(
+        self,
+        ticker: str,
+        market: str,
+        pattern: str,
+        entry_date: datetime,
+        entry_price: float,
+        shares: int,
+        cost: float,
+        stop_loss: float,
+        take_profit: float
+    ):
+        self.ticker = ticker
+        self.market = market
+        self.pattern = pattern
+        self.entry_date = entry_date
+        self.entry_price = entry_price
+        self.shares = shares
+        self.cost = cost
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.entry_ns = pd.Timestamp(entry_date).value
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict:
+        """딕셔너리로 변환"""
+        return {key: getattr(self, key) for key in self.__slots__ if key != 'entry_ns'}
 
 
 class BacktestEngine:
@@ -26,7 +91,12 @@ class BacktestEngine:
         take_profit_pct: float = 20.0,
         max_holding_days: int = 30,
         max_positions: int = 5,
-        position_size_pct: float = 20.0
+        position_size_pct: float = 20.0,
+        pattern_settings: PatternSettings | None = None,
+        feature_cache: FeatureCache | None = None,
+        jobs: int = 1,
+        trade_log_path: str | None = None,
+        result_cache: ResultCache | None = None
     ):
         """
         Args:
@@ -36,6 +106,11 @@ class BacktestEngine:
             max_holding_days: 최대 보유 기간 (일)
             max_positions: 최대 포지션 수
             position_size_pct: 포지션 크기 (자본 대비 %)
+            pattern_settings: 패턴 감지 설정 (None이면 기본값)
+            feature_cache: 이동 구간 지표 캐시 (None이면 프로세스 공용 캐시)
+            jobs: 신호 계산 프로세스 수 (1이면 병렬 처리 안 함)
+            trade_log_path: 거래 내역을 나눠 내보낼 경로 (.csv 또는 .parquet, None이면 메모리 보관, 기존 파일은 첫 내보내기 때 덮어씀)
+            result_cache: 신호/실행 결과 디스크 캐시 (None이면 캐시 안 함)
         """
         self.initial_capital = initial_capital
         self.capital = initial_capital
@@ -44,78 +119,211 @@ class BacktestEngine:
         self.max_holding_days = max_holding_days
         self.max_positions = max_positions
         self.position_size_pct = position_size_pct
-
-        self.positions: List[Dict] = []
-        self.trade_history: List[Dict] = []
+        self.pattern_settings = pattern_settings or PatternSettings()
+        self.feature_cache = feature_cache if feature_cache is not None else get_feature_cache()
+        self.jobs = max(1, jobs)
+        self.result_cache = result_cache
+
+        self.positions: List[Position] = []
+        self.ledger = TradeLedger(stream_path=trade_log_path)
+
+        # 종목별 최근 종가 (보유 포지션 평가용)와 일별 평가금액 기록
+        self.marks: Dict[str, float] = {}
+        self._equity_tz = None
+        self._equity: Dict[str, List] = {
+            'date': [], 'cash': [], 'market_value': [], 'positions': [], 'traded': []
+        }
         self.start_date: str | None = None
         self.end_date: str | None = None
 
+    @property
+    def trade_history(self) -> List[Dict]:
+        """
+        거래 내역 딕셔너리 리스트 (호환용 읽기 전용 복사본, 대량 처리는 ledger 사용)
+        - 조회할 때마다 새 리스트를 만들므로 .append로 추가한 항목은 반영되지 않음
+        - 거래 추가는 ledger.append, 전체 교체는 trade_history에 리스트를 대입
+        """
+        return self.ledger.to_records()
+
+    @trade_history.setter
+    def trade_history(self, trades: List[Dict]):
+        self.ledger.clear()
+        for trade in trades:
+            self.ledger.append(**trade)
+
+    @property
+    def equity_curve(self) -> pd.DataFrame:
+        """
+        일별 평가금액 곡선 (시뮬레이션한 거래일마다 장 마감 기준)
+
+        Returns:
+            cash (현금), market_value (보유 포지션 평가액), equity (합계),
+            exposure (투자 비중 %), positions (보유 종목 수), traded (당일 매수+매도 금액) 열의 데이터프레임
+        """
+        records = self._equity
+        index = pd.DatetimeIndex(np.asarray(records['date'], dtype='datetime64[ns]'), name='date')
+        if self._equity_tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self._equity_tz)
+
+        curve = pd.DataFrame({
+            'cash': np.asarray(records['cash'], dtype=float),
+            'market_value': np.asarray(records['market_value'], dtype=float),
+            'positions': np.asarray(records['positions'], dtype=np.int64),
+            'traded': np.asarray(records['traded'], dtype=float)
+        }, index=index)
+        curve.insert(2, 'equity', curve['cash'] + curve['market_value'])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            curve.insert(3, 'exposure', curve['market_value'] / curve['equity'] * 100)
+        return curve
+
+    def market_value(self) -> float:
+        """보유 포지션 평가액 (종목별 최근 종가 기준)"""
+        return sum(p.shares * self.marks.get(p.ticker, p.entry_price) for p in self.positions)
+
     # ========================================
     # 패턴 감지
     # ========================================
 
-    def detect_cup_and_handle(self, df: pd.DataFrame, idx: int) -> Tuple[bool, float]:
-        """컵앤핸들 패턴 감지"""
-        if idx < 60:
-            return False, 0
-
-        try:
-            window = df.iloc[idx - 60:idx + 1]
-            close = window['Close'].values
-
-            mid_idx = len(close) // 2
-            left_peak = np.max(close[:mid_idx])
-            bottom = np.min(close[mid_idx - 10:mid_idx + 10])
-            cup_depth = ((left_peak - bottom) / left_peak) * 100
+    def detect_cup_and_handle(self, df: pd.DataFrame, idx: int, ticker: str | None = None) -> Tuple[bool, float]:
+        """컵앤핸들 패턴 감지 (ticker를 주면 지표 캐시의 전체 구간 결과 사용)"""
+        if ticker is None:
+            return detect_cup_and_handle(df, idx)
+        signals, resistance = detect_cup_and_handle_series(df, features=self.feature_cache.get(ticker, df))
+        return bool(signals[idx]), resistance[idx]
+
+    def detect_pivot_breakout(self, df: pd.DataFrame, idx: int, ticker: str | None = None) -> Tuple[bool, float]:
+        """피벗 포인트 돌파 감지 (ticker를 주면 지표 캐시의 전체 구간 결과 사용)"""
+        if ticker is None:
+            return detect_pivot_breakout_at_index(df, idx)
+        signals, resistance = detect_pivot_breakout_series(df, features=self.feature_cache.get(ticker, df))
+        return bool(signals[idx]), resistance[idx]
+
+    def detect_base_breakout(self, df: pd.DataFrame, idx: int, ticker: str | None = None) -> Tuple[bool, float]:
+        """베이스 돌파 감지 (ticker를 주면 지표 캐시의 전체 구간 결과 사용)"""
+        if ticker is None:
+            return detect_base_breakout(df, idx)
+        signals, resistance = detect_base_breakout_series(df, features=self.feature_cache.get(ticker, df))
+        return bool(signals[idx]), resistance[idx]
+
+    def detect_signals(self, df: pd.DataFrame, ticker: str | None = None) -> Dict[str, np.ndarray]:
+        """
+        단일 종목 전체 구간 패턴 신호
 
-            handle = close[-10:]
-            handle_depth = ((np.max(handle) - np.min(handle)) / np.max(handle)) * 100
+        세 패턴이 같은 이동 구간 지표를 공유하며, ticker를 주면
+        지표 캐시에 보관해 다른 설정의 재실행에서도 재사용한다.
 
-            current_price = close[-1]
-            resistance = np.max(close[-20:])
-            breakout = current_price >= resistance * 0.99
+        Returns:
+            {'cup' | 'pivot' | 'base': 신호 배열}
+        """
+        features = self.feature_cache.get(ticker, df) if ticker is not None else FeatureSet.from_frame(df)
+        return _series_signals(df, self.pattern_settings, features)
 
-            if 12 <= cup_depth <= 40 and handle_depth < 12 and breakout:
-                return True, resistance
+    def detect_signals_panel(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        다중 종목 패턴 신호를 패널 연산 한 번으로 계산
 
-        except:
-            pass
+        합친 거래일 중간에 봉이 빠진 종목(거래정지 등)은 종목별로 계산해
+        detect_signals와 같은 결과를 낸다.
 
-        return False, 0
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임}
 
-    def detect_pivot_breakout(self, df: pd.DataFrame, idx: int) -> Tuple[bool, float]:
-        """피벗 포인트 돌파 감지"""
-        return detect_pivot_breakout_at_index(df, idx)
+        Returns:
+            {종목 코드: {'cup' | 'pivot' | 'base': 종목 데이터프레임에 맞춘 신호 배열}}
+        """
+        return _frame_signals(frames, self.pattern_settings, self.feature_cache)
 
-    def detect_base_breakout(self, df: pd.DataFrame, idx: int) -> Tuple[bool, float]:
-        """베이스 돌파 감지"""
-        if idx < 40:
-            return False, 0
+    def detect_signals_parallel(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        종목별 신호 계산을 프로세스 풀로 나눠 실행 (jobs가 1이면 현재 프로세스에서 패널 연산)
 
-        try:
-            window = df.iloc[idx - 40:idx + 1]
-            close = window['Close'].values
+        신호는 종목마다 독립적이므로 종목 묶음 단위로 병렬 처리하고,
+        자본 배분/청산은 이후 simulate_portfolio에서 순차로 처리한다.
 
-            base_period = close[-30:-5]
-            base_high = np.max(base_period)
-            base_low = np.min(base_period)
-            base_volatility = ((base_high - base_low) / base_low) * 100
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임}
 
-            current_price = close[-1]
-            breakout = current_price > base_high
-            breakout_pct = ((current_price - base_high) / base_high) * 100
+        Returns:
+            {종목 코드: {'cup' | 'pivot' | 'base': 신호 배열}} (frames 순서 유지)
+        """
+        tickers = list(frames)
+        if self.jobs <= 1 or len(tickers) < 2:
+            return self.detect_signals_panel(frames)
+
+        # 작업 편차를 줄이기 위해 프로세스당 4묶음으로 분할
+        chunk_size = max(1, -(-len(tickers) // (self.jobs * 4)))
+        chunks = [
+            {ticker: frames[ticker][['Close', 'Volume']] for ticker in tickers[i:i + chunk_size]}
+            for i in range(0, len(tickers), chunk_size)
+        ]
+
+        print(f"   ⚙️  신호 계산 병렬 실행 ({self.jobs}개 프로세스, {len(chunks)}묶음)...")
+        merged = {}
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            for result in executor.map(_signals_worker, chunks, [self.pattern_settings] * len(chunks)):
+                merged.update(result)
+        return {ticker: merged[ticker] for ticker in tickers if ticker in merged}
+
+    def detect_signals_cached(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        결과 캐시를 거친 종목별 신호 (데이터가 바뀐 종목만 다시 계산)
 
-            avg_volume = window['Volume'].iloc[-30:-5].mean()
-            current_volume = window['Volume'].iloc[-1]
-            volume_surge = (current_volume / avg_volume - 1) * 100
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임}
 
-            if base_volatility < 15 and breakout and volume_surge >= 40 and 0 < breakout_pct <= 7:
-                return True, base_high
+        Returns:
+            {종목 코드: {'cup' | 'pivot' | 'base': 신호 배열}} (frames 순서 유지)
+        """
+        if self.result_cache is None:
+            return self.detect_signals_parallel(frames)
+
+        keys = {ticker: self.result_cache.signal_key(df, self.pattern_settings) for ticker, df in frames.items()}
+        signals, missing = {}, {}
+        for ticker, df in frames.items():
+            cached = self.result_cache.load_signals(keys[ticker])
+            if cached is not None and len(cached['cup']) == len(df):
+                signals[ticker] = cached
+            else:
+                missing[ticker] = df
+
+        if signals:
+            print(f"   ⚡ 캐시된 신호 사용: {len(signals)}종목 (새로 계산: {len(missing)}종목)")
+        if missing:
+            for ticker, result in self.detect_signals_parallel(missing).items():
+                self.result_cache.save_signals(keys[ticker], result)
+                signals[ticker] = result
+
+        return {ticker: signals[ticker] for ticker in frames if ticker in signals}
+
+    def _cache_config(self, market: str, patterns: List[str], start_date: str, end_date: str) -> Dict:
+        """실행 결과 캐시 키에 들어가는 설정값"""
+        return {
+            'market': market,
+            'start_date': start_date,
+            'end_date': end_date,
+            'patterns': list(patterns),
+            'initial_capital': self.initial_capital,
+            'stop_loss_pct': self.stop_loss_pct,
+            'take_profit_pct': self.take_profit_pct,
+            'max_holding_days': self.max_holding_days,
+            'max_positions': self.max_positions,
+            'position_size_pct': self.position_size_pct,
+            'pattern': asdict(self.pattern_settings)
+        }
 
-        except:
-            pass
+    def _is_fresh(self) -> bool:
+        """아직 시뮬레이션하지 않은 상태인지 (캐시 결과를 그대로 복원할 수 있는지)"""
+        return (
+            not len(self.ledger) and not self.positions and not self._equity['date']
+            and self.capital == self.initial_capital
+        )
 
-        return False, 0
+    def _restore_run(self, payload: Dict):
+        """캐시된 실행 결과 복원"""
+        self.ledger.extend(payload['trades'])
+        self._equity = payload['equity']
+        self._equity_tz = payload['equity_tz']
+        self.capital = payload['capital']
 
     # ========================================
     # 포지션 관리
@@ -137,73 +345,66 @@ class BacktestEngine:
             cost = shares * entry_price
             self.capital -= cost
 
-            position = {
-                'ticker': ticker,
-                'market': market,
-                'pattern': pattern,
-                'entry_date': entry_date,
-                'entry_price': entry_price,
-                'shares': shares,
-                'cost': cost,
-                'stop_loss': entry_price * (1 + self.stop_loss_pct / 100)
-            }
+            position = Position(
+                ticker, market, pattern, entry_date, entry_price, shares, cost,
+                stop_loss=entry_price * (1 + self.stop_loss_pct / 100),
+                take_profit=entry_price * (1 + self.take_profit_pct / 100)
+            )
             self.positions.append(position)
             return True
         return False
 
     def close_position(
         self,
-        position: Dict,
+        position: Position,
         exit_date: datetime,
         exit_price: float,
         reason: str
     ):
         """포지션 청산"""
-        proceeds = position['shares'] * exit_price
+        proceeds = position.shares * exit_price
         self.capital += proceeds
 
-        profit = proceeds - position['cost']
-        profit_pct = (profit / position['cost']) * 100
-
-        trade = {
-            'ticker': position['ticker'],
-            'market': position['market'],
-            'pattern': position['pattern'],
-            'entry_date': position['entry_date'],
-            'entry_price': position['entry_price'],
-            'exit_date': exit_date,
-            'exit_price': exit_price,
-            'shares': position['shares'],
-            'cost': position['cost'],
-            'proceeds': proceeds,
-            'profit': profit,
-            'profit_pct': profit_pct,
-            'holding_days': (exit_date - position['entry_date']).days,
-            'reason': reason
-        }
-        self.trade_history.append(trade)
+        profit = proceeds - position.cost
+        profit_pct = (profit / position.cost) * 100
+
+        self.ledger.append(
+            position.ticker,
+            position.market,
+            position.pattern,
+            position.entry_date,
+            position.entry_price,
+            exit_date,
+            exit_price,
+            position.shares,
+            position.cost,
+            proceeds,
+            profit,
+            profit_pct,
+            (exit_date - position.entry_date).days,
+            reason
+        )
         self.positions.remove(position)
 
     def check_exit_conditions(
         self,
-        position: Dict,
+        position: Position,
         current_date: datetime,
         current_price: float,
         low: float
     ) -> Tuple[bool, float, str]:
         """청산 조건 확인"""
         # 손절 확인
-        if low <= position['stop_loss']:
-            return True, position['stop_loss'], '손절'
+        if low <= position.stop_loss:
+            return True, position.stop_loss, '손절'
 
         # 최대 보유 기간
-        holding_days = (current_date - position['entry_date']).days
+        holding_days = (current_date - position.entry_date).days
         if holding_days >= self.max_holding_days:
             return True, current_price, '보유기간만료'
 
         # 익절 확인
-        take_profit_price = position['entry_price'] * (1 + self.take_profit_pct / 100)
-        if current_price >= take_profit_price:
+        if current_price >= position.take_profit:
             return True, current_price, '익절'
 
         return False, current_price, ''
@@ -232,61 +433,342 @@ class BacktestEngine:
         print(f"   시장: {market}")
         print(f"   패턴: {', '.join(patterns)}")
 
-        # 데이터 가져오기
+        df = self._load_data(ticker, start_date, end_date, market)
+        if df is None:
+            print(f"   ❌ 데이터 부족")
+            return
+
+        trade_count = self.simulate_portfolio({ticker: df}, {ticker: self.detect_signals(df, ticker)}, market, patterns)
+        print(f"   ✅ 완료 (거래: {trade_count}건)")
+
+    def _load_data(self, ticker: str, start_date: str, end_date: str, market: str) -> pd.DataFrame | None:
+        """백테스트용 데이터 조회 (100봉 미만이면 None)"""
         if market == 'US':
             df = get_us_stock_data_by_date(ticker, start_date, end_date)
         else:
             df = get_kr_stock_data_by_date(ticker, start_date, end_date)
 
         if df is None or len(df) < 100:
-            print(f"   ❌ 데이터 부족")
-            return
+            return None
+        return df
 
-        # 날짜별 시뮬레이션
-        for idx in range(60, len(df)):
-            current_date = df.index[idx]
-            current_price = df['Close'].iloc[idx]
-            low = df['Low'].iloc[idx]
-
-            # 기존 포지션 관리
-            for position in self.positions.copy():
-                if position['ticker'] == ticker:
-                    should_exit, exit_price, reason = self.check_exit_conditions(
-                        position, current_date, current_price, low
-                    )
-                    if should_exit:
-                        self.close_position(position, current_date, exit_price, reason)
+    def load_frames(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        market: str = 'US'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        전 종목 백테스트용 데이터 조회 (데이터 부족/오류 종목 제외)
+
+        Returns:
+            {종목 코드: OHLCV 데이터프레임} (입력 순서 유지)
+        """
+        frames = {}
+        for ticker in tickers:
+            try:
+                df = self._load_data(ticker, start_date, end_date, market)
+            except Exception as e:
+                print(f"   ❌ {ticker} 오류: {e}")
+                continue
+            if df is None:
+                print(f"   ❌ {ticker} 데이터 부족")
+                continue
+            frames[ticker] = df
+        return frames
+
+    def simulate_portfolio(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        signals: Dict[str, Dict[str, np.ndarray]],
+        market: str,
+        patterns: List[str],
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+        liquidate: bool = True
+    ) -> int:
+        """
+        선계산된 신호로 전 종목을 거래일 순서대로 한 번에 시뮬레이션
+
+        거래일마다 보유 포지션 청산을 먼저 처리한 뒤 종목 순서대로 신규 진입을 확인하므로
+        자본과 최대 포지션 수가 시간 순서대로 배분된다.
+        각 종목은 자기 데이터의 60번째 봉부터 진입하고, 마지막 봉에서 남은 포지션을 정리한다.
+
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임} (진입 우선순위 순서)
+            signals: {종목 코드: {'cup' | 'pivot' | 'base': 신호 배열}}
+            market: 시장 ('US' 또는 'KR')
+            patterns: 사용할 패턴
+            start: 시뮬레이션 시작일 (None이면 처음부터, 이전 데이터는 신호 계산에만 사용)
+            end: 시뮬레이션 종료일 (None이면 끝까지)
+            liquidate: 마지막 거래일에 끝나는 종목의 포지션 정리 여부
+                (False면 보유한 채로 두고, 이어서 실행하거나 close_out으로 정리)
+
+        Returns:
+            발생한 거래 수
+        """
+        trades_before = len(self.ledger)
+        tickers = [ticker for ticker in frames if ticker in signals]
+        if not tickers:
+            return 0
+
+        calendar = frames[tickers[0]].index
+        for ticker in tickers[1:]:
+            calendar = calendar.union(frames[ticker].index)
+        in_range = np.ones(len(calendar), dtype=bool)
+        if start is not None:
+            in_range &= calendar >= start
+        if end is not None:
+            in_range &= calendar <= end
+        if not in_range.any():
+            return 0
+
+        # 시뮬레이션 구간 (start~end는 연속 구간) 안의 거래일만 사용
+        days = np.flatnonzero(in_range)
+        first_day = int(days[0])
+        window = calendar[first_day:int(days[-1]) + 1]
+        final_day = len(window) - 1
+
+        # 종목별 (구간 거래일 → 구간 안 봉 번호) 매핑과 가격 배열 (루프에서는 pandas 인덱싱 없음)
+        bars = {}
+        entries: Dict[int, List[Tuple[str, str, int]]] = {}
+        exits_at: Dict[int, List[str]] = {}
+        pattern_names = [(key, name) for key, name in PATTERN_NAMES if key in patterns]
+        for ticker in tickers:
+            df = frames[ticker]
+            positions = calendar.get_indexer(df.index) - first_day
+            lo, hi = np.searchsorted(positions, [0, len(window)])
+            if lo == hi:
+                continue
+            local = np.full(len(window), -1)
+            local[positions[lo:hi]] = np.arange(hi - lo)
+            bars[ticker] = (
+                local.tolist(),
+                df.index[lo:hi],
+                df.index.asi8[lo:hi].tolist(),
+                df['Close'].to_numpy(dtype=float)[lo:hi].tolist(),
+                df['Low'].to_numpy(dtype=float)[lo:hi].tolist()
+            )
+            last_day = int(positions[hi - 1])
+            if liquidate or last_day != final_day:
+                exits_at.setdefault(last_day, []).append(ticker)
+
+            # 진입 후보: 60번째 봉 이후 첫 번째로 켜진 패턴 (컵앤핸들 > 피벗 > 베이스)
+            chosen = np.full(len(df), -1)
+            for rank, (key, _) in reversed(list(enumerate(pattern_names))):
+                chosen[signals[ticker][key]] = rank
+            chosen[:60] = -1
+            for idx in np.flatnonzero(chosen[lo:hi] >= 0).tolist():
+                entries.setdefault(int(positions[lo + idx]), []).append(
+                    (ticker, pattern_names[chosen[lo + idx]][1], idx)
+                )
+
+        # 종목별 보유 포지션 (진입 순서 유지)
+        held: Dict[str, Position] = {position.ticker: position for position in self.positions}
+        max_holding_days = self.max_holding_days
+
+        calendar_ns = window.asi8
+        if window.tz is not None:
+            self._equity_tz = window.tz
+        marks = self.marks
+        equity = self._equity
+
+        for day in range(len(window)):
+            traded = 0.0
+
+            # 기존 포지션 관리 (check_exit_conditions와 같은 순서: 손절 → 보유기간 → 익절)
+            for position in list(held.values()):
+                bar = bars.get(position.ticker)
+                if bar is None:
+                    continue
+                local, index, index_ns, close, low = bar
+                idx = local[day]
+                if idx < 0:
+                    continue
+
+                if low[idx] <= position.stop_loss:
+                    exit_price, reason = position.stop_loss, '손절'
+                elif (index_ns[idx] - position.entry_ns) // _DAY_NS >= max_holding_days:
+                    exit_price, reason = close[idx], '보유기간만료'
+                elif close[idx] >= position.take_profit:
+                    exit_price, reason = close[idx], '익절'
+                else:
+                    continue
+                self.close_position(position, index[idx], exit_price, reason)
+                traded += position.shares * exit_price
+                del held[position.ticker]
 
             # 새로운 진입 기회 확인
-            has_position = any(p['ticker'] == ticker for p in self.positions)
-            if not has_position and len(self.positions) < self.max_positions:
-
-                if 'cup' in patterns:
-                    signal, _ = self.detect_cup_and_handle(df, idx)
-                    if signal:
-                        self.open_position(ticker, current_date, current_price, '컵앤핸들', market)
-                        continue
-
-                if 'pivot' in patterns:
-                    signal, _ = self.detect_pivot_breakout(df, idx)
-                    if signal:
-                        self.open_position(ticker, current_date, current_price, '피벗돌파', market)
-                        continue
-
-                if 'base' in patterns:
-                    signal, _ = self.detect_base_breakout(df, idx)
-                    if signal:
-                        self.open_position(ticker, current_date, current_price, '베이스돌파', market)
-
-        # 백테스트 종료 시 남은 포지션 정리
-        end_date_dt = df.index[-1]
-        end_price = df['Close'].iloc[-1]
-        for position in self.positions.copy():
-            if position['ticker'] == ticker:
-                self.close_position(position, end_date_dt, end_price, '백테스트종료')
-
-        trade_count = len([t for t in self.trade_history if t['ticker'] == ticker])
-        print(f"   ✅ 완료 (거래: {trade_count}건)")
+            for ticker, pattern, idx in entries.get(day, ()):
+                if len(self.positions) >= self.max_positions:
+                    break
+                if ticker in held:
+                    continue
+                _, index, _, close, _ = bars[ticker]
+                if self.open_position(ticker, index[idx], close[idx], pattern, market):
+                    held[ticker] = self.positions[-1]
+                    traded += held[ticker].cost
+
+            # 종목별 마지막 봉에서 남은 포지션 정리
+            for ticker in exits_at.get(day, ()):
+                position = held.pop(ticker, None)
+                if position is not None:
+                    local, index, _, close, _ = bars[ticker]
+                    idx = local[day]
+                    self.close_position(position, index[idx], close[idx], '백테스트종료')
+                    traded += position.shares * close[idx]
+
+            # 장 마감 평가 (당일 봉이 없는 종목은 최근 종가)
+            market_value = 0.0
+            for ticker, position in held.items():
+                local, _, _, close, _ = bars[ticker]
+                idx = local[day]
+                if idx >= 0:
+                    marks[ticker] = close[idx]
+                market_value += position.shares * marks.get(ticker, position.entry_price)
+
+            equity['date'].append(calendar_ns[day])
+            equity['cash'].append(self.capital)
+            equity['market_value'].append(market_value)
+            equity['positions'].append(len(self.positions))
+            equity['traded'].append(traded)
+
+        return len(self.ledger) - trades_before
+
+    def close_out(self, frames: Dict[str, pd.DataFrame], tickers: List[str]) -> int:
+        """
+        마지막 평가일에 남은 포지션을 종가로 정리 (simulate_portfolio(liquidate=False) 이후)
+
+        simulate_portfolio가 그날 장 마감 전에 정리한 것과 같은 순서로 처리하고,
+        그날 평가금액 기록(현금, 평가액, 거래금액)을 고친다.
+
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임}
+            tickers: 정리할 종목 (종목 순서대로 처리)
+
+        Returns:
+            정리한 포지션 수
+        """
+        equity = self._equity
+        if not equity['date']:
+            return 0
+
+        held = {position.ticker: position for position in self.positions}
+        day = pd.DatetimeIndex(np.asarray(equity['date'][-1:], dtype='datetime64[ns]'))
+        traded = equity['traded'][-1]
+        closed = 0
+        for ticker in tickers:
+            position = held.pop(ticker, None)
+            if position is None:
+                continue
+            df = frames[ticker]
+            idx = df.index.asi8.searchsorted(day.asi8[0])
+            close = float(df['Close'].iat[idx])
+            self.close_position(position, df.index[idx], close, '백테스트종료')
+            traded += position.shares * close
+            closed += 1
+
+        if closed:
+            equity['cash'][-1] = self.capital
+            equity['market_value'][-1] = self.market_value()
+            equity['positions'][-1] = len(self.positions)
+            equity['traded'][-1] = traded
+        return closed
+
+    # ========================================
+    # 체크포인트 (증분 실행)
+    # ========================================
+
+    def _checkpoint_state(self, frames: Dict[str, pd.DataFrame], config: str) -> Dict:
+        """마지막 평가일 기준 체크포인트 상태"""
+        cutoff = self._equity['date'][-1]
+        fingerprints, last_bars = [], []
+        for df in frames.values():
+            index_ns = df.index.asi8
+            split = index_ns.searchsorted(cutoff, side='right')
+            fingerprints.append(frame_fingerprint(df, stop=split))
+            last_bars.append(int(index_ns[split - 1]) if split else 0)
+
+        return {
+            'config': config,
+            'tickers': list(frames),
+            'fingerprints': fingerprints,
+            'last_bars': last_bars,
+            'capital': self.capital,
+            'positions': [position.to_dict() for position in self.positions],
+            'marks': dict(self.marks),
+            'trades': self.ledger.to_frame(),
+            'equity': {name: list(values) for name, values in self._equity.items()},
+            'equity_tz': self._equity_tz
+        }
+
+    def _resume(self, state: Dict, frames: Dict[str, pd.DataFrame], config: str) -> int | None:
+        """
+        체크포인트 상태 복원 (과거 데이터와 설정이 그대로일 때만)
+
+        체크포인트 마지막 평가일까지의 일봉이 모두 같고, 그 전에 데이터가 끝난 종목에
+        새 봉이 없어야 처음부터 다시 실행한 결과와 같아진다.
+        마지막 평가일에 데이터가 끝나는 종목은 그날 종가로 정리한다.
+
+        Returns:
+            체크포인트 마지막 평가일 (int64 ns) 또는 None (이어서 실행 불가)
+        """
+        if state['config'] != config or state['tickers'] != list(frames) or not state['equity']['date']:
+            return None
+
+        cutoff = state['equity']['date'][-1]
+        ended = []
+        for df, fingerprint, last_bar in zip(frames.values(), state['fingerprints'], state['last_bars']):
+            index_ns = df.index.asi8
+            split = index_ns.searchsorted(cutoff, side='right')
+            if frame_fingerprint(df, stop=split) != fingerprint:
+                return None
+            has_new_bars = split < len(df)
+            if last_bar < cutoff and has_new_bars:
+                return None
+            ended.append(last_bar == cutoff and not has_new_bars)
+
+        self.capital = state['capital']
+        self.positions = [
+            Position(
+                p['ticker'], p['market'], p['pattern'], p['entry_date'], p['entry_price'],
+                p['shares'], p['cost'], p['stop_loss'], p['take_profit']
+            )
+            for p in state['positions']
+        ]
+        self.marks = dict(state['marks'])
+        self.ledger.extend(state['trades'])
+        self._equity = state['equity']
+        self._equity_tz = state['equity_tz']
+
+        # 체크포인트 평가일에 데이터가 끝나는 종목은 처음부터 실행할 때처럼 그날 정리
+        self.close_out(frames, [ticker for ticker, done in zip(frames, ended) if done])
+        return cutoff
+
+    def _tail_signals(self, frames: Dict[str, pd.DataFrame], cutoff: int) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        체크포인트 이후 봉의 신호만 계산 (SIGNAL_LOOKBACK만큼의 과거 봉 포함)
+
+        패턴 신호는 과거 SIGNAL_LOOKBACK개 봉에만 의존하므로 잘라낸 구간의 결과가
+        전체 구간에서 계산한 값과 같다. 체크포인트 이전 봉의 신호는 False로 채운다.
+        """
+        offsets, tails = {}, {}
+        for ticker, df in frames.items():
+            split = df.index.asi8.searchsorted(cutoff, side='right')
+            if split >= len(df):
+                continue
+            offsets[ticker] = max(split - SIGNAL_LOOKBACK, 0)
+            tails[ticker] = df.iloc[offsets[ticker]:]
+
+        signals = {}
+        for ticker, tail_signals in self.detect_signals_parallel(tails).items():
+            offset = offsets[ticker]
+            signals[ticker] = {
+                key: np.concatenate([np.zeros(offset, dtype=bool), np.asarray(values, dtype=bool)])
+                for key, values in tail_signals.items()
+            }
+        return signals
 
     def run_portfolio_backtest(
         self,
@@ -294,9 +776,15 @@ class BacktestEngine:
         start_date: str,
         end_date: str,
         market: str = 'US',
-        patterns: List[str] | None = None
+        patterns: List[str] | None = None,
+        checkpoint_path: str | None = None
     ):
-        """다중 종목 포트폴리오 백테스트"""
+        """
+        다중 종목 포트폴리오 백테스트 (거래일 순서 이벤트 처리)
+
+        checkpoint_path를 주면 마지막 거래일의 정리 직전 상태를 저장하고, 다음 실행에서
+        과거 데이터와 설정이 그대로이면 체크포인트 이후 거래일만 이어서 처리한다.
+        """
         self.start_date = start_date
         self.end_date = end_date
 
@@ -308,32 +796,108 @@ class BacktestEngine:
         print(f"초기 자본: {self.initial_capital:,.0f}원")
         print(f"{'=' * 60}\n")
 
-        for ticker in tickers:
-            try:
-                self.run_backtest(ticker, start_date, end_date, market, patterns)
-            except Exception as e:
-                print(f"   ❌ {ticker} 오류: {e}")
-                continue
+        if patterns is None:
+            patterns = ['cup', 'pivot', 'base']
+
+        # 1단계: 전 종목 데이터 로드 후 종목별 신호 계산 (병렬 가능)
+        frames = self.load_frames(tickers, start_date, end_date, market)
+        if not frames:
+            print("   ❌ 백테스트할 종목이 없습니다.")
+            return
+
+        config = self._cache_config(market, patterns, start_date, end_date)
+        if checkpoint_path is not None:
+            self._run_with_checkpoint(frames, market, patterns, config, checkpoint_path)
+            return
+
+        # 같은 데이터/설정의 실행 결과가 캐시에 있으면 그대로 복원
+        run_key = None
+        if self.result_cache is not None and self._is_fresh():
+            run_key = self.result_cache.run_key(frames, config)
+            payload = self.result_cache.load_run(run_key)
+            if payload is not None:
+                self._restore_run(payload)
+                self.ledger.flush()
+                print(f"\n⚡ 캐시된 결과 사용 (거래: {len(self.ledger)}건)")
+                return
+
+        signals = self.detect_signals_cached(frames)
+
+        # 2단계: 자본 배분/청산은 거래일 순서로 순차 처리
+        print(f"\n📊 시뮬레이션 시작 ({len(frames)}종목)...")
+        trade_count = self.simulate_portfolio(frames, signals, market, patterns)
+        if run_key is not None:
+            self.result_cache.save_run(
+                run_key, self.ledger.to_frame(), self._equity, self._equity_tz, self.capital
+            )
+        self.ledger.flush()
+        print(f"   ✅ 완료 (거래: {trade_count}건)")
+
+    def _run_with_checkpoint(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        market: str,
+        patterns: List[str],
+        config: Dict,
+        checkpoint_path: str
+    ):
+        """체크포인트 이후만 이어서 실행 (불가능하면 처음부터) 후 새 체크포인트 저장"""
+        # 종료일은 실행마다 늘어나므로 비교에서 제외
+        config_json = json.dumps({k: v for k, v in config.items() if k != 'end_date'}, sort_keys=True, default=str)
+
+        cutoff = None
+        if self._is_fresh():
+            state = load_checkpoint(checkpoint_path)
+            if state is not None:
+                cutoff = self._resume(state, frames, config_json)
+                if cutoff is None:
+                    print("   ♻️  체크포인트 이후 과거 데이터/설정 변경 - 처음부터 실행")
+
+        if cutoff is None:
+            signals = self.detect_signals_cached(frames)
+            print(f"\n📊 시뮬레이션 시작 ({len(frames)}종목)...")
+            trade_count = self.simulate_portfolio(frames, signals, market, patterns, liquidate=False)
+        else:
+            signals = self._tail_signals(frames, cutoff)
+            print(f"\n🔁 체크포인트 이후 이어서 실행 ({len(signals)}종목)...")
+            # 체크포인트 평가일 다음 거래일부터
+            start = pd.Timestamp(cutoff + 1)
+            if self._equity_tz is not None:
+                start = start.tz_localize('UTC')
+            trade_count = self.simulate_portfolio(frames, signals, market, patterns, start=start, liquidate=False)
+
+        # 새 거래일이 있었으면 정리 직전 상태를 저장한 뒤 마지막 거래일 정리
+        if self._equity['date'] and (cutoff is None or self._equity['date'][-1] > cutoff):
+            if save_checkpoint(checkpoint_path, self._checkpoint_state(frames, config_json)):
+                print(f"   💾 체크포인트 저장: {checkpoint_path}")
+        trade_count += self.close_out(frames, list(frames))
+
+        self.ledger.flush()
+        print(f"   ✅ 완료 (거래: {trade_count}건)")
 
     # ========================================
     # 성과 분석
     # ========================================
 
     def calculate_performance(self) -> Dict | None:
-        """성과 지표 계산"""
-        if not self.trade_history:
+        """성과 지표 계산 (거래 내역 열 배열로 직접 계산)"""
+        if not len(self.ledger):
             return None
 
-        df_trades = pd.DataFrame(self.trade_history)
+        columns = self.ledger.columns('pattern', 'profit', 'profit_pct', 'holding_days')
+        profit = columns['profit']
+        profit_pct = columns['profit_pct']
+        wins = profit > 0
+        losses = profit < 0
 
-        total_trades = len(df_trades)
-        winning_trades = len(df_trades[df_trades['profit'] > 0])
-        losing_trades = len(df_trades[df_trades['profit'] < 0])
+        total_trades = len(profit)
+        winning_trades = int(wins.sum())
+        losing_trades = int(losses.sum())
         win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
 
-        total_profit = df_trades['profit'].sum()
+        total_profit = profit.sum()
         total_return_pct = (total_profit / self.initial_capital) * 100
-        final_capital = self.capital + sum(p['cost'] for p in self.positions)
+        final_capital = self.capital + self.market_value()
 
         # 연간 수익률 (CAGR)
         annualized_return = 0
@@ -348,17 +912,23 @@ class BacktestEngine:
             except ValueError:
                 pass
 
-        avg_profit = df_trades[df_trades['profit'] > 0]['profit_pct'].mean() if winning_trades > 0 else 0
-        avg_loss = df_trades[df_trades['profit'] < 0]['profit_pct'].mean() if losing_trades > 0 else 0
-        max_profit = df_trades['profit_pct'].max()
-        max_loss = df_trades['profit_pct'].min()
-        avg_holding_days = df_trades['holding_days'].mean()
-
-        pattern_stats = df_trades.groupby('pattern').agg({
-            'profit_pct': ['count', 'mean', lambda x: (x > 0).sum() / len(x) * 100]
-        }).round(2)
+        avg_profit = profit_pct[wins].mean() if winning_trades > 0 else 0
+        avg_loss = profit_pct[losses].mean() if losing_trades > 0 else 0
+        max_profit = profit_pct.max()
+        max_loss = profit_pct.min()
+        avg_holding_days = columns['holding_days'].mean()
+
+        # 패턴별 거래 수 / 평균 수익률 / 승률
+        patterns, codes = np.unique(columns['pattern'].astype(str), return_inverse=True)
+        counts = np.bincount(codes, minlength=len(patterns))
+        pattern_stats = pd.DataFrame({
+            'count': counts,
+            'mean': np.bincount(codes, weights=profit_pct, minlength=len(patterns)) / counts,
+            'win_rate': np.bincount(codes, weights=profit_pct > 0, minlength=len(patterns)) / counts * 100
+        }, index=pd.Index(patterns, name='pattern')).round(2)
 
         return {
+            **compute_risk_metrics(self.equity_curve),
             'total_trades': total_trades,
             'winning_trades': winning_trades,
             'losing_trades': losing_trades,
@@ -373,8 +943,7 @@ class BacktestEngine:
             'max_profit': max_profit,
             'max_loss': max_loss,
             'avg_holding_days': avg_holding_days,
-            'pattern_stats': pattern_stats,
-            'trade_df': df_trades
+            'pattern_stats': pattern_stats
         }
 
     def print_performance_report(self):
@@ -408,38 +977,97 @@ class BacktestEngine:
         print(f"   최대 수익:    {perf['max_profit']:>15.2f}%")
         print(f"   최대 손실:    {perf['max_loss']:>15.2f}%")
 
+        print(f"\n⚠️  리스크")
+        print(f"   최대 낙폭:    {perf['max_drawdown']:>15.2f}%")
+        print(f"   낙폭 기간:    {perf['max_drawdown_days']:>15}일")
+        print(f"   샤프 비율:    {perf['sharpe']:>15.2f}")
+        print(f"   소르티노:     {perf['sortino']:>15.2f}")
+        print(f"   투자 비중:    {perf['exposure']:>15.2f}%")
+        print(f"   연간 회전율:  {perf['turnover']:>15.2f}배")
+
         print(f"\n⏱️  보유 기간")
         print(f"   평균:         {perf['avg_holding_days']:>15.1f}일")
 
         print(f"\n📊 패턴별 성과")
         print(f"{'패턴':<12} {'거래수':>8} {'평균수익':>10} {'승률':>8}")
         print(f"{'-' * 40}")
-        for pattern, stats in perf['pattern_stats'].iterrows():
-            count = int(stats['profit_pct']['count'])
-            avg_return = stats['profit_pct']['mean']
-            pattern_win_rate = stats['profit_pct']['<lambda_0>']
-            print(f"{pattern:<12} {count:>8}건 {avg_return:>9.2f}% {pattern_win_rate:>7.1f}%")
+        stats = perf['pattern_stats']
+        for pattern, count, avg_return, pattern_win_rate in zip(
+            stats.index, stats['count'], stats['mean'], stats['win_rate']
+        ):
+            print(f"{pattern:<12} {int(count):>8}건 {avg_return:>9.2f}% {pattern_win_rate:>7.1f}%")
 
         print(f"\n{'=' * 60}")
 
         # 최근 거래 내역
         print(f"\n📋 최근 거래 내역 (최근 10건)")
         print(f"{'-' * 60}")
-        recent_trades = perf['trade_df'].tail(10)
-        for _, trade in recent_trades.iterrows():
-            profit_sign = "📈" if trade['profit'] > 0 else "📉"
-            print(f"{profit_sign} {trade['ticker']:<8} {trade['pattern']:<10} "
-                  f"{trade['entry_date'].strftime('%Y-%m-%d')} → "
-                  f"{trade['exit_date'].strftime('%Y-%m-%d')} "
-                  f"({trade['holding_days']:>2}일) "
-                  f"{trade['profit_pct']:>7.2f}% "
-                  f"[{trade['reason']}]")
+        for trade in self.ledger.tail(10).itertuples(index=False):
+            profit_sign = "📈" if trade.profit > 0 else "📉"
+            print(f"{profit_sign} {trade.ticker:<8} {trade.pattern:<10} "
+                  f"{trade.entry_date.strftime('%Y-%m-%d')} → "
+                  f"{trade.exit_date.strftime('%Y-%m-%d')} "
+                  f"({trade.holding_days:>2}일) "
+                  f"{trade.profit_pct:>7.2f}% "
+                  f"[{trade.reason}]")
 
         print(f"{'=' * 60}\n")
 
     def save_results(self, filename: str = "backtest_results.csv"):
-        """결과를 CSV 파일로 저장"""
-        if self.trade_history:
-            df = pd.DataFrame(self.trade_history)
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            print(f"💾 결과 저장: {filename}")
\ No newline at end of file
+        """결과를 CSV 파일로 저장 (일별 평가금액은 *_equity.csv)"""
+        if len(self.ledger):
+            self.ledger.to_frame().to_csv(filename, index=False, encoding='utf-8-sig')
+            print(f"💾 결과 저장: {filename}")
+
+        if self._equity['date']:
+            root, ext = os.path.splitext(filename)
+            equity_file = f"{root}_equity{ext or '.csv'}"
+            self.equity_curve.to_csv(equity_file, encoding='utf-8-sig')
+            print(f"💾 평가금액 저장: {equity_file}")
+
+
+def _series_signals(df: pd.DataFrame, settings: PatternSettings, features: FeatureSet) -> Dict[str, np.ndarray]:
+    """단일 종목 전체 구간 패턴 신호 (세 패턴이 지표 공유)"""
+    cup_signals, _ = detect_cup_and_handle_series(
+        df, settings.cup_depth_min, settings.cup_depth_max, settings.handle_depth_max,
+        features=features
+    )
+    pivot_signals, _ = detect_pivot_breakout_series(
+        df, settings.volume_surge_min, settings.breakout_max,
+        features=features
+    )
+    base_signals, _ = detect_base_breakout_series(
+        df, settings.base_volatility_max, settings.base_volume_surge_min, settings.base_breakout_max,
+        features=features
+    )
+    return {'cup': cup_signals, 'pivot': pivot_signals, 'base': base_signals}
+
+
+def _frame_signals(
+    frames: Dict[str, pd.DataFrame],
+    settings: PatternSettings,
+    feature_cache: FeatureCache
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """다중 종목 패턴 신호 (패널 연산 + 거래일 누락 종목은 종목별 계산, split_gapped 참고)"""
+    tickers = [ticker for ticker, df in frames.items() if df is not None and not df.empty]
+    contiguous, gapped = split_gapped(frames)
+
+    signals = {}
+    if contiguous:
+        panel_tickers, dates, close, volume = build_panel(contiguous)
+        features = feature_cache.get_panel(panel_tickers, dates, close, volume)
+        panel = detect_breakouts_panel(close, volume, settings, features=features)
+        for row, ticker in enumerate(panel_tickers):
+            positions = dates.get_indexer(frames[ticker].index)
+            signals[ticker] = {key: matrix[row, positions] for key, (matrix, _) in panel.items()}
+
+    for ticker in gapped:
+        df = frames[ticker]
+        signals[ticker] = _series_signals(df, settings, feature_cache.get(ticker, df))
+
+    return {ticker: signals[ticker] for ticker in tickers}
+
+
+def _signals_worker(frames: Dict[str, pd.DataFrame], settings: PatternSettings) -> Dict[str, Dict[str, np.ndarray]]:
+    """프로세스 풀 작업: 종목 묶음 신호 계산 (작업 프로세스의 지표 캐시 사용)"""
+    return _frame_signals(frames, settings, get_feature_cache())
@@ -0,0 +1,213 @@
+"""
+청산 규칙 그리드 분석
+- 같은 진입 집합에 대해 손절/익절/보유기간 조합을 한 번에 평가
+- 진입마다 이후 저가/종가 경로 행렬을 만들고, 규칙별 최초 도달 봉을 배열 연산으로 계산
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# 경로 패딩용 경과일 (어떤 보유기간보다도 큼)
+_NO_DAY = np.iinfo(np.int64).max
+
+
+def entries_from_trades(trades: List[Dict] | pd.DataFrame) -> pd.DataFrame:
+    """
+    거래 내역에서 진입 집합 추출
+
+    Args:
+        trades: BacktestEngine.ledger.to_frame() 결과 또는 trade_history
+
+    Returns:
+        ticker, entry_date, entry_price 컬럼의 데이터프레임
+    """
+    df = pd.DataFrame(trades)
+    if df.empty:
+        return pd.DataFrame(columns=['ticker', 'entry_date', 'entry_price'])
+    return df[['ticker', 'entry_date', 'entry_price']].reset_index(drop=True)
+
+
+def build_forward_paths(
+    frames: Dict[str, pd.DataFrame],
+    entries: pd.DataFrame,
+    max_bars: int
+) -> Dict[str, np.ndarray]:
+    """
+    진입 다음 봉부터 max_bars개 봉의 경로 행렬
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임}
+        entries: ticker, entry_date, entry_price 컬럼의 진입 집합 (인덱스와 무관하게 행 순서대로 배치)
+        max_bars: 경로 길이 (가장 긴 보유기간 이상)
+
+    Returns:
+        {'entry': 진입가 (n), 'low' / 'close': 저가/종가 (n × max_bars, 데이터가 없으면 NaN),
+         'days': 진입일로부터 경과일 (n × max_bars), 'length': 종목별 유효 봉 수 (n)}
+    """
+    # 행렬 행 = 진입 위치 (필터링/정렬된 진입 집합의 인덱스 레이블을 쓰지 않음)
+    entries = entries.reset_index(drop=True)
+    n = len(entries)
+    low = np.full((n, max_bars), np.nan)
+    close = np.full((n, max_bars), np.nan)
+    days = np.full((n, max_bars), _NO_DAY, dtype=np.int64)
+    length = np.zeros(n, dtype=np.int64)
+    entry = entries['entry_price'].to_numpy(dtype=float)
+
+    for ticker, group in entries.groupby('ticker', sort=False):
+        df = frames.get(ticker)
+        if df is None:
+            continue
+        lows = df['Low'].to_numpy(dtype=float)
+        closes = df['Close'].to_numpy(dtype=float)
+        index_ns = df.index.asi8
+        starts = df.index.get_indexer(pd.DatetimeIndex(group['entry_date'])) + 1
+
+        for row, start, entry_date in zip(group.index, starts, group['entry_date']):
+            if start <= 0:
+                continue
+            stop = min(start + max_bars, len(df))
+            count = stop - start
+            low[row, :count] = lows[start:stop]
+            close[row, :count] = closes[start:stop]
+            days[row, :count] = (index_ns[start:stop] - pd.Timestamp(entry_date).value) // 86_400_000_000_000
+            length[row] = count
+
+    return {'entry': entry, 'low': low, 'close': close, 'days': days, 'length': length}
+
+
+def _first_hit(hits: np.ndarray) -> np.ndarray:
+    """마지막 축에서 처음 True인 위치 (없으면 축 길이)"""
+    return np.where(hits.any(axis=-1), hits.argmax(axis=-1), hits.shape[-1])
+
+
+def evaluate_exit_grid(
+    frames: Dict[str, pd.DataFrame],
+    entries: pd.DataFrame,
+    stop_loss_pcts: Sequence[float],
+    take_profit_pcts: Sequence[float],
+    holding_days: Sequence[int]
+) -> pd.DataFrame:
+    """
+    손절 × 익절 × 보유기간 조합별 진입 집합 성과
+
+    check_exit_conditions와 같은 규칙을 적용한다.
+    진입 다음 봉부터 봉마다 손절(저가 ≤ 손절가, 손절가 체결) → 보유기간 만료(경과일 ≥ 기간, 종가) →
+    익절(종가 ≥ 목표가, 종가) 순으로 확인하고, 데이터 끝까지 청산되지 않으면 마지막 종가로 정리한다.
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임}
+        entries: ticker, entry_date, entry_price 컬럼의 진입 집합
+        stop_loss_pcts: 손절 기준 목록 (%, 음수)
+        take_profit_pcts: 익절 기준 목록 (%)
+        holding_days: 최대 보유 기간 목록 (일)
+
+    Returns:
+        조합별 거래 수, 승률, 기대수익(평균 수익률), 평균 수익/손실, 평균 보유일 테이블
+    """
+    stops = np.asarray(stop_loss_pcts, dtype=float)
+    targets = np.asarray(take_profit_pcts, dtype=float)
+    horizons = np.asarray(holding_days, dtype=np.int64)
+
+    paths = build_forward_paths(frames, entries, int(horizons.max()))
+    entry, low, close, days, length = (paths[k] for k in ('entry', 'low', 'close', 'days', 'length'))
+    n, max_bars = close.shape
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        low_ratio = low / entry[:, None]
+        close_ratio = close / entry[:, None]
+
+    # 규칙 축별 최초 도달 봉 (n × 규칙 수)
+    stop_levels = 1 + stops / 100
+    target_levels = 1 + targets / 100
+    stop_idx = _first_hit(low_ratio[:, None, :] <= stop_levels[None, :, None])
+    target_idx = _first_hit(close_ratio[:, None, :] >= target_levels[None, :, None])
+    expiry_idx = _first_hit(days[:, None, :] >= horizons[None, :, None])
+
+    # (n × 손절 × 익절 × 보유기간) 청산 봉
+    s = stop_idx[:, :, None, None]
+    t = target_idx[:, None, :, None]
+    h = expiry_idx[:, None, None, :]
+    exit_idx = np.minimum(np.minimum(s, t), h)
+
+    # 데이터 끝까지 미청산이면 마지막 봉 종가로 정리 (다음 봉이 없으면 진입가)
+    last = np.maximum(length - 1, 0)
+    ended = exit_idx >= length[:, None, None, None]
+    exit_bar = np.where(ended, last[:, None, None, None], exit_idx)
+    exit_bar = np.minimum(exit_bar, max_bars - 1)
+
+    rows = np.arange(n)[:, None, None, None]
+    exit_ratio = close_ratio[rows, exit_bar]
+    exit_ratio = np.where(ended & (length == 0)[:, None, None, None], 1.0, exit_ratio)
+    is_stop = ~ended & (s == exit_idx)
+    exit_ratio = np.where(is_stop, stop_levels[None, :, None, None], exit_ratio)
+
+    returns = (exit_ratio - 1) * 100
+    held = np.where(length[:, None, None, None] > 0, days[rows, exit_bar], 0).astype(float)
+
+    wins = returns > 0
+    losses = returns < 0
+    count = max(n, 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        win_rate = wins.sum(axis=0) / count * 100
+        expectancy = returns.sum(axis=0) / count
+        avg_win = np.where(wins, returns, 0).sum(axis=0) / wins.sum(axis=0)
+        avg_loss = np.where(losses, returns, 0).sum(axis=0) / losses.sum(axis=0)
+        avg_holding = held.sum(axis=0) / count
+
+    grid = np.meshgrid(stops, targets, horizons, indexing='ij')
+    return pd.DataFrame({
+        'stop_loss_pct': grid[0].ravel(),
+        'take_profit_pct': grid[1].ravel(),
+        'max_holding_days': grid[2].ravel(),
+        'trades': n,
+        'win_rate': win_rate.ravel(),
+        'expectancy': expectancy.ravel(),
+        'avg_profit': np.nan_to_num(avg_win.ravel()),
+        'avg_loss': np.nan_to_num(avg_loss.ravel()),
+        'avg_holding_days': avg_holding.ravel()
+    })
+
+
+def heat_grid(results: pd.DataFrame, value: str = 'expectancy', max_holding_days: int | None = None) -> pd.DataFrame:
+    """
+    보유기간 하나에 대한 손절 × 익절 표
+
+    Args:
+        results: evaluate_exit_grid 결과
+        value: 표에 채울 지표 ('expectancy', 'win_rate' 등)
+        max_holding_days: 보유기간 (None이면 기대수익이 가장 높은 조합의 보유기간)
+
+    Returns:
+        행: 손절, 열: 익절인 데이터프레임
+    """
+    if max_holding_days is None:
+        max_holding_days = int(results.loc[results['expectancy'].idxmax(), 'max_holding_days'])
+    subset = results[results['max_holding_days'] == max_holding_days]
+    return subset.pivot(index='stop_loss_pct', columns='take_profit_pct', values=value)
+
+
+def print_exit_grid_report(results: pd.DataFrame, max_holding_days: int | None = None):
+    """청산 규칙 그리드 출력"""
+    if results.empty or results['trades'].iloc[0] == 0:
+        print("\n⚠️  분석할 진입 내역이 없습니다.")
+        return
+
+    best = results.loc[results['expectancy'].idxmax()]
+    if max_holding_days is None:
+        max_holding_days = int(best['max_holding_days'])
+
+    print(f"\n{'=' * 60}")
+    print(f"🎯 청산 규칙 분석 (진입 {int(best['trades'])}건)")
+    print(f"{'=' * 60}")
+    print(f"최고 기대수익: 손절 {best['stop_loss_pct']:.1f}% / 익절 {best['take_profit_pct']:.1f}% / "
+          f"보유 {int(best['max_holding_days'])}일 → {best['expectancy']:.2f}% (승률 {best['win_rate']:.1f}%)")
+
+    for value, title in (('expectancy', '기대수익 (%)'), ('win_rate', '승률 (%)')):
+        table = heat_grid(results, value, max_holding_days)
+        print(f"\n📊 {title} - 보유 {max_holding_days}일 (행: 손절, 열: 익절)")
+        print(f"{'':>8}" + ''.join(f"{c:>9.1f}" for c in table.columns))
+        for stop, row in table.iterrows():
+            print(f"{stop:>8.1f}" + ''.join(f"{v:>9.2f}" for v in row))
+
+    print(f"{'=' * 60}\n")
@@ -0,0 +1,334 @@
+"""
+열 단위 거래 내역 저장소
+- 거래마다 딕셔너리를 만들지 않고 열별 배열에 추가 (묶음 단위로 확장)
+- 문자열 열은 코드 + 레이블, 일시는 int64 나노초로 보관
+- 선택적으로 일정 건수마다 CSV/Parquet 파일로 내보내고 메모리에서 비움
+"""
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# trade_history 딕셔너리와 같은 열 순서
+COLUMNS = (
+    'ticker', 'market', 'pattern', 'entry_date', 'entry_price', 'exit_date', 'exit_price',
+    'shares', 'cost', 'proceeds', 'profit', 'profit_pct', 'holding_days', 'reason'
+)
+LABEL_COLUMNS = ('ticker', 'market', 'pattern', 'reason')
+DATE_COLUMNS = ('entry_date', 'exit_date')
+INT_COLUMNS = ('shares', 'holding_days')
+
+
+class TradeLedger:
+    """열 단위 추가 전용 거래 내역"""
+
+    def __init__(
+        self,
+        chunk_size: int = 4096,
+        stream_path: str | None = None,
+        flush_rows: int = 100_000
+    ):
+        """
+        Args:
+            chunk_size: 배열 확장 단위 (건)
+            stream_path: 내보낼 경로 (.csv 파일 또는 .parquet 디렉토리, None이면 메모리에만 보관)
+                - 같은 경로의 기존 파일은 생성 시점이 아니라 첫 거래를 내보낼 때 덮어씀
+            flush_rows: 메모리에 모이면 파일로 내보낼 건수 (stream_path가 있을 때만)
+        """
+        self.chunk_size = chunk_size
+        self.stream_path = stream_path
+        self.flush_rows = flush_rows
+        self._reset_memory()
+        self._labels: Dict[str, List[str]] = {name: [] for name in LABEL_COLUMNS}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in LABEL_COLUMNS}
+        self._tz = None
+        self._spilled = 0
+
+    def _reset_memory(self):
+        self._size = 0
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name in COLUMNS:
+            if name in LABEL_COLUMNS:
+                dtype = np.int32
+            elif name in DATE_COLUMNS or name in INT_COLUMNS:
+                dtype = np.int64
+            else:
+                dtype = np.float64
+            self._arrays[name] = np.empty(self.chunk_size, dtype=dtype)
+
+    def _grow(self):
+        capacity = len(self._arrays['profit']) + self.chunk_size
+        for name, values in self._arrays.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._arrays[name] = grown
+
+    def _code(self, column: str, label: str) -> int:
+        codes = self._codes[column]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(self._labels[column])
+            self._labels[column].append(label)
+        return code
+
+    def _nanoseconds(self, value) -> int:
+        value = value if isinstance(value, pd.Timestamp) else pd.Timestamp(value)
+        if self._tz is None and value.tz is not None:
+            self._tz = value.tz
+        return value.value
+
+    def append(
+        self,
+        ticker: str,
+        market: str,
+        pattern: str,
+        entry_date,
+        entry_price: float,
+        exit_date,
+        exit_price: float,
+        shares: int,
+        cost: float,
+        proceeds: float,
+        profit: float,
+        profit_pct: float,
+        holding_days: int,
+        reason: str
+    ):
+        """거래 한 건 추가"""
+        if self._size == len(self._arrays['profit']):
+            self._grow()
+
+        i = self._size
+        arrays = self._arrays
+        arrays['ticker'][i] = self._code('ticker', ticker)
+        arrays['market'][i] = self._code('market', market)
+        arrays['pattern'][i] = self._code('pattern', pattern)
+        arrays['reason'][i] = self._code('reason', reason)
+        arrays['entry_date'][i] = self._nanoseconds(entry_date)
+        arrays['exit_date'][i] = self._nanoseconds(exit_date)
+        arrays['entry_price'][i] = entry_price
+        arrays['exit_price'][i] = exit_price
+        arrays['shares'][i] = shares
+        arrays['cost'][i] = cost
+        arrays['proceeds'][i] = proceeds
+        arrays['profit'][i] = profit
+        arrays['profit_pct'][i] = profit_pct
+        arrays['holding_days'][i] = holding_days
+        self._size += 1
+
+        if self.stream_path and self._size >= self.flush_rows:
+            self.flush()
+
+    def extend(self, trades: pd.DataFrame):
+        """
+        거래 내역 일괄 추가 (to_frame 결과와 같은 열)
+
+        Args:
+            trades: 거래 내역 데이터프레임
+        """
+        count = len(trades)
+        if not count:
+            return
+        while self._size + count > len(self._arrays['profit']):
+            self._grow()
+
+        start, stop = self._size, self._size + count
+        for name in COLUMNS:
+            target = self._arrays[name]
+            if name in LABEL_COLUMNS:
+                target[start:stop] = [self._code(name, label) for label in trades[name]]
+            elif name in DATE_COLUMNS:
+                dates = pd.DatetimeIndex(trades[name])
+                if self._tz is None and dates.tz is not None:
+                    self._tz = dates.tz
+                target[start:stop] = dates.as_unit('ns').asi8
+            else:
+                target[start:stop] = trades[name].to_numpy()
+        self._size = stop
+
+        if self.stream_path and self._size >= self.flush_rows:
+            self.flush()
+
+    def __len__(self) -> int:
+        return self._spilled + self._size
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def _dates(self, values: np.ndarray) -> pd.DatetimeIndex:
+        if self._tz is None:
+            return pd.DatetimeIndex(values.astype('datetime64[ns]'))
+        return pd.DatetimeIndex(values.astype('datetime64[ns]')).tz_localize('UTC').tz_convert(self._tz)
+
+    def _memory_column(self, name: str):
+        values = self._arrays[name][:self._size]
+        if name in LABEL_COLUMNS:
+            return np.array(self._labels[name], dtype=object)[values] if self._size else np.array([], dtype=object)
+        if name in DATE_COLUMNS:
+            return self._dates(values)
+        return values.copy()
+
+    def _memory_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({name: self._memory_column(name) for name in COLUMNS})
+
+    def _read_spilled(self) -> pd.DataFrame | None:
+        if not self._spilled:
+            return None
+        if self._is_parquet():
+            return pd.read_parquet(self.stream_path)
+
+        df = pd.read_csv(self.stream_path, encoding='utf-8-sig', dtype={name: str for name in LABEL_COLUMNS})
+        for name in DATE_COLUMNS:
+            dates = pd.to_datetime(df[name], utc=self._tz is not None)
+            df[name] = dates.dt.tz_convert(self._tz) if self._tz is not None else dates
+        return df
+
+    def columns(self, *names: str) -> Dict[str, np.ndarray | pd.DatetimeIndex]:
+        """
+        열 조회 (파일로 내보낸 부분 포함)
+
+        Args:
+            names: 열 이름
+
+        Returns:
+            {열 이름: 값} - 숫자 열은 numpy 배열, 일시 열은 DatetimeIndex, 문자열 열은 object 배열
+        """
+        spilled = self._read_spilled()
+        result = {}
+        for name in names:
+            current = self._memory_column(name)
+            if spilled is None:
+                result[name] = current
+            elif name in DATE_COLUMNS:
+                result[name] = pd.DatetimeIndex(spilled[name]).append(current)
+            else:
+                result[name] = np.concatenate([spilled[name].to_numpy(), current])
+        return result
+
+    def to_frame(self) -> pd.DataFrame:
+        """전체 거래 내역 데이터프레임 (trade_history를 DataFrame으로 만든 것과 같은 열)"""
+        current = self._memory_frame()
+        spilled = self._read_spilled()
+        if spilled is None:
+            return current
+        return pd.concat([spilled, current], ignore_index=True)
+
+    def to_records(self) -> List[Dict]:
+        """전체 거래 내역 딕셔너리 리스트 (기존 trade_history 형식)"""
+        if not len(self):
+            return []
+        return self.to_frame().to_dict('records')
+
+    def tail(self, n: int = 10) -> pd.DataFrame:
+        """최근 n건 (메모리에 남은 거래 기준, 부족하면 파일에서 보충)"""
+        if self._size >= n or not self._spilled:
+            start = max(self._size - n, 0)
+            return pd.DataFrame({
+                name: self._memory_column(name)[start:] for name in COLUMNS
+            }).reset_index(drop=True)
+        return self.to_frame().tail(n).reset_index(drop=True)
+
+    # ========================================
+    # 파일 내보내기
+    # ========================================
+
+    def flush(self):
+        """메모리의 거래를 파일로 내보내고 비움"""
+        if not self.stream_path or not self._size:
+            return
+
+        if not self._spilled:
+            # 이번 실행의 첫 내보내기 - 이전 실행이 남긴 파일은 이때 비움
+            self._remove_stream()
+
+        df = self._memory_frame()
+        directory = os.path.dirname(self.stream_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self._is_parquet():
+            # Parquet은 이어 쓰기가 안 되므로 디렉토리에 묶음 파일로 저장
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError("Parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow") from e
+            os.makedirs(self.stream_path, exist_ok=True)
+            part = os.path.join(self.stream_path, f"part-{self._spilled:012d}.parquet")
+            df.to_parquet(part, index=False)
+        else:
+            df.to_csv(
+                self.stream_path,
+                mode='a',
+                header=not self._spilled,
+                index=False,
+                encoding='utf-8-sig' if not self._spilled else 'utf-8'
+            )
+
+        self._spilled += self._size
+        self._reset_memory()
+
+    def close(self):
+        """남은 거래를 파일로 내보내기"""
+        self.flush()
+
+    def clear(self):
+        """거래 내역 비우기 (이 장부가 내보낸 파일 포함)"""
+        if self.stream_path and self._spilled:
+            self._remove_stream()
+        self._reset_memory()
+        self._spilled = 0
+
+    def _is_parquet(self) -> bool:
+        return self.stream_path.endswith('.parquet')
+
+    def _remove_stream(self):
+        if os.path.isdir(self.stream_path):
+            for name in os.listdir(self.stream_path):
+                if name.startswith('part-') and name.endswith('.parquet'):
+                    os.remove(os.path.join(self.stream_path, name))
+        elif os.path.exists(self.stream_path):
+            os.remove(self.stream_path)
+
+
+def trades_to_arrays(trades: pd.DataFrame, prefix: str = 'trade_') -> Dict[str, np.ndarray]:
+    """
+    거래 내역을 npz 저장용 배열로 변환 (pickle 없이 저장 가능한 dtype)
+
+    Args:
+        trades: 거래 내역 데이터프레임 (TradeLedger.to_frame)
+        prefix: 배열 이름 접두어
+
+    Returns:
+        {접두어 + 열 이름: 배열, 접두어 + 'tz': 일시 tz 문자열}
+    """
+    arrays = {}
+    tz = ''
+    for name in COLUMNS:
+        values = trades[name] if name in trades else pd.Series(dtype=float)
+        if name in DATE_COLUMNS:
+            dates = pd.DatetimeIndex(values)
+            tz = str(dates.tz) if dates.tz is not None else tz
+            arrays[f'{prefix}{name}'] = dates.as_unit('ns').asi8
+        elif name in LABEL_COLUMNS:
+            arrays[f'{prefix}{name}'] = np.asarray(values, dtype=str)
+        else:
+            arrays[f'{prefix}{name}'] = np.asarray(values)
+    arrays[f'{prefix}tz'] = np.array(tz)
+    return arrays
+
+
+def trades_from_arrays(arrays: Dict[str, np.ndarray], prefix: str = 'trade_') -> pd.DataFrame:
+    """trades_to_arrays 결과를 거래 내역 데이터프레임으로 복원"""
+    tz = str(arrays[f'{prefix}tz']) or None
+    trades = {}
+    for name in COLUMNS:
+        values = arrays[f'{prefix}{name}']
+        if name in DATE_COLUMNS:
+            values = pd.DatetimeIndex(values.astype('datetime64[ns]'))
+            values = values.tz_localize('UTC').tz_convert(tz) if tz else values
+        elif name in LABEL_COLUMNS:
+            values = values.astype(object)
+        trades[name] = values
+    return pd.DataFrame(trades)
@@ -0,0 +1,117 @@
+"""
+일별 평가금액 기반 리스크/성과 지표
+- 낙폭, 낙폭 지속 기간, 샤프/소르티노, 투자 비중, 회전율
+- 모든 지표는 평가금액 배열에 대한 배열 연산으로 계산
+"""
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# 연율화 기준 거래일 수
+TRADING_DAYS = 252
+
+
+def drawdown(equity: np.ndarray) -> np.ndarray:
+    """
+    고점 대비 낙폭 (%)
+
+    Args:
+        equity: 일별 평가금액
+
+    Returns:
+        같은 길이의 낙폭 배열 (0 이하)
+    """
+    equity = np.asarray(equity, dtype=float)
+    peak = np.maximum.accumulate(equity)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (equity / peak - 1) * 100
+
+
+def max_drawdown_duration(equity: np.ndarray, dates: pd.DatetimeIndex) -> int:
+    """
+    최장 낙폭 지속 기간 (직전 고점일부터의 달력 일수)
+
+    Args:
+        equity: 일별 평가금액
+        dates: 평가 일자
+
+    Returns:
+        고점을 회복하지 못한 최장 일수
+    """
+    equity = np.asarray(equity, dtype=float)
+    if len(equity) == 0:
+        return 0
+    at_peak = equity >= np.maximum.accumulate(equity)
+    peak_position = np.maximum.accumulate(np.where(at_peak, np.arange(len(equity)), 0))
+    days = (dates.asi8 - dates.asi8[peak_position]) // 86_400_000_000_000
+    return int(days.max())
+
+
+def daily_returns(equity: np.ndarray) -> np.ndarray:
+    """일별 수익률 (첫날 제외)"""
+    equity = np.asarray(equity, dtype=float)
+    if len(equity) < 2:
+        return np.empty(0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return equity[1:] / equity[:-1] - 1
+
+
+def sharpe_ratio(returns: np.ndarray, periods: int = TRADING_DAYS) -> float:
+    """연율화 샤프 비율 (무위험 수익률 0)"""
+    if len(returns) < 2:
+        return 0.0
+    std = returns.std(ddof=1)
+    if std == 0 or np.isnan(std):
+        return 0.0
+    return float(returns.mean() / std * np.sqrt(periods))
+
+
+def sortino_ratio(returns: np.ndarray, periods: int = TRADING_DAYS) -> float:
+    """연율화 소르티노 비율 (하방 편차 기준)"""
+    if len(returns) < 2:
+        return 0.0
+    downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+    if downside == 0 or np.isnan(downside):
+        return 0.0
+    return float(returns.mean() / downside * np.sqrt(periods))
+
+
+def compute_risk_metrics(curve: pd.DataFrame) -> Dict:
+    """
+    평가금액 곡선의 리스크 지표
+
+    Args:
+        curve: equity, market_value, traded 열과 일자 인덱스를 가진 데이터프레임
+            (BacktestEngine.equity_curve)
+
+    Returns:
+        max_drawdown (%), max_drawdown_days (일), sharpe, sortino,
+        exposure (평균 투자 비중 %), turnover (연간 회전율, (매수+매도)/2 ÷ 평균 평가금액)
+    """
+    if curve is None or curve.empty:
+        return {
+            'max_drawdown': 0.0,
+            'max_drawdown_days': 0,
+            'sharpe': 0.0,
+            'sortino': 0.0,
+            'exposure': 0.0,
+            'turnover': 0.0
+        }
+
+    equity = curve['equity'].to_numpy(dtype=float)
+    returns = daily_returns(equity)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        exposure = np.nanmean(curve['market_value'].to_numpy(dtype=float) / equity) * 100
+
+    years = max(len(equity) / TRADING_DAYS, 1 / TRADING_DAYS)
+    turnover = curve['traded'].to_numpy(dtype=float).sum() / 2 / equity.mean() / years
+
+    return {
+        'max_drawdown': float(np.nanmin(drawdown(equity))),
+        'max_drawdown_days': max_drawdown_duration(equity, pd.DatetimeIndex(curve.index)),
+        'sharpe': sharpe_ratio(returns),
+        'sortino': sortino_ratio(returns),
+        'exposure': float(exposure),
+        'turnover': float(turnover)
+    }
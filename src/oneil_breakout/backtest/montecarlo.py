@@ -0,0 +1,170 @@
+"""
+거래 수익률 몬테카를로 분석
+- 백테스트 거래 수익률을 복원 추출(bootstrap) 또는 순서 섞기(permute)로 수천 개 경로 생성
+- 최대 포지션 수만큼의 거래를 한 회차로 묶어 포지션 크기 비율로 복리 계산
+- 모든 경로를 (시뮬레이션 × 회차) 행렬 한 번으로 계산
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def trade_returns(trades: List[Dict] | pd.DataFrame) -> np.ndarray:
+    """
+    거래 내역의 수익률 (진입일 순서, 소수)
+
+    Args:
+        trades: BacktestEngine.ledger.to_frame() 결과 또는 trade_history
+
+    Returns:
+        거래별 수익률 배열 (예: 0.05 = 5%)
+    """
+    df = pd.DataFrame(trades)
+    if df.empty:
+        return np.empty(0)
+    return df.sort_values('entry_date', kind='stable')['profit_pct'].to_numpy(dtype=float) / 100
+
+
+def simulate_equity_paths(
+    returns: np.ndarray,
+    initial_capital: float,
+    position_size_pct: float,
+    max_positions: int
+) -> np.ndarray:
+    """
+    거래 수익률 행렬의 복리 평가금액 경로
+
+    거래를 max_positions개씩 한 회차로 묶고, 회차마다 포지션당 회차 시작 평가금액의
+    position_size_pct만큼 투자한다고 본다 (전체 투자 비중은 100%를 넘지 않음).
+
+    Args:
+        returns: (시뮬레이션 × 거래) 수익률 행렬
+        initial_capital: 초기 자본
+        position_size_pct: 포지션 크기 (평가금액 대비 %)
+        max_positions: 최대 동시 포지션 수
+
+    Returns:
+        (시뮬레이션 × (회차 + 1)) 평가금액 행렬 (첫 열은 초기 자본)
+    """
+    returns = np.atleast_2d(np.asarray(returns, dtype=float))
+    simulations, count = returns.shape
+    slots = max(1, max_positions)
+    fraction = min(position_size_pct / 100, 1 / slots)
+
+    # 회차 단위로 자르기 위해 부족한 자리는 수익률 0으로 채움
+    rounds = -(-count // slots)
+    padded = np.zeros((simulations, rounds * slots))
+    padded[:, :count] = returns
+    growth = 1 + fraction * padded.reshape(simulations, rounds, slots).sum(axis=2)
+
+    equity = np.empty((simulations, rounds + 1))
+    equity[:, 0] = initial_capital
+    np.cumprod(growth, axis=1, out=equity[:, 1:])
+    equity[:, 1:] *= initial_capital
+    return equity
+
+
+def max_drawdowns(equity: np.ndarray) -> np.ndarray:
+    """경로별 최대 낙폭 (%)"""
+    peak = np.maximum.accumulate(equity, axis=1)
+    return ((equity / peak).min(axis=1) - 1) * 100
+
+
+def run_monte_carlo(
+    trades: List[Dict] | pd.DataFrame,
+    initial_capital: float,
+    position_size_pct: float = 20.0,
+    max_positions: int = 5,
+    years: float = 1.0,
+    simulations: int = 10_000,
+    method: str = 'bootstrap',
+    seed: int = 42,
+    percentiles: Sequence[float] = PERCENTILES
+) -> Dict | None:
+    """
+    거래 순서/구성에 따른 성과 분포
+
+    Args:
+        trades: BacktestEngine.ledger.to_frame() 결과 또는 trade_history
+        initial_capital: 초기 자본
+        position_size_pct: 포지션 크기 (평가금액 대비 %)
+        max_positions: 최대 동시 포지션 수
+        years: 백테스트 기간 (연, CAGR 계산용)
+        simulations: 시뮬레이션 수
+        method: 'bootstrap' (복원 추출) 또는 'permute' (순서만 섞기)
+        seed: 난수 시드
+        percentiles: 보고할 백분위수
+
+    Returns:
+        {'final_capital' / 'cagr' / 'max_drawdown': {백분위수: 값}, 'prob_loss': 손실 확률 (%),
+         'actual': 실제 거래 순서의 {'final_capital', 'cagr', 'max_drawdown'},
+         'bands': 회차별 평가금액 백분위수 데이터프레임, 'simulations', 'trades', 'method'}
+        (거래가 없으면 None)
+    """
+    returns = trade_returns(trades)
+    if len(returns) == 0:
+        return None
+    if method not in ('bootstrap', 'permute'):
+        raise ValueError(f"알 수 없는 방식: {method}")
+
+    rng = np.random.default_rng(seed)
+    if method == 'bootstrap':
+        sampled = returns[rng.integers(0, len(returns), size=(simulations, len(returns)))]
+    else:
+        sampled = rng.permuted(np.broadcast_to(returns, (simulations, len(returns))), axis=1)
+
+    equity = simulate_equity_paths(sampled, initial_capital, position_size_pct, max_positions)
+    actual = simulate_equity_paths(returns, initial_capital, position_size_pct, max_positions)
+
+    def summarize(paths: np.ndarray) -> Dict[str, np.ndarray]:
+        final = paths[:, -1]
+        return {
+            'final_capital': final,
+            'cagr': ((final / initial_capital) ** (1 / max(years, 1e-9)) - 1) * 100,
+            'max_drawdown': max_drawdowns(paths)
+        }
+
+    outcomes = summarize(equity)
+    levels = list(percentiles)
+    result = {
+        name: dict(zip(levels, np.percentile(values, levels).tolist()))
+        for name, values in outcomes.items()
+    }
+    result['prob_loss'] = float((outcomes['final_capital'] < initial_capital).mean() * 100)
+    result['actual'] = {name: float(values[0]) for name, values in summarize(actual).items()}
+    result['bands'] = pd.DataFrame(
+        np.percentile(equity, levels, axis=0).T,
+        columns=[f'p{level:g}' for level in levels]
+    ).rename_axis('round')
+    result['simulations'] = simulations
+    result['trades'] = len(returns)
+    result['method'] = method
+    return result
+
+
+def print_monte_carlo_report(result: Dict | None):
+    """몬테카를로 분포 출력"""
+    if result is None:
+        print("\n⚠️  분석할 거래 내역이 없습니다.")
+        return
+
+    levels = list(result['final_capital'])
+    method = '복원 추출' if result['method'] == 'bootstrap' else '순서 섞기'
+
+    print(f"\n{'=' * 60}")
+    print(f"🎲 몬테카를로 분석 ({result['simulations']:,}회, 거래 {result['trades']}건, {method})")
+    print(f"{'=' * 60}")
+    print(f"{'':<12}" + ''.join(f"{f'p{level:g}':>14}" for level in levels) + f"{'실제':>14}")
+    rows = (
+        ('최종 자본', 'final_capital', '{:>14,.0f}'),
+        ('CAGR (%)', 'cagr', '{:>14.2f}'),
+        ('MDD (%)', 'max_drawdown', '{:>14.2f}')
+    )
+    for title, key, fmt in rows:
+        values = [result[key][level] for level in levels] + [result['actual'][key]]
+        print(f"{title:<12}" + ''.join(fmt.format(v) for v in values))
+    print(f"\n손실 확률: {result['prob_loss']:.1f}%")
+    print(f"{'=' * 60}\n")
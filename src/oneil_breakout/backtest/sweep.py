@@ -0,0 +1,231 @@
+"""
+패턴/거래 설정 파라미터 스윕
+- 데이터는 한 번만 로드하고, 이동 구간 지표는 작업 프로세스마다 한 번만 계산
+- 패턴 설정이 같은 조합은 신호를 재사용하고 거래 설정만 바꿔 시뮬레이션
+"""
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields, replace
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PatternSettings, TradingSettings
+from .engine import BacktestEngine
+
+PATTERN_KEYS = tuple(f.name for f in fields(PatternSettings))
+TRADING_KEYS = tuple(f.name for f in fields(TradingSettings))
+
+# 조합별 결과 테이블에 남길 성과 지표
+METRIC_KEYS = (
+    'total_trades', 'win_rate', 'total_return_pct', 'annualized_return', 'final_capital',
+    'avg_profit', 'avg_loss', 'max_profit', 'max_loss', 'avg_holding_days',
+    'max_drawdown', 'sharpe', 'sortino', 'exposure'
+)
+
+# 작업 프로세스 공용 상태 (_init_worker에서 한 번 설정)
+_context: Dict = {}
+
+
+def parse_grid(specs: Sequence[str]) -> Dict[str, List]:
+    """
+    CLI 그리드 인자 파싱
+
+    Args:
+        specs: ["volume_surge_min=40,50,60", "stop_loss_pct=-6,-8"] 형식
+
+    Returns:
+        {설정 이름: 값 리스트} (설정 기본값의 타입으로 변환)
+    """
+    defaults = {**asdict(PatternSettings()), **asdict(TradingSettings())}
+    grid = {}
+    for spec in specs:
+        key, _, values = spec.partition('=')
+        key = key.strip()
+        if key not in defaults:
+            raise ValueError(f"알 수 없는 설정: {key}")
+        cast = type(defaults[key])
+        grid[key] = [cast(value) for value in values.split(',') if value.strip()]
+        if not grid[key]:
+            raise ValueError(f"값이 없는 설정: {key}")
+    return grid
+
+
+def build_combinations(
+    grid: Dict[str, Sequence],
+    samples: int | None = None,
+    seed: int = 42
+) -> List[Dict]:
+    """
+    그리드 전체 조합 또는 무작위 표본
+
+    Args:
+        grid: {설정 이름: 값 리스트}
+        samples: 표본 수 (None이거나 전체 조합 수 이상이면 전체 조합)
+        seed: 표본 추출 시드
+
+    Returns:
+        조합 리스트 [{설정 이름: 값}]
+    """
+    keys = list(grid)
+    combos = [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+    if samples is not None and samples < len(combos):
+        combos = random.Random(seed).sample(combos, samples)
+    return combos
+
+
+def _split(combo: Dict, base_pattern: PatternSettings, base_trading: TradingSettings):
+    """조합을 (패턴 설정, 거래 설정)으로 분리"""
+    pattern = replace(base_pattern, **{k: v for k, v in combo.items() if k in PATTERN_KEYS})
+    trading = replace(base_trading, **{k: v for k, v in combo.items() if k in TRADING_KEYS})
+    return pattern, trading
+
+
+def _init_worker(
+    frames: Dict[str, pd.DataFrame],
+    market: str,
+    patterns: List[str],
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    base_pattern: PatternSettings,
+    base_trading: TradingSettings
+):
+    """작업 프로세스 초기화 (데이터는 프로세스당 한 번만 전달)"""
+    _context.clear()
+    _context.update(
+        frames=frames,
+        market=market,
+        patterns=patterns,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+        base_pattern=base_pattern,
+        base_trading=base_trading,
+        signals={}
+    )
+
+
+def _signals(engine: BacktestEngine) -> Dict[str, Dict[str, np.ndarray]]:
+    """엔진 패턴 설정의 전체 구간 신호 (패턴 설정이 같으면 재사용, 지표는 프로세스 공용 캐시에서 재사용)"""
+    key = tuple(asdict(engine.pattern_settings).values())
+    signals = _context['signals'].get(key)
+    if signals is None:
+        signals = engine.detect_signals_panel(_context['frames'])
+        _context['signals'][key] = signals
+    return signals
+
+
+def _evaluate(combo: Dict, start: pd.Timestamp | None = None, end: pd.Timestamp | None = None) -> Dict:
+    """
+    조합 하나 평가 (작업 프로세스 또는 현재 프로세스)
+
+    Args:
+        combo: {설정 이름: 값}
+        start: 시뮬레이션 시작일 (None이면 전체 구간)
+        end: 시뮬레이션 종료일 (None이면 전체 구간)
+    """
+    pattern, trading = _split(combo, _context['base_pattern'], _context['base_trading'])
+
+    engine = BacktestEngine(
+        initial_capital=_context['initial_capital'],
+        stop_loss_pct=trading.stop_loss_pct,
+        take_profit_pct=trading.take_profit_pct,
+        max_holding_days=trading.max_holding_days,
+        max_positions=trading.max_positions,
+        position_size_pct=trading.position_size_pct,
+        pattern_settings=pattern
+    )
+    engine.start_date = _context['start_date'] if start is None else start.strftime('%Y-%m-%d')
+    engine.end_date = _context['end_date'] if end is None else end.strftime('%Y-%m-%d')
+
+    # 신호는 과거 봉에만 의존하므로 전체 구간 신호를 구간 시뮬레이션에도 그대로 사용
+    engine.simulate_portfolio(
+        _context['frames'], _signals(engine), _context['market'], _context['patterns'], start=start, end=end
+    )
+
+    row = dict(combo)
+    perf = engine.calculate_performance()
+    for metric in METRIC_KEYS:
+        row[metric] = perf[metric] if perf else (engine.capital if metric == 'final_capital' else 0)
+    return row
+
+
+def run_sweep(
+    frames: Dict[str, pd.DataFrame],
+    combos: List[Dict],
+    start_date: str,
+    end_date: str,
+    market: str = 'US',
+    patterns: List[str] | None = None,
+    initial_capital: float = 10_000_000,
+    base_pattern: PatternSettings | None = None,
+    base_trading: TradingSettings | None = None,
+    jobs: int = 1
+) -> pd.DataFrame:
+    """
+    파라미터 조합별 포트폴리오 백테스트
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임} (BacktestEngine.load_frames 결과)
+        combos: 조합 리스트 (build_combinations 결과)
+        start_date: 시작일 (연간 수익률 계산용)
+        end_date: 종료일
+        market: 시장 ('US' 또는 'KR')
+        patterns: 사용할 패턴 (None이면 전체)
+        initial_capital: 초기 자본
+        base_pattern: 조합에 없는 패턴 설정의 기본값
+        base_trading: 조합에 없는 거래 설정의 기본값
+        jobs: 프로세스 수 (1이면 현재 프로세스에서 실행)
+
+    Returns:
+        조합별 설정값과 성과 지표 테이블 (총 수익률 내림차순)
+    """
+    if patterns is None:
+        patterns = ['cup', 'pivot', 'base']
+
+    init_args = (
+        frames, market, patterns, start_date, end_date, initial_capital,
+        base_pattern or PatternSettings(), base_trading or TradingSettings()
+    )
+
+    # 패턴 설정이 같은 조합끼리 모아 신호 재사용률을 높임
+    order = sorted(range(len(combos)), key=lambda i: repr(sorted(
+        (k, v) for k, v in combos[i].items() if k in PATTERN_KEYS
+    )))
+    ordered = [combos[i] for i in order]
+
+    print(f"🔍 파라미터 스윕: {len(combos)}개 조합, {len(frames)}종목")
+    if jobs <= 1:
+        _init_worker(*init_args)
+        rows = [_evaluate(combo) for combo in ordered]
+    else:
+        chunk_size = max(1, len(ordered) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as executor:
+            rows = list(executor.map(_evaluate, ordered, chunksize=chunk_size))
+
+    results = pd.DataFrame(rows)
+    if results.empty:
+        return results
+    return results.sort_values('total_return_pct', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def print_sweep_report(results: pd.DataFrame, top: int = 10):
+    """스윕 상위 조합 출력"""
+    if results.empty:
+        print("\n⚠️  스윕 결과가 없습니다.")
+        return
+
+    params = [c for c in results.columns if c not in METRIC_KEYS]
+    print(f"\n{'=' * 60}")
+    print(f"🔍 파라미터 스윕 결과 (상위 {min(top, len(results))}개 / {len(results)}개)")
+    print(f"{'=' * 60}")
+    for rank, row in enumerate(results.head(top).itertuples(index=False), 1):
+        values = ', '.join(f"{p}={getattr(row, p)}" for p in params)
+        print(f"{rank:>3}. {values}")
+        print(f"     수익률 {row.total_return_pct:>7.2f}% | 승률 {row.win_rate:>6.2f}% | "
+              f"거래 {int(row.total_trades):>4}건 | 평균 보유 {np.nan_to_num(row.avg_holding_days):>5.1f}일 | "
+              f"MDD {row.max_drawdown:>6.2f}% | 샤프 {row.sharpe:>5.2f}")
+    print(f"{'=' * 60}\n")
@@ -0,0 +1,190 @@
+"""
+워크포워드 최적화
+- 거래일 달력을 (학습 구간, 검증 구간) 롤링 창으로 나누고 학습 구간마다 파라미터 스윕
+- 학습 구간 최고 조합을 다음 검증 구간에 적용하고, 검증 구간 거래를 하나의 포트폴리오로 이어 붙임
+- 신호는 과거 봉에만 의존하므로 패턴 설정별 전체 구간 신호를 한 번 계산해 모든 창에서 재사용
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import pandas as pd
+
+from ..config.settings import PatternSettings, TradingSettings
+from .engine import BacktestEngine
+from .sweep import METRIC_KEYS, _context, _evaluate, _init_worker, _signals, _split
+
+
+def build_folds(calendar: pd.DatetimeIndex, train_bars: int = 504, test_bars: int = 126) -> List[Dict]:
+    """
+    롤링 학습/검증 구간
+
+    Args:
+        calendar: 전 종목 거래일 달력
+        train_bars: 학습 구간 길이 (거래일)
+        test_bars: 검증 구간 길이 (거래일, 다음 창은 이만큼 이동)
+
+    Returns:
+        [{'fold', 'train_start', 'train_end', 'test_start', 'test_end'}] (검증 구간은 겹치지 않음)
+    """
+    folds = []
+    i = train_bars
+    while i < len(calendar):
+        stop = min(i + test_bars, len(calendar))
+        folds.append({
+            'fold': len(folds) + 1,
+            'train_start': calendar[i - train_bars],
+            'train_end': calendar[i - 1],
+            'test_start': calendar[i],
+            'test_end': calendar[stop - 1]
+        })
+        i = stop
+    return folds
+
+
+def _train_fold(task) -> List[Dict]:
+    """작업 프로세스: 학습 구간 하나의 전체 조합 평가"""
+    fold, combos = task
+    rows = []
+    for combo in combos:
+        row = _evaluate(combo, fold['train_start'], fold['train_end'])
+        row['fold'] = fold['fold']
+        rows.append(row)
+    return rows
+
+
+def run_walk_forward(
+    frames: Dict[str, pd.DataFrame],
+    combos: List[Dict],
+    train_bars: int = 504,
+    test_bars: int = 126,
+    market: str = 'US',
+    patterns: List[str] | None = None,
+    initial_capital: float = 10_000_000,
+    base_pattern: PatternSettings | None = None,
+    base_trading: TradingSettings | None = None,
+    metric: str = 'total_return_pct',
+    jobs: int = 1
+) -> Dict | None:
+    """
+    워크포워드 최적화 실행
+
+    학습 구간은 서로 독립이므로 프로세스 풀로 병렬 평가한다. 작업 프로세스는 데이터를
+    한 번만 받고, 패턴 설정별 신호와 이동 구간 지표를 프로세스 안에서 재사용한다.
+    검증 구간은 한 엔진에서 순서대로 시뮬레이션해 현금과 보유 포지션을 다음 구간으로 넘긴다.
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임} (BacktestEngine.load_frames 결과)
+        combos: 조합 리스트 (sweep.build_combinations 결과)
+        train_bars: 학습 구간 길이 (거래일)
+        test_bars: 검증 구간 길이 (거래일)
+        market: 시장 ('US' 또는 'KR')
+        patterns: 사용할 패턴 (None이면 전체)
+        initial_capital: 초기 자본
+        base_pattern: 조합에 없는 패턴 설정의 기본값
+        base_trading: 조합에 없는 거래 설정의 기본값
+        metric: 학습 구간 최고 조합 선택 기준 (METRIC_KEYS 중 하나, 클수록 좋음)
+        jobs: 프로세스 수 (1이면 현재 프로세스에서 실행)
+
+    Returns:
+        {'folds': 구간별 선택 조합과 학습/검증 성과 테이블, 'train': 학습 구간 전체 조합 성과 테이블,
+         'engine': 검증 구간을 이어 붙인 BacktestEngine, 'metric': 선택 기준} (구간을 만들 수 없으면 None)
+    """
+    if metric not in METRIC_KEYS:
+        raise ValueError(f"알 수 없는 지표: {metric}")
+    if patterns is None:
+        patterns = ['cup', 'pivot', 'base']
+    base_pattern = base_pattern or PatternSettings()
+    base_trading = base_trading or TradingSettings()
+    combos = combos or [{}]
+
+    tickers = list(frames)
+    if not tickers:
+        return None
+    calendar = frames[tickers[0]].index
+    for ticker in tickers[1:]:
+        calendar = calendar.union(frames[ticker].index)
+
+    folds = build_folds(calendar, train_bars, test_bars)
+    if not folds:
+        print(f"\n⚠️  거래일({len(calendar)}일)이 학습 구간({train_bars}일)보다 짧습니다.")
+        return None
+
+    print(f"🚶 워크포워드: {len(folds)}개 구간, 구간당 {len(combos)}개 조합, {len(frames)}종목")
+    init_args = (
+        frames, market, patterns,
+        folds[0]['train_start'].strftime('%Y-%m-%d'), folds[-1]['test_end'].strftime('%Y-%m-%d'),
+        initial_capital, base_pattern, base_trading
+    )
+    tasks = [(fold, combos) for fold in folds]
+
+    # 1단계: 학습 구간별 스윕 (구간 단위 병렬)
+    if jobs <= 1:
+        _init_worker(*init_args)
+        results = [_train_fold(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as executor:
+            results = list(executor.map(_train_fold, tasks))
+        _init_worker(*init_args)
+
+    train = pd.DataFrame([row for rows in results for row in rows])
+
+    # 2단계: 구간별 최고 조합으로 다음 검증 구간 시뮬레이션 (현금/포지션 이월)
+    engine = BacktestEngine(initial_capital=initial_capital)
+    engine.start_date = folds[0]['test_start'].strftime('%Y-%m-%d')
+    engine.end_date = folds[-1]['test_end'].strftime('%Y-%m-%d')
+
+    summary = []
+    for fold, rows in zip(folds, results):
+        best = max(rows, key=lambda row: row[metric])
+        combo = {key: best[key] for key in combos[0]}
+        pattern, trading = _split(combo, base_pattern, base_trading)
+
+        engine.pattern_settings = pattern
+        engine.stop_loss_pct = trading.stop_loss_pct
+        engine.take_profit_pct = trading.take_profit_pct
+        engine.max_holding_days = trading.max_holding_days
+        engine.max_positions = trading.max_positions
+        engine.position_size_pct = trading.position_size_pct
+
+        equity_before = engine.capital + engine.market_value()
+        last = fold is folds[-1]
+        trade_count = engine.simulate_portfolio(
+            frames, _signals(engine), market, patterns,
+            start=fold['test_start'], end=fold['test_end'], liquidate=last
+        )
+        equity_after = engine.capital + engine.market_value()
+
+        summary.append({
+            **{key: fold[key] for key in ('fold', 'train_start', 'train_end', 'test_start', 'test_end')},
+            **combo,
+            f'train_{metric}': best[metric],
+            'train_trades': best['total_trades'],
+            'test_trades': trade_count,
+            'test_return_pct': (equity_after / equity_before - 1) * 100 if equity_before else 0.0
+        })
+
+    _context.clear()
+    return {'folds': pd.DataFrame(summary), 'train': train, 'engine': engine, 'metric': metric}
+
+
+def print_walk_forward_report(result: Dict | None):
+    """워크포워드 구간별 선택 조합과 검증 성과 출력"""
+    if result is None:
+        return
+
+    folds = result['folds']
+    metric = result['metric']
+    params = [
+        c for c in folds.columns
+        if c not in ('fold', 'test_start', 'test_end', 'test_trades', 'test_return_pct') and not c.startswith('train_')
+    ]
+
+    print(f"\n{'=' * 60}")
+    print(f"🚶 워크포워드 결과 ({len(folds)}개 구간)")
+    print(f"{'=' * 60}")
+    for row in folds.itertuples(index=False):
+        values = ', '.join(f"{p}={getattr(row, p)}" for p in params)
+        print(f"{row.fold:>3}. 검증 {row.test_start:%Y-%m-%d} ~ {row.test_end:%Y-%m-%d} | {values}")
+        print(f"     학습 {metric} {getattr(row, f'train_{metric}'):>8.2f} | "
+              f"검증 수익률 {row.test_return_pct:>7.2f}% | 검증 거래 {row.test_trades:>4}건")
+    print(f"{'=' * 60}")
@@ -1,4 +1,5 @@
 """메인 봇 모듈"""
 from .detector import BreakoutDetector
+from .runtime import BotRuntime
 
-__all__ = ['BreakoutDetector']
\ No newline at end of file
+__all__ = ['BreakoutDetector', 'BotRuntime']
@@ -1,22 +1,35 @@
 """스마트 통합 돌파매매 감지 봇"""
+import asyncio
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..config import Settings, load_settings
-from ..data.us_stock import get_us_stock_data
+from ..data.cache import configure_bar_store
+from ..data.us_stock import get_us_stock_data, get_us_stocks_data
+from ..data.kr_names import configure_kr_name_index
 from ..data.kr_stock import get_kr_stock_data, get_kr_stock_name
-from ..patterns.pivot import detect_pivot_breakout
+from ..data.kr_snapshot import get_kr_snapshot_data, ingest_kr_snapshots
+from ..patterns.panel import detect_breakouts_panel, stack_tails
+from ..patterns.streaming import PivotBreakoutState
 from ..market.status import get_market_status, format_market_status_message
 from ..positions import PositionManager
 from ..watchlist import WatchlistManager
 from ..telegram.client import TelegramClient
 from ..telegram.formatter import (
     format_signal_message,
+    format_extended_message,
     format_close_position_message,
     format_no_signal_message
 )
+from .pipeline import ScanJob, run_pipeline
+from .runtime import BotRuntime
+from .signal_state import SignalStateStore
 
 
 class BreakoutDetector:
@@ -28,6 +41,8 @@ class BreakoutDetector:
             settings: 설정 객체 (None이면 자동 로드)
         """
         self.settings = settings or load_settings()
+        configure_bar_store(self.settings.data.cache_dir)
+        configure_kr_name_index(self.settings.data.kr_names_file)
 
         # 텔레그램 클라이언트
         self.telegram = TelegramClient(
@@ -50,10 +65,18 @@ class BreakoutDetector:
             self.settings.trading.max_holding_days
         )
 
-        # 스캔 락
-        self.scan_lock = threading.Lock()
+        # 신호 알림 상태 (같은 피벗 재알림 억제)
+        self.signal_state = SignalStateStore(
+            self.settings.signal_state_file,
+            self.settings.scan.signal_suppress_hours
+        )
+
+        # 스캔 진행 여부 (BotRuntime이 이벤트 루프 스레드에서만 변경)
         self.is_scanning = False
 
+        # 종목별 피벗 돌파 증분 감지 상태 {(시장, 종목 코드): PivotBreakoutState}
+        self.pivot_states: Dict[tuple, PivotBreakoutState] = {}
+
         print(f"✅ 감시 종목 로드 완료: {self.watchlist.count_kr()}개")
         print(f"✅ 포지션 로드 완료: {self.positions.count()}개")
 
@@ -97,6 +120,9 @@ class BreakoutDetector:
         elif command in ('/scan', '/scan_kr'):
             return 'SCAN_KR'
 
+        elif command == '/cancel':
+            return 'CANCEL_ALL' if len(parts) > 1 and parts[1].lower() == 'all' else 'CANCEL'
+
         elif command == '/positions':
             return self.positions.format_list_message(self._get_current_price)
 
@@ -113,7 +139,9 @@ class BreakoutDetector:
 🤖 <b>윌리엄 오닐 돌파매매 봇 명령어</b>
 
 <b>즉시 스캔:</b>
-/scan - 즉시 스캔
+/scan - 즉시 스캔 (진행 중이면 대기열에 추가)
+/cancel - 진행 중인 작업 취소
+/cancel all - 진행 중인 작업과 대기 작업 모두 취소
 
 <b>포지션 관리:</b>
 /positions - 현재 보유 포지션 보기
@@ -186,14 +214,27 @@ class BreakoutDetector:
         self.positions.remove(position['ticker'])
         print(f"  ❌ 포지션 청산: {position['ticker']} ({reason}) {profit_pct:+.2f}%")
 
-    def check_positions(self):
-        """포지션 추적 및 청산 조건 확인"""
-        if self.positions.count() == 0:
+    def check_positions(self, cancel: threading.Event | None = None, markets: List[str] | None = None):
+        """
+        포지션 추적 및 청산 조건 확인
+
+        Args:
+            cancel: 설정되면 남은 포지션 확인을 중단하는 취소 이벤트
+            markets: 확인할 시장 리스트 (None이면 전체 - 장중인 시장만 조회할 때 사용)
+        """
+        positions = [
+            pos for pos in self.positions.get_all()
+            if markets is None or pos['market'] in markets
+        ]
+        if not positions:
             return
 
-        print(f"\n📊 포지션 추적 중... ({self.positions.count()}개)")
+        print(f"\n📊 포지션 추적 중... ({len(positions)}개)")
 
-        for pos in self.positions.get_all():
+        for pos in positions:
+            if cancel is not None and cancel.is_set():
+                print("  ⏹️ 포지션 추적 취소")
+                return
             ticker = pos['ticker']
             try:
                 current_price = self._get_current_price(ticker, pos['market'])
@@ -219,47 +260,187 @@ class BreakoutDetector:
     # 종목 분석
     # ========================================
 
-    def analyze_us_stock(self, ticker: str) -> List[Dict]:
-        """미국 주식 분석"""
-        df = get_us_stock_data(ticker, self.settings.data.analysis_period)
+    def _pivot_state(self, ticker: str, market: str, stock_name: str | None = None) -> PivotBreakoutState:
+        """종목별 피벗 돌파 증분 상태 (없으면 생성)"""
+        key = (market, ticker)
+        state = self.pivot_states.get(key)
+        if state is None:
+            state = PivotBreakoutState(
+                ticker, market, stock_name,
+                volume_surge_min=self.settings.pattern.volume_surge_min,
+                breakout_max=self.settings.pattern.breakout_max
+            )
+            self.pivot_states[key] = state
+        elif stock_name:
+            state.stock_name = stock_name
+        return state
+
+    def _pivot_signal(
+        self,
+        df: pd.DataFrame,
+        ticker: str,
+        market: str,
+        stock_name: str | None = None
+    ) -> Dict | None:
+        """
+        증분 상태로 피벗 돌파 감지 (detect_pivot_breakout과 같은 결과)
+
+        이전 스캔 이후 새로 생긴 봉만 반영하므로 종목당 O(새 봉 수)로 처리된다.
+        """
+        state = self._pivot_state(ticker, market, stock_name)
+        state.sync(df)
+        return state.signal()
+
+    def _extension_alert(
+        self,
+        df: pd.DataFrame | None,
+        ticker: str,
+        market: str,
+        stock_name: str | None = None
+    ) -> Dict | None:
+        """
+        알린 피벗 대비 상승률이 매수 범위(breakout_max)를 넘었는지 확인
+
+        Returns:
+            매수 범위 이탈 알림 딕셔너리 ('alert': 'extended') 또는 None
+        """
+        if df is None or df.empty:
+            return None
+        pivot = self.signal_state.active_pivot(market, ticker, '피벗돌파')
+        if pivot is None:
+            return None
+
+        current_price = float(df['Close'].iloc[-1])
+        breakout_pct = (current_price - pivot) / pivot * 100
+        if breakout_pct <= self.settings.pattern.breakout_max:
+            return None
+
+        alert = {
+            'ticker': ticker,
+            'pattern': '피벗돌파',
+            'market': market,
+            'resistance': pivot,
+            'current_price': current_price,
+            'breakout_pct': round(breakout_pct, 2),
+            'breakout_max': self.settings.pattern.breakout_max,
+            'alert': 'extended'
+        }
+        if stock_name:
+            alert['name'] = stock_name
+        return alert
+
+    def update_quote(
+        self,
+        ticker: str,
+        market: str,
+        timestamp: pd.Timestamp,
+        price: float,
+        volume: float
+    ) -> Dict | None:
+        """
+        실시간 시세 한 건으로 피벗 돌파 재판정 (데이터 재조회 없음)
+
+        Args:
+            ticker: 종목 코드
+            market: 시장 ('US' 또는 'KR')
+            timestamp: 봉 시각 (일봉 기준 거래일)
+            price: 현재가
+            volume: 당일 누적 거래량
+
+        Returns:
+            피벗 돌파 신호 또는 None (이전 스캔으로 상태가 만들어진 종목만 판정)
+        """
+        state = self.pivot_states.get((market, ticker))
+        if state is None:
+            return None
+        state.update(pd.Timestamp(timestamp), float(price), volume)
+        return state.signal()
+
+    def analyze_us_stock(self, ticker: str, df: pd.DataFrame | None = None) -> List[Dict]:
+        """미국 주식 분석 (df가 없으면 직접 조회)"""
+        if df is None:
+            df = get_us_stock_data(ticker, self.settings.data.analysis_period)
         if df is None:
             return []
 
         signals = []
-        pivot_signal = detect_pivot_breakout(
-            df, ticker, 'US',
-            volume_surge_min=self.settings.pattern.volume_surge_min,
-            breakout_max=self.settings.pattern.breakout_max
-        )
+        pivot_signal = self._pivot_signal(df, ticker, 'US')
         if pivot_signal:
             signals.append(pivot_signal)
 
         return signals
 
-    def analyze_kr_stock(self, ticker: str) -> List[Dict]:
-        """한국 주식 분석"""
-        df = get_kr_stock_data(ticker, self.settings.data.analysis_period_days)
+    def _fetch_kr_stock(self, ticker: str) -> pd.DataFrame | None:
+        """한국 주식 분석용 데이터 조회 (수집 방식에 따라)"""
+        if self.settings.data.kr_ingest_mode == 'snapshot':
+            return get_kr_snapshot_data(ticker, self.settings.data.analysis_period_days)
+        return get_kr_stock_data(ticker, self.settings.data.analysis_period_days)
+
+    def analyze_kr_stock(self, ticker: str, df: pd.DataFrame | None = None) -> List[Dict]:
+        """한국 주식 분석 (df가 없으면 직접 조회)"""
+        if df is None:
+            df = self._fetch_kr_stock(ticker)
         if df is None:
             return []
 
         signals = []
         stock_name = get_kr_stock_name(ticker)
-        pivot_signal = detect_pivot_breakout(
-            df, ticker, 'KR', stock_name,
-            volume_surge_min=self.settings.pattern.volume_surge_min,
-            breakout_max=self.settings.pattern.breakout_max
-        )
+        pivot_signal = self._pivot_signal(df, ticker, 'KR', stock_name)
         if pivot_signal:
             signals.append(pivot_signal)
 
         return signals
 
+    def screen_panel(self, frames: Dict[str, pd.DataFrame], market: str) -> Dict[str, List[Dict]]:
+        """
+        여러 종목을 패널 연산 한 번으로 선별한 뒤 신호 종목만 상세 분석
+
+        Args:
+            frames: {종목 코드: OHLCV 데이터프레임}
+            market: 시장 ('US' 또는 'KR')
+
+        Returns:
+            {종목 코드: 신호 리스트} (신호가 있는 종목만)
+        """
+        # detect_pivot_breakout과 같은 구간: 최근 30봉, 직전 29봉 평균 거래량
+        tickers, close, volume = stack_tails(frames, 30)
+        if not tickers:
+            return {}
+
+        pivot, _ = detect_breakouts_panel(
+            close, volume, self.settings.pattern,
+            patterns=('pivot',),
+            pivot_volume_window=29
+        )['pivot']
+
+        results = {}
+        for row in np.flatnonzero(pivot[:, -1]):
+            ticker = tickers[row]
+            stock_name = get_kr_stock_name(ticker) if market == 'KR' else None
+            signal = self._pivot_signal(frames[ticker], ticker, market, stock_name)
+            if signal:
+                results[ticker] = [signal]
+
+        return results
+
     # ========================================
     # 스캔 실행
     # ========================================
 
-    def run_manual_scan(self, scan_kr: bool = True, scan_us: bool = True) -> List[Dict]:
-        """수동 스캔 (시간대 무관)"""
+    def run_manual_scan(
+        self,
+        scan_kr: bool = True,
+        scan_us: bool = True,
+        cancel: threading.Event | None = None
+    ) -> List[Dict]:
+        """
+        수동 스캔 (시간대 무관)
+
+        Args:
+            scan_kr: 한국 주식 스캔 여부
+            scan_us: 미국 주식 스캔 여부
+            cancel: 설정되면 남은 종목 조회/분석/알림을 건너뛰는 취소 이벤트
+        """
         print(f"\n{'=' * 60}")
         print(f"🔍 수동 스캔")
         print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -271,28 +452,24 @@ class BreakoutDetector:
 
         print(f"{'=' * 60}\n")
 
-        all_signals = []
-
-        # 미국 주식 스캔
-        if scan_us:
-            signals = self._scan_us_stocks()
-            all_signals.extend(signals)
-
-        # 한국 주식 스캔
-        if scan_kr:
-            signals = self._scan_kr_stocks()
-            all_signals.extend(signals)
+        all_signals = self._scan_markets(scan_us, scan_kr, cancel)
+        if cancel is not None and cancel.is_set():
+            print(f"⏹️  스캔 취소 ({len(all_signals)}개 신호 처리 후 중단)\n")
+            return all_signals
 
         self._print_scan_summary(all_signals, scan_us, scan_kr, "수동")
 
         return all_signals
 
-    def run_smart_scan(self) -> List[Dict]:
-        """시간대에 따라 자동으로 시장 선택하여 스캔"""
-        if self.is_scanning:
-            print("\n⏸️  수동 스캔이 진행 중입니다. 이번 주기는 건너뜁니다...\n")
-            return []
+    def run_smart_scan(self, track_positions: bool = True, cancel: threading.Event | None = None) -> List[Dict]:
+        """
+        시간대에 따라 자동으로 시장 선택하여 스캔
 
+        Args:
+            track_positions: 스캔 전에 포지션 추적도 실행할지 여부
+                (BotRuntime은 포지션 추적을 별도 작업으로 실행하므로 False)
+            cancel: 설정되면 남은 종목 조회/분석/알림을 건너뛰는 취소 이벤트
+        """
         market_status = get_market_status()
 
         print(f"\n{'=' * 60}")
@@ -305,7 +482,8 @@ class BreakoutDetector:
         if not scan_kr and not scan_us:
             print("⏸️  휴장 시간입니다. 다음 장 시작까지 대기...")
             print(f"{'=' * 60}\n")
-            self.check_positions()
+            if track_positions:
+                self.check_positions(cancel)
             return []
 
         if scan_kr:
@@ -316,106 +494,190 @@ class BreakoutDetector:
         print(f"{'=' * 60}\n")
 
         # 먼저 포지션 추적
-        self.check_positions()
-
-        all_signals = []
+        if track_positions:
+            self.check_positions(cancel)
 
-        # 미국 주식 스캔
-        if scan_us:
-            signals = self._scan_us_stocks()
-            all_signals.extend(signals)
-
-        # 한국 주식 스캔
-        if scan_kr:
-            signals = self._scan_kr_stocks()
-            all_signals.extend(signals)
+        all_signals = self._scan_markets(scan_us, scan_kr, cancel)
+        if cancel is not None and cancel.is_set():
+            print(f"⏹️  스캔 취소 ({len(all_signals)}개 신호 처리 후 중단)\n")
+            return all_signals
 
         self._print_scan_summary(all_signals, scan_us, scan_kr, "자동")
 
         return all_signals
 
-    def _scan_us_stocks(self) -> List[Dict]:
-        """미국 주식 스캔"""
-        signals = []
-        us_tickers = self.watchlist.get_us()
+    def _scan_markets(self, scan_us: bool, scan_kr: bool, cancel: threading.Event | None = None) -> List[Dict]:
+        """
+        미국/한국 주식 파이프라인 스캔
 
-        if not us_tickers:
-            return signals
+        두 시장의 조회 작업을 한 파이프라인에 넣어 제공자별 동시 조회 수 안에서 함께 진행하고,
+        분석이 끝난 종목부터 알림 스레드가 텔레그램 전송과 포지션 기록을 처리한다.
 
-        print("🇺🇸 미국 주식 스캔 중...\n")
+        Returns:
+            신호 리스트 (미국 → 한국, 워치리스트 순서)
+        """
+        jobs: List[ScanJob] = []
+        if scan_us:
+            jobs.extend(self._us_scan_jobs(len(jobs)))
+        if scan_kr:
+            jobs.extend(self._kr_scan_jobs(len(jobs)))
+        if not jobs:
+            return []
 
-        for ticker in us_tickers:
-            try:
-                print(f"  🔍 {ticker}...", end=" ")
-                stock_signals = self.analyze_us_stock(ticker)
-
-                if stock_signals:
-                    for signal in stock_signals:
-                        signals.append(signal)
-                        msg = format_signal_message(signal)
-                        self.telegram.send_message(msg)
-
-                        # 포지션 자동 추가
-                        if not self.positions.has_position(ticker):
-                            self.positions.add(
-                                ticker=ticker,
-                                market='US',
-                                entry_price=signal['current_price'],
-                                pattern=signal['pattern'],
-                                signal=signal
-                            )
-
-                        print(f"✅ 신호!")
-                        time.sleep(1)
-                else:
-                    print("⚪")
-            except Exception:
-                print(f"❌ 오류")
+        scan = self.settings.scan
+        outcomes = run_pipeline(
+            jobs,
+            self._handle_scan_result,
+            fetch_limits={'US': scan.us_fetch_concurrency, 'KR': scan.kr_fetch_concurrency},
+            analysis_workers=scan.analysis_workers,
+            queue_size=scan.queue_size,
+            cancel=cancel
+        )
         print()
 
-        return signals
+        # 매수 범위 이탈 알림은 매수 신호가 아니므로 제외
+        return [
+            signal for _, signals in outcomes if signals
+            for signal in signals if 'alert' not in signal
+        ]
 
-    def _scan_kr_stocks(self) -> List[Dict]:
-        """한국 주식 스캔"""
-        signals = []
-        kr_tickers = self.watchlist.get_kr()
+    def _us_scan_jobs(self, offset: int = 0) -> List[ScanJob]:
+        """미국 주식 스캔 작업 (묶음 조회 단위로 나눈 작업, 분석은 패널 선별)"""
+        us_tickers = self._unfired_tickers(self.watchlist.get_us(), 'US')
+        if not us_tickers:
+            return []
 
+        print("🇺🇸 미국 주식 스캔 중...\n")
+
+        period = self.settings.data.analysis_period
+        chunk_size = self.settings.data.us_batch_size
+
+        def fetch(chunk: List[str]) -> Dict[str, pd.DataFrame]:
+            frames = get_us_stocks_data(
+                chunk, period,
+                chunk_size=len(chunk),
+                threads=self.settings.data.us_batch_threads
+            )
+            # 묶음 조회에서 빠진 종목은 단건 조회
+            for ticker in chunk:
+                if ticker not in frames:
+                    df = get_us_stock_data(ticker, period)
+                    if df is not None:
+                        frames[ticker] = df
+            print(f"  📥 데이터 조회 완료 ({len(frames)}/{len(chunk)}개)")
+            return frames
+
+        def analyze(chunk: List[str], frames: Dict[str, pd.DataFrame]) -> List[Tuple[str, List[Dict]]]:
+            panel_signals = self.screen_panel(frames, 'US')
+            outcomes = []
+            for ticker in chunk:
+                signals = panel_signals.get(ticker, [])
+                if not signals:
+                    extended = self._extension_alert(frames.get(ticker), ticker, 'US')
+                    signals = [extended] if extended else []
+                outcomes.append((ticker, signals))
+            return outcomes
+
+        jobs = []
+        for i in range(0, len(us_tickers), chunk_size):
+            chunk = us_tickers[i:i + chunk_size]
+            jobs.append(ScanJob(
+                index=offset + len(jobs),
+                provider='US',
+                tickers=chunk,
+                fetch=partial(fetch, chunk),
+                analyze=partial(analyze, chunk)
+            ))
+        return jobs
+
+    def _kr_scan_jobs(self, offset: int = 0) -> List[ScanJob]:
+        """한국 주식 스캔 작업 (종목별 조회)"""
+        kr_tickers = self._unfired_tickers(self.watchlist.get_kr(), 'KR')
         if not kr_tickers:
-            return signals
+            return []
 
         print("🇰🇷 한국 주식 스캔 중...\n")
 
-        for ticker in kr_tickers:
-            try:
-                name = get_kr_stock_name(ticker)
-                print(f"  🔍 {name}({ticker})...", end=" ")
-                stock_signals = self.analyze_kr_stock(ticker)
-
-                if stock_signals:
-                    for signal in stock_signals:
-                        signals.append(signal)
-                        msg = format_signal_message(signal)
-                        self.telegram.send_message(msg)
-
-                        # 포지션 자동 추가
-                        if not self.positions.has_position(ticker):
-                            self.positions.add(
-                                ticker=ticker,
-                                market='KR',
-                                entry_price=signal['current_price'],
-                                pattern=signal['pattern'],
-                                signal=signal
-                            )
-
-                        print(f"✅ 신호!")
-                        time.sleep(2)
+        if self.settings.data.kr_ingest_mode == 'snapshot':
+            ingest_kr_snapshots(self.settings.data.analysis_period_days)
+            print()
+
+        def analyze(ticker: str, df: pd.DataFrame | None) -> List[Tuple[str, List[Dict]]]:
+            if df is None:
+                return [(ticker, [])]
+            signals = self.analyze_kr_stock(ticker, df)
+            if not signals:
+                extended = self._extension_alert(df, ticker, 'KR', get_kr_stock_name(ticker))
+                signals = [extended] if extended else []
+            return [(ticker, signals)]
+
+        return [
+            ScanJob(
+                index=offset + i,
+                provider='KR',
+                tickers=[ticker],
+                fetch=partial(self._fetch_kr_stock, ticker),
+                analyze=partial(analyze, ticker)
+            )
+            for i, ticker in enumerate(kr_tickers)
+        ]
+
+    def _unfired_tickers(self, tickers: List[str], market: str) -> List[str]:
+        """이미 알린 신호가 매수 범위를 벗어난 종목 제외 (억제 기간 동안 더 알릴 것이 없음)"""
+        remaining = [ticker for ticker in tickers if not self.signal_state.should_skip(market, ticker)]
+        skipped = len(tickers) - len(remaining)
+        if skipped:
+            flag = "🇺🇸" if market == 'US' else "🇰🇷"
+            print(f"⏭️  {flag} 알림이 끝난 종목 {skipped}개 건너뜀")
+        return remaining
+
+    def _handle_scan_result(self, job: ScanJob, ticker: str, signals: List[Dict] | None):
+        """
+        종목별 스캔 결과 처리 (알림 스레드): 텔레그램 전송, 포지션 자동 추가
+
+        같은 피벗의 반복 신호는 억제 기간 동안 전송/대기 없이 넘기고,
+        새 피벗 돌파와 매수 범위 이탈만 다시 알린다.
+        """
+        market = job.provider
+        label = f"{get_kr_stock_name(ticker)}({ticker})" if market == 'KR' else ticker
+
+        if signals is None:
+            print(f"  🔍 {label}... ❌ 오류")
+            return
+        if not signals:
+            print(f"  🔍 {label}... ⚪")
+            return
+
+        for signal in signals:
+            if signal.get('alert') == 'extended':
+                if self.signal_state.on_extended(signal):
+                    self.telegram.send_message(format_extended_message(signal))
+                    print(f"  🔍 {label}... ⚠️ 매수 범위 이탈 (+{signal['breakout_pct']}%)")
+                    time.sleep(self.settings.scan.notify_interval)
                 else:
-                    print("⚪")
-            except Exception:
-                print(f"❌ 오류")
-        print()
+                    print(f"  🔍 {label}... ⚪")
+                continue
 
-        return signals
+            kind = self.signal_state.on_signal(signal)
+            if kind is None:
+                print(f"  🔍 {label}... 🔁 신호 유지 (알림 생략)")
+                continue
+
+            msg = format_signal_message(signal, new_pivot=(kind == 'new_pivot'))
+            self.telegram.send_message(msg)
+
+            # 포지션 자동 추가
+            if not self.positions.has_position(ticker):
+                self.positions.add(
+                    ticker=ticker,
+                    market=market,
+                    entry_price=signal['current_price'],
+                    pattern=signal['pattern'],
+                    signal=signal
+                )
+
+            print(f"  🔍 {label}... ✅ 신호!")
+            time.sleep(self.settings.scan.notify_interval)
 
     def _print_scan_summary(
         self,
@@ -452,68 +714,6 @@ class BreakoutDetector:
 
         print(f"\n{'=' * 60}\n")
 
-    # ========================================
-    # 스캔 스레드 관리
-    # ========================================
-
-    def _execute_scan_in_thread(self, scan_kr: bool, scan_us: bool, scan_type: str):
-        """별도 스레드에서 스캔 실행"""
-        if self.is_scanning:
-            self.telegram.send_message("⚠️  이미 스캔이 진행 중입니다. 완료 후 다시 시도해주세요.")
-            return
-
-        if not self.scan_lock.acquire(blocking=False):
-            self.telegram.send_message("⚠️  다른 스캔이 진행 중입니다. 잠시 후 다시 시도해주세요.")
-            return
-
-        try:
-            self.is_scanning = True
-            print(f"\n🔔 {scan_type} 명령어 수신 - 스캔 시작")
-            self.run_manual_scan(scan_kr=scan_kr, scan_us=scan_us)
-            self.telegram.send_message(f"✅ {scan_type} 완료!")
-        except Exception as e:
-            print(f"❌ 스캔 중 오류: {e}")
-            self.telegram.send_message(f"❌ 스캔 중 오류가 발생했습니다: {str(e)}")
-        finally:
-            self.is_scanning = False
-            self.scan_lock.release()
-
-    def check_telegram_updates(self):
-        """텔레그램 메시지 확인 (명령어 처리)"""
-        updates = self.telegram.get_updates()
-
-        for update in updates:
-            message_text = update['text']
-            reply = self.process_command(message_text)
-
-            if reply == 'SCAN_KR':
-                self.telegram.send_message("🔍 스캔을 시작합니다...")
-                scan_thread = threading.Thread(
-                    target=self._execute_scan_in_thread,
-                    args=(True, False, "수동 스캔"),
-                    daemon=True
-                )
-                scan_thread.start()
-
-            elif reply:
-                self.telegram.send_message(reply)
-
-    def start_command_listener(self):
-        """백그라운드에서 텔레그램 명령어 리스너 시작"""
-
-        def listener_loop():
-            while True:
-                try:
-                    self.check_telegram_updates()
-                    time.sleep(2)
-                except Exception as e:
-                    print(f"⚠️  리스너 오류: {e}")
-                    time.sleep(5)
-
-        thread = threading.Thread(target=listener_loop, daemon=True)
-        thread.start()
-        print("✅ 텔레그램 명령어 리스너 시작")
-
     # ========================================
     # 메인 실행
     # ========================================
@@ -521,7 +721,12 @@ class BreakoutDetector:
     def get_start_message(self) -> str:
         """시작 메시지 생성"""
         market_status = get_market_status()
-        status_text = "🇰🇷 한국 장중" if market_status['kr'] else "⏸️ 휴장 중"
+        if market_status['kr']:
+            status_text = "🇰🇷 한국 장중"
+        elif market_status['us']:
+            status_text = "🇺🇸 미국 장중"
+        else:
+            status_text = "⏸️ 휴장 중"
 
         interval_min = self.settings.scan.interval_seconds // 60
 
@@ -534,7 +739,7 @@ class BreakoutDetector:
 ⏰ 스캔 주기: {interval_min}분
 🕐 현재 상태: {status_text}
 
-📈 자동 스캔: 장중 (09:00-15:30)
+📈 자동 스캔: 개장 {self.settings.scan.open_offset_minutes:g}분 후 ~ 폐장 {self.settings.scan.close_offset_minutes:g}분 전 (거래소 달력 기준)
 
 🎯 자동 포지션 추적:
    • 매수 신호 시 자동 기록
@@ -549,27 +754,9 @@ class BreakoutDetector:
 """
 
     def run(self):
-        """메인 실행 루프"""
-        # 텔레그램 명령어 리스너 시작
-        self.start_command_listener()
-
-        # 시작 메시지
-        start_msg = self.get_start_message()
-        self.telegram.send_message(start_msg)
-        print(start_msg)
-
-        scan_interval = self.settings.scan.interval_seconds
-
+        """메인 실행 (asyncio 런타임: 스캔 스케줄러, 명령어 리스너, 포지션 추적)"""
         try:
-            while True:
-                self.run_smart_scan()
-
-                # 다음 스캔까지 대기
-                next_scan = datetime.now() + timedelta(seconds=scan_interval)
-                print(f"⏰ 다음 스캔: {next_scan.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"💤 {scan_interval // 60}분 대기 중...\n")
-                time.sleep(scan_interval)
-
+            asyncio.run(BotRuntime(self).run())
         except KeyboardInterrupt:
             print("\n\n⛔ 프로그램 종료")
-            self.telegram.send_message("⛔ 윌리엄 오닐 스마트 돌파매매 봇 종료")
\ No newline at end of file
+            self.telegram.send_message("⛔ 윌리엄 오닐 스마트 돌파매매 봇 종료")
@@ -0,0 +1,160 @@
+"""
+봇 작업 대기열
+- 포지션 추적 > 수동 스캔 > 자동 스캔 순으로 한 번에 하나씩 실행
+- 같은 작업(종류 + 시장) 요청은 대기 중인 작업 하나로 합침
+  (실행 중인 같은 작업에는 합치지 않고 끝난 뒤 한 번 더 실행 - 요청 이후 데이터로 다시 스캔, 예약된 스캔 유지)
+- 수동 스캔 정책: 'queue'는 실행 중인 자동 스캔 뒤에 대기, 'preempt'는 자동 스캔을 중단시키고 먼저 실행
+  (중단된 자동 스캔은 다시 대기열에 넣어 예약된 스캔을 잃지 않음)
+- 실행 중인 작업은 취소 이벤트로 협조적으로 중단
+"""
+import asyncio
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+JOB_PRIORITIES = {'positions': 0, 'manual': 1, 'smart': 2}
+JOB_LABELS = {'positions': '포지션 추적', 'manual': '수동 스캔', 'smart': '자동 스캔'}
+MANUAL_POLICIES = ('queue', 'preempt')
+
+
+@dataclass
+class Job:
+    """대기열 작업 하나"""
+    kind: str  # 'positions' | 'manual' | 'smart'
+    scan_kr: bool = True
+    scan_us: bool = True
+    seq: int = 0  # 요청 순서 (같은 우선순위 안에서 먼저 요청한 작업부터)
+    requests: int = 1  # 합쳐진 요청 수
+    cancel: threading.Event = field(default_factory=threading.Event)
+    preempted: bool = False
+
+    @property
+    def key(self) -> Tuple:
+        """합치기 기준 (종류 + 시장)"""
+        if self.kind == 'manual':
+            return (self.kind, self.scan_kr, self.scan_us)
+        return (self.kind,)
+
+    @property
+    def priority(self) -> int:
+        return JOB_PRIORITIES[self.kind]
+
+    @property
+    def label(self) -> str:
+        if self.kind != 'manual' or (self.scan_kr and self.scan_us):
+            return JOB_LABELS[self.kind]
+        return f"{JOB_LABELS[self.kind]} ({'한국' if self.scan_kr else '미국'})"
+
+
+class JobScheduler:
+    """우선순위/합치기/취소를 지원하는 작업 대기열 (이벤트 루프 스레드에서만 사용)"""
+
+    def __init__(self, manual_policy: str = 'queue'):
+        """
+        Args:
+            manual_policy: 수동 스캔 정책 ('queue' 또는 'preempt')
+        """
+        if manual_policy not in MANUAL_POLICIES:
+            raise ValueError(f"알 수 없는 수동 스캔 정책: {manual_policy}")
+        self.manual_policy = manual_policy
+        self.pending: List[Job] = []
+        self.running: Job | None = None
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def submit(self, kind: str, scan_kr: bool = True, scan_us: bool = True) -> Dict:
+        """
+        작업 요청
+
+        Args:
+            kind: 작업 종류 ('positions', 'manual', 'smart')
+            scan_kr: 한국 주식 스캔 여부 (수동 스캔)
+            scan_us: 미국 주식 스캔 여부 (수동 스캔)
+
+        Returns:
+            {'job': 작업, 'status': 'queued' | 'merged' (대기 중인 작업에 합침) |
+             'follow_up' (실행 중인 같은 작업이 끝난 뒤 다시 실행) | 'preempting' (자동 스캔을 중단시키고 대기),
+             'ahead': 먼저 실행될 작업 수}
+        """
+        request = Job(kind, scan_kr, scan_us)
+
+        running = self.running
+        for job in self.pending:
+            if job.key == request.key:
+                job.requests += 1
+                return {'job': job, 'status': 'merged', 'ahead': self._ahead(job)}
+
+        request.seq = next(self._seq)
+        self._enqueue(request)
+
+        status = 'queued'
+        if running is not None and running.key == request.key and not running.cancel.is_set():
+            status = 'follow_up'
+        if (kind == 'manual' and self.manual_policy == 'preempt'
+                and running is not None and running.kind == 'smart' and not running.cancel.is_set()):
+            running.preempted = True
+            running.cancel.set()
+            status = 'preempting'
+
+        return {'job': request, 'status': status, 'ahead': self._ahead(request)}
+
+    def _enqueue(self, job: Job):
+        self.pending.append(job)
+        self.pending.sort(key=lambda j: (j.priority, j.seq))
+        self._wakeup.set()
+
+    def _ahead(self, job: Job) -> int:
+        running = 1 if self.running is not None and not self.running.preempted else 0
+        return running + self.pending.index(job)
+
+    async def next(self) -> Job:
+        """우선순위가 가장 높은 대기 작업을 꺼내 실행 중으로 표시 (없으면 대기)"""
+        while not self.pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        job = self.pending.pop(0)
+        self.running = job
+        return job
+
+    def finish(self, job: Job):
+        """
+        작업 종료 처리
+
+        중단된 자동 스캔은 원래 요청 순서로 다시 대기열에 넣는다 (대기 중인 같은 작업이 있으면 합침).
+        """
+        if self.running is job:
+            self.running = None
+        if not job.preempted:
+            return
+
+        for pending in self.pending:
+            if pending.key == job.key:
+                pending.requests += job.requests
+                pending.seq = min(pending.seq, job.seq)
+                self.pending.sort(key=lambda j: (j.priority, j.seq))
+                return
+        self._enqueue(Job(job.kind, job.scan_kr, job.scan_us, seq=job.seq, requests=job.requests))
+
+    def cancel_running(self) -> Job | None:
+        """실행 중인 작업 취소 요청 (취소한 작업 또는 None)"""
+        job = self.running
+        if job is None or job.cancel.is_set():
+            return None
+        job.cancel.set()
+        return job
+
+    def cancel_all(self) -> int:
+        """
+        실행 중인 작업과 대기 작업 모두 취소 (취소한 작업 수)
+
+        수동 스캔에 밀려 중단 중인 자동 스캔도 취소로 바꿔 finish()에서 다시 대기열에 넣지 않는다.
+        """
+        count = len(self.pending)
+        self.pending.clear()
+        job = self.running
+        if job is not None and (job.preempted or not job.cancel.is_set()):
+            job.preempted = False
+            job.cancel.set()
+            count += 1
+        return count
@@ -0,0 +1,136 @@
+"""
+파이프라인 스캔
+- 조회 → 분석 → 알림 3단계를 크기 제한 대기열로 연결 (앞 단계가 너무 앞서가지 않도록 역압)
+- 조회: 데이터 제공자별 작업 스레드 수로 동시 요청 수 제한
+- 분석: 여러 작업 스레드 (종목별 증분 감지 상태를 봇과 공유하므로 같은 프로세스에서 실행)
+- 알림: 단일 스레드가 결과를 받아 전송하므로 전송 대기 시간이 조회/분석을 막지 않음
+"""
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+# (종목 코드, 신호 리스트) - 신호가 None이면 조회/분석 오류
+Outcome = Tuple[str, List[Dict] | None]
+
+
+@dataclass
+class ScanJob:
+    """스캔 작업 하나 (종목 하나 또는 한 번에 조회하는 종목 묶음)"""
+    index: int  # 결과 정렬 순서
+    provider: str  # 동시 요청 수를 제한할 데이터 제공자 (시장별: 'US' yfinance, 'KR' pykrx)
+    tickers: List[str]
+    fetch: Callable[[], Any]  # 조회 단계에서 실행 (네트워크)
+    analyze: Callable[[Any], List[Outcome]]  # 분석 단계에서 조회 결과로 실행
+
+
+def run_pipeline(
+    jobs: List[ScanJob],
+    on_result: Callable[[ScanJob, str, List[Dict] | None], None],
+    fetch_limits: Dict[str, int] | None = None,
+    analysis_workers: int = 0,
+    queue_size: int = 64,
+    cancel: threading.Event | None = None
+) -> List[Outcome]:
+    """
+    스캔 작업을 조회/분석/알림 단계로 나눠 동시에 실행
+
+    Args:
+        jobs: 스캔 작업 리스트
+        on_result: 종목별 결과 처리 함수 (작업, 종목 코드, 신호 리스트 또는 None) - 알림 스레드에서 완료 순서대로 호출
+        fetch_limits: {제공자: 동시 조회 수} (없는 제공자는 1)
+        analysis_workers: 분석 작업 스레드 수 (0이면 CPU 수)
+        queue_size: 단계 사이 대기열 크기
+        cancel: 설정되면 남은 작업의 조회/분석/알림을 건너뛰는 취소 이벤트
+
+    Returns:
+        [(종목 코드, 신호 리스트 또는 None)] (작업 index 순서, 완료 순서와 무관, 취소 시 알림까지 끝난 작업만)
+    """
+    if not jobs:
+        return []
+
+    fetch_limits = fetch_limits or {}
+    analysis_workers = analysis_workers or os.cpu_count() or 1
+
+    # 제공자별 입력 대기열 (작업 목록은 이미 메모리에 있으므로 크기 제한 없음)
+    inputs: Dict[str, queue.Queue] = {}
+    for job in jobs:
+        inputs.setdefault(job.provider, queue.Queue()).put(job)
+    analysis_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    notify_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    results: Dict[int, List[Outcome]] = {}
+    cancel = cancel or threading.Event()
+
+    def fetch_worker(jobs_queue: queue.Queue):
+        while True:
+            job = jobs_queue.get()
+            if job is None:
+                return
+            if cancel.is_set():
+                continue
+            try:
+                analysis_queue.put((job, job.fetch(), None))
+            except Exception as e:
+                analysis_queue.put((job, None, e))
+
+    def analysis_worker():
+        while True:
+            item = analysis_queue.get()
+            if item is None:
+                return
+            job, payload, error = item
+            if cancel.is_set():
+                continue
+            outcomes = None
+            if error is None:
+                try:
+                    outcomes = job.analyze(payload)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                print(f"  ❌ {', '.join(job.tickers[:3])}{' 외' if len(job.tickers) > 3 else ''} 오류: {error}")
+                outcomes = [(ticker, None) for ticker in job.tickers]
+            notify_queue.put((job, outcomes))
+
+    def notify_worker():
+        while True:
+            item = notify_queue.get()
+            if item is None:
+                return
+            job, outcomes = item
+            if cancel.is_set():
+                continue
+            results[job.index] = outcomes
+            for ticker, signals in outcomes:
+                try:
+                    on_result(job, ticker, signals)
+                except Exception as e:
+                    print(f"  ❌ {ticker} 알림 처리 오류: {e}")
+
+    fetchers = []
+    for provider, jobs_queue in inputs.items():
+        workers = max(1, min(fetch_limits.get(provider, 1), jobs_queue.qsize()))
+        for _ in range(workers):
+            jobs_queue.put(None)
+        fetchers.extend(
+            threading.Thread(target=fetch_worker, args=(jobs_queue,), daemon=True)
+            for _ in range(workers)
+        )
+    analyzers = [threading.Thread(target=analysis_worker, daemon=True) for _ in range(analysis_workers)]
+    notifier = threading.Thread(target=notify_worker, daemon=True)
+
+    for thread in (*fetchers, *analyzers, notifier):
+        thread.start()
+
+    # 앞 단계가 모두 끝난 뒤 다음 단계에 종료 표시 전달
+    for thread in fetchers:
+        thread.join()
+    for _ in analyzers:
+        analysis_queue.put(None)
+    for thread in analyzers:
+        thread.join()
+    notify_queue.put(None)
+    notifier.join()
+
+    return [outcome for index in sorted(results) for outcome in results[index]]
@@ -0,0 +1,309 @@
+"""
+asyncio 봇 런타임
+- 이벤트 루프 하나에서 스캔 스케줄러, 텔레그램 롱 폴링, 명령 처리, 작업 실행을 협력 태스크로 실행
+- 자동 스캔은 거래소 달력 기준 (개장 후/폐장 전 오프셋, 장중 간격), 휴장 중에는 다음 정규장까지 대기
+- 포지션 추적은 포지션이 있는 시장의 스캔 시각에만 요청 (휴장 중에는 시세를 조회하지 않음)
+- 스캔과 포지션 추적은 작업 대기열(JobScheduler)을 거쳐 한 번에 하나씩 실행 (겹치지 않음)
+- 데이터 조회/텔레그램 전송 같은 블로킹 호출은 스레드로 넘기고, 루프는 기다리는 동안 CPU를 쓰지 않음
+"""
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, TYPE_CHECKING
+
+from ..market.calendar import get_market_calendar, next_scan_time
+from ..market.status import get_market_status
+from .jobs import Job, JobScheduler
+
+if TYPE_CHECKING:
+    from .detector import BreakoutDetector
+
+# 텔레그램 롱 폴링 대기 시간 (초, 새 메시지가 오면 바로 반환)
+POLL_TIMEOUT = 30
+# 폴링이 이 시간보다 빨리 빈 결과로 끝나면 (네트워크 오류 등) 잠시 쉬었다 재시도
+POLL_RETRY_SECONDS = 5
+# 긴 대기를 나눠 자는 단위 (초, 절전/시계 변경 후에도 목표 시각을 다시 계산)
+SLEEP_CHUNK_SECONDS = 600
+
+
+async def run_blocking(func: Callable, *args):
+    """
+    블로킹 함수를 데몬 스레드에서 실행하고 결과를 기다림
+
+    종료 시 진행 중인 조회/롱 폴링이 프로세스 종료를 막지 않도록 실행기 대신 데몬 스레드를 쓴다.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def target():
+        try:
+            result, error = func(*args), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(deliver, result, error)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (종료 중)
+            pass
+
+    threading.Thread(target=target, daemon=True).start()
+    return await future
+
+
+async def sleep_until(when: datetime):
+    """지정 시각(timezone 포함)까지 대기"""
+    while True:
+        remaining = (when - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, SLEEP_CHUNK_SECONDS))
+
+
+class BotRuntime:
+    """이벤트 루프 기반 봇 실행기"""
+
+    def __init__(self, detector: 'BreakoutDetector'):
+        """
+        Args:
+            detector: 스캔/명령/포지션 로직을 가진 BreakoutDetector
+        """
+        self.detector = detector
+        self.jobs: JobScheduler | None = None
+        self._commands: asyncio.Queue | None = None
+        self._stop: asyncio.Event | None = None
+
+    # ========================================
+    # 작업 실행
+    # ========================================
+
+    async def _job_worker(self):
+        """대기열 작업을 우선순위 순서로 하나씩 실행"""
+        while True:
+            job = await self.jobs.next()
+            self.detector.is_scanning = job.kind != 'positions'
+            try:
+                await self._run_job(job)
+            except Exception as e:
+                print(f"❌ {job.label} 중 오류: {e}")
+                if job.kind == 'manual':
+                    await self.send(f"❌ 스캔 중 오류가 발생했습니다: {str(e)}")
+            finally:
+                self.detector.is_scanning = False
+                self.jobs.finish(job)
+
+    async def _run_job(self, job: Job):
+        detector = self.detector
+        if job.kind == 'positions':
+            # 대기열에서 기다리는 사이 장이 끝났을 수 있으므로 실행 시점에 장중인 시장만 확인
+            status = get_market_status()
+            markets = [market for market in ('US', 'KR') if status[market.lower()]]
+            if markets:
+                await run_blocking(detector.check_positions, job.cancel, markets)
+            return
+
+        if job.kind == 'smart':
+            await run_blocking(detector.run_smart_scan, False, job.cancel)
+            if job.preempted:
+                print("⏸️  수동 스캔을 먼저 실행하기 위해 자동 스캔을 중단했습니다 (대기열에 다시 추가)")
+            return
+
+        print(f"\n🔔 {job.label} 시작 (요청 {job.requests}건)")
+        await run_blocking(detector.run_manual_scan, job.scan_kr, job.scan_us, job.cancel)
+        if job.cancel.is_set():
+            await self.send(f"⏹️ {job.label}이 취소되었습니다.")
+        else:
+            await self.send(f"✅ {job.label} 완료!")
+
+    def _submit_smart(self):
+        result = self.jobs.submit('smart')
+        if result['status'] == 'merged':
+            print("\n⏸️  이전 자동 스캔 요청이 아직 대기 중입니다. 이번 요청은 합쳐집니다.\n")
+        elif result['status'] == 'follow_up':
+            print("\n⏸️  이전 자동 스캔이 아직 실행 중입니다. 끝나면 이어서 다시 스캔합니다.\n")
+
+    async def _scheduler(self):
+        """
+        거래소 달력 기준 자동 스캔 요청
+
+        정규장마다 개장 + open_offset, 이후 interval 간격, 폐장 - close_offset에 스캔하고,
+        휴장 중(주말, 휴장일, 장 마감 후)에는 다음 정규장의 첫 스캔 시각까지 대기한다.
+        """
+        scan = self.detector.settings.scan
+        markets = [
+            market for market, enabled in (('US', scan.scan_us_market), ('KR', scan.scan_kr_market))
+            if enabled
+        ]
+        if not markets:
+            print("⏸️  자동 스캔할 시장이 없습니다 (SCAN_US_MARKET, SCAN_KR_MARKET)")
+            await self._stop.wait()
+            return
+
+        # 거래소 달력 로드는 시간이 걸리므로 스레드에서 미리 로드
+        for market in markets:
+            await run_blocking(get_market_calendar, market)
+
+        # 시작 시 장중인 시장이 있으면 바로 스캔
+        status = get_market_status()
+        if any(status[market.lower()] for market in markets):
+            self._submit_smart()
+
+        while True:
+            when, due = next_scan_time(
+                datetime.now(timezone.utc), markets,
+                scan.interval_seconds, scan.open_offset_minutes, scan.close_offset_minutes
+            )
+            print(f"⏰ 다음 스캔: {when.astimezone():%Y-%m-%d %H:%M:%S} ({', '.join(due)})")
+            await sleep_until(when)
+            self._submit_smart()
+
+    def _position_markets(self) -> List[str]:
+        """보유 포지션이 있는 시장"""
+        return sorted({pos['market'] for pos in self.detector.positions.get_all()})
+
+    async def _position_monitor(self):
+        """
+        포지션 추적 요청 (스캔보다 우선)
+
+        포지션이 있는 시장의 스캔 시각(거래소 달력 기준)에만 요청하고 휴장 중에는 쉰다.
+        대기 중에 새 포지션이 생길 수 있으므로 최소 interval마다 대상 시장을 다시 확인한다.
+        """
+        scan = self.detector.settings.scan
+
+        # 시작 시 장중인 시장에 포지션이 있으면 바로 확인
+        status = get_market_status()
+        if any(status[market.lower()] for market in self._position_markets()):
+            self.jobs.submit('positions')
+
+        while True:
+            now = datetime.now(timezone.utc)
+            recheck = now + timedelta(seconds=scan.interval_seconds)
+            markets = self._position_markets()
+            if markets:
+                when, _ = next_scan_time(
+                    now, markets, scan.interval_seconds, scan.open_offset_minutes, scan.close_offset_minutes
+                )
+                if when <= recheck:
+                    await sleep_until(when)
+                    self.jobs.submit('positions')
+                    continue
+            await sleep_until(recheck)
+
+    # ========================================
+    # 텔레그램
+    # ========================================
+
+    async def send(self, message: str) -> bool:
+        """텔레그램 메시지 전송 (스레드에서 실행)"""
+        return await run_blocking(self.detector.telegram.send_message, message)
+
+    async def _listener(self):
+        """텔레그램 롱 폴링 (새 메시지가 오면 바로 명령 대기열에 넣음)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            try:
+                updates = await run_blocking(self.detector.telegram.get_updates, POLL_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️  리스너 오류: {e}")
+                updates = []
+
+            for update in updates:
+                self._commands.put_nowait(update['text'])
+
+            # 오류로 즉시 빈 결과가 돌아오면 바쁜 재시도 방지
+            if not updates and loop.time() - started < 1:
+                await asyncio.sleep(POLL_RETRY_SECONDS)
+
+    async def _command_worker(self):
+        """명령을 받은 순서대로 처리 (폴링은 계속 진행)"""
+        while True:
+            message_text = await self._commands.get()
+            try:
+                await self._handle_command(message_text)
+            except Exception as e:
+                print(f"⚠️  명령 처리 오류: {e}")
+
+    async def _handle_command(self, message_text: str):
+        # /positions, /close는 현재가를 조회하므로 스레드에서 처리
+        reply = await run_blocking(self.detector.process_command, message_text)
+
+        if reply == 'SCAN_KR':
+            await self.send(self._format_submit(self.jobs.submit('manual', scan_kr=True, scan_us=False)))
+
+        elif reply == 'CANCEL':
+            job = self.jobs.cancel_running()
+            if job is None:
+                await self.send("ℹ️ 진행 중인 작업이 없습니다.")
+            else:
+                await self.send(f"⏹️ {job.label} 취소를 요청했습니다.")
+
+        elif reply == 'CANCEL_ALL':
+            count = self.jobs.cancel_all()
+            await self.send(f"⏹️ 작업 {count}개를 취소했습니다." if count else "ℹ️ 진행 중이거나 대기 중인 작업이 없습니다.")
+
+        elif reply:
+            await self.send(reply)
+
+    @staticmethod
+    def _format_submit(result: dict) -> str:
+        """수동 스캔 요청 결과 안내 메시지"""
+        job, status, ahead = result['job'], result['status'], result['ahead']
+        if status == 'follow_up':
+            return f"📥 같은 {job.label}이 진행 중입니다. 끝나면 최신 데이터로 다시 스캔합니다."
+        if status == 'merged':
+            return f"ℹ️ 같은 {job.label}이 이미 대기 중입니다 (앞 작업 {ahead}개). 한 번만 실행합니다."
+        if status == 'preempting':
+            return f"⏹️ 자동 스캔을 중단하고 {job.label}을 먼저 실행합니다."
+        if ahead:
+            return f"📥 {job.label} 요청을 대기열에 추가했습니다 (앞 작업 {ahead}개)."
+        return "🔍 스캔을 시작합니다..."
+
+    # ========================================
+    # 실행
+    # ========================================
+
+    def stop(self):
+        """실행 중인 run()을 종료 (루프 스레드에서 호출)"""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self):
+        """모든 태스크 실행 (stop() 또는 취소 시 모든 태스크를 취소하고 반환)"""
+        self.jobs = JobScheduler(self.detector.settings.scan.manual_scan_policy)
+        self._commands = asyncio.Queue()
+        self._stop = asyncio.Event()
+
+        start_msg = self.detector.get_start_message()
+        await self.send(start_msg)
+        print(start_msg)
+
+        tasks = [
+            asyncio.create_task(self._position_monitor(), name='positions'),
+            asyncio.create_task(self._scheduler(), name='scheduler'),
+            asyncio.create_task(self._listener(), name='listener'),
+            asyncio.create_task(self._command_worker(), name='commands'),
+            asyncio.create_task(self._job_worker(), name='jobs')
+        ]
+        print("✅ 텔레그램 명령어 리스너 시작")
+        stop_task = asyncio.create_task(self._stop.wait(), name='stop')
+
+        try:
+            done, _ = await asyncio.wait([stop_task, *tasks], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stop_task and not task.cancelled() and task.exception():
+                    print(f"❌ {task.get_name()} 태스크 오류: {task.exception()}")
+        finally:
+            # 스레드에서 실행 중인 작업에도 취소 알림 (남은 종목 건너뜀)
+            self.jobs.cancel_all()
+            for task in (stop_task, *tasks):
+                task.cancel()
+            await asyncio.gather(stop_task, *tasks, return_exceptions=True)
+            self.detector.is_scanning = False
@@ -0,0 +1,175 @@
+"""
+신호 알림 상태 저장소
+- 키: 시장 + 종목 + 패턴 + 피벗(돌파가) - 같은 피벗의 반복 감지는 억제 기간 동안 다시 알리지 않음
+- 다시 알리는 경우: 새 피벗 돌파, 알린 피벗 대비 상승률이 breakout_max를 넘음 (매수 범위 이탈, 1회)
+- 매수 범위를 벗어난 종목은 억제 기간이 끝날 때까지 스캔에서 제외
+- 파일에 저장해 봇을 다시 시작해도 유지 (억제 기간이 지난 항목은 자동 삭제)
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+
+class SignalStateStore:
+    """종목별 신호 알림 상태 (스캔 알림 스레드와 분석 스레드에서 함께 사용)"""
+
+    def __init__(self, state_file: str = "signal_state.json", suppress_hours: float = 24.0):
+        """
+        Args:
+            state_file: 상태 저장 파일 경로
+            suppress_hours: 같은 신호 재알림 억제 기간 (시간, 첫 알림 기준)
+        """
+        self.state_file = state_file
+        self.window = timedelta(hours=suppress_hours)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+        self._prune(datetime.now())
+
+    @staticmethod
+    def key(market: str, ticker: str, pattern: str, pivot: float) -> str:
+        """상태 키 (피벗은 유효숫자 6자리)"""
+        return f"{market}:{ticker}:{pattern}:{float(pivot):.6g}"
+
+    # ========================================
+    # 저장/로드
+    # ========================================
+
+    def _load(self) -> Dict[str, Dict]:
+        """상태 파일에서 로드"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('signals', {})
+            except Exception as e:
+                print(f"⚠️  신호 상태 로드 실패: {e}")
+        return {}
+
+    def _save(self) -> bool:
+        """상태 파일에 저장"""
+        try:
+            data = {
+                'signals': self.entries,
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"❌ 신호 상태 저장 실패: {e}")
+            return False
+
+    def _prune(self, now: datetime) -> int:
+        """억제 기간이 지난 항목 삭제"""
+        expired = [key for key, entry in self.entries.items() if not self._alive(entry, now)]
+        for key in expired:
+            del self.entries[key]
+        return len(expired)
+
+    def _alive(self, entry: Dict, now: datetime) -> bool:
+        return now - datetime.fromisoformat(entry['fired_at']) < self.window
+
+    def _ticker_entries(self, market: str, ticker: str, now: datetime, pattern: str | None = None) -> List[Dict]:
+        """억제 기간 안의 종목 항목 (최근 알림 순)"""
+        entries = [
+            entry for entry in self.entries.values()
+            if entry['market'] == market and entry['ticker'] == ticker
+            and (pattern is None or entry['pattern'] == pattern) and self._alive(entry, now)
+        ]
+        return sorted(entries, key=lambda entry: entry['fired_at'], reverse=True)
+
+    # ========================================
+    # 알림 판정
+    # ========================================
+
+    def on_signal(self, signal: Dict, now: datetime | None = None) -> str | None:
+        """
+        감지된 신호 기록 및 알림 여부 판정
+
+        Args:
+            signal: 신호 딕셔너리 (ticker, market, pattern, resistance, breakout_pct)
+            now: 기준 시각 (None이면 현재)
+
+        Returns:
+            'new' (첫 알림), 'new_pivot' (억제 기간 안에 다른 피벗으로 다시 돌파),
+            None (같은 피벗 반복 - 알리지 않음)
+        """
+        now = now or datetime.now()
+        market, ticker, pattern = signal['market'], signal['ticker'], signal['pattern']
+        key = self.key(market, ticker, pattern, signal['resistance'])
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and self._alive(entry, now):
+                entry['last_seen'] = now.isoformat(timespec='seconds')
+                entry['breakout_pct'] = signal['breakout_pct']
+                entry['count'] += 1
+                self._save()
+                return None
+
+            kind = 'new_pivot' if self._ticker_entries(market, ticker, now, pattern) else 'new'
+            self._prune(now)
+            self.entries[key] = {
+                'market': market,
+                'ticker': ticker,
+                'pattern': pattern,
+                'pivot': float(signal['resistance']),
+                'fired_at': now.isoformat(timespec='seconds'),
+                'last_seen': now.isoformat(timespec='seconds'),
+                'breakout_pct': signal['breakout_pct'],
+                'count': 1,
+                'state': 'active'
+            }
+            self._save()
+            return kind
+
+    def active_pivot(self, market: str, ticker: str, pattern: str, now: datetime | None = None) -> float | None:
+        """
+        매수 범위 이탈을 지켜볼 피벗 (억제 기간 안의 최근 알림이 아직 범위 안일 때만)
+
+        Returns:
+            피벗 가격 또는 None
+        """
+        now = now or datetime.now()
+        with self._lock:
+            entries = self._ticker_entries(market, ticker, now, pattern)
+        if not entries or entries[0]['state'] != 'active':
+            return None
+        return entries[0]['pivot']
+
+    def on_extended(self, signal: Dict, now: datetime | None = None) -> bool:
+        """
+        매수 범위 이탈 기록
+
+        Args:
+            signal: 알린 피벗(resistance)과 현재 상승률(breakout_pct)을 담은 딕셔너리
+            now: 기준 시각 (None이면 현재)
+
+        Returns:
+            이번에 처음 이탈했으면 True (알림 대상)
+        """
+        now = now or datetime.now()
+        key = self.key(signal['market'], signal['ticker'], signal['pattern'], signal['resistance'])
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or entry['state'] != 'active' or not self._alive(entry, now):
+                return False
+            entry['state'] = 'extended'
+            entry['last_seen'] = now.isoformat(timespec='seconds')
+            entry['breakout_pct'] = signal['breakout_pct']
+            self._save()
+            return True
+
+    def should_skip(self, market: str, ticker: str, now: datetime | None = None) -> bool:
+        """억제 기간 안에 알린 신호가 이미 매수 범위를 벗어난 종목이면 True (스캔 제외)"""
+        now = now or datetime.now()
+        with self._lock:
+            entries = self._ticker_entries(market, ticker, now)
+        return bool(entries) and entries[0]['state'] == 'extended'
+
+    def clear(self):
+        """상태 전체 삭제"""
+        with self._lock:
+            self.entries.clear()
+            self._save()
@@ -42,10 +42,19 @@ class TradingSettings:
 @dataclass
 class ScanSettings:
     """스캔 설정"""
-    interval_seconds: int = 1800  # 30분
+    interval_seconds: int = 1800  # 30분 (장중 스캔 간격)
+    open_offset_minutes: float = 5  # 개장 후 첫 스캔까지 (분)
+    close_offset_minutes: float = 10  # 폐장 전 마지막 스캔 (분)
     scan_us_market: bool = True
     scan_kr_market: bool = True
     request_delay: float = 1.0
+    us_fetch_concurrency: int = 2  # 미국 주식 동시 조회 수 (묶음 단위)
+    kr_fetch_concurrency: int = 4  # 한국 주식 동시 조회 수 (종목 단위)
+    analysis_workers: int = 0  # 분석 작업 스레드 수 (0이면 CPU 수)
+    queue_size: int = 64  # 조회/분석/알림 단계 사이 대기열 크기
+    notify_interval: float = 1.0  # 신호 알림 전송 간격 (초, 알림 스레드에서만 대기)
+    manual_scan_policy: str = "queue"  # 자동 스캔 중 수동 스캔 요청 ("queue" 뒤에 대기 / "preempt" 자동 스캔 중단)
+    signal_suppress_hours: float = 24.0  # 같은 피벗 신호 재알림 억제 기간 (시간)
 
 
 @dataclass
@@ -53,6 +62,13 @@ class DataSettings:
     """데이터 설정"""
     analysis_period_days: int = 120  # 한국 주식
     analysis_period: str = "6mo"  # 미국 주식
+    cache_dir: str = "cache/bars"  # 일봉 로컬 캐시 ("" 이면 비활성화)
+    us_batch_size: int = 100  # 미국 주식 묶음 조회 단위
+    us_batch_threads: int = 8  # 미국 주식 묶음 조회 스레드 수
+    kr_names_file: str = "cache/kr_names.json"  # 한국 종목명 인덱스 (하루 1회 갱신)
+    kr_ingest_mode: str = "ticker"  # 한국 주식 수집 방식 ("ticker" 종목별 / "snapshot" 전종목 일별)
+    backtest_cache_dir: str = "cache/backtest"  # 백테스트 결과 캐시 ("" 이면 비활성화)
+    backtest_cache_max_mb: int = 512  # 백테스트 결과 캐시 크기 상한 (MB)
 
 
 @dataclass
@@ -89,6 +105,7 @@ class Settings:
     # 파일 경로
     watchlist_file: str = "watchlist.json"
     positions_file: str = "positions.json"
+    signal_state_file: str = "signal_state.json"
 
 
 def load_settings() -> Settings:
@@ -99,6 +116,7 @@ def load_settings() -> Settings:
         TELEGRAM_TOKEN: 텔레그램 봇 토큰
         TELEGRAM_CHAT_ID: 텔레그램 채팅 ID
         SCAN_INTERVAL: 스캔 주기 (초)
+        BAR_CACHE_DIR: 일봉 캐시 디렉토리 (빈 문자열이면 비활성화)
 
     Returns:
         Settings 인스턴스
@@ -112,6 +130,8 @@ def load_settings() -> Settings:
         settings.telegram.chat_id = os.environ['TELEGRAM_CHAT_ID']
     if os.environ.get('SCAN_INTERVAL'):
         settings.scan.interval_seconds = int(os.environ['SCAN_INTERVAL'])
+    if 'BAR_CACHE_DIR' in os.environ:
+        settings.data.cache_dir = os.environ['BAR_CACHE_DIR']
 
     # config.py에서 로드 (있는 경우)
     try:
@@ -129,6 +149,38 @@ def load_settings() -> Settings:
             settings.scan.scan_us_market = legacy_config.SCAN_US_MARKET
         if hasattr(legacy_config, 'SCAN_KR_MARKET'):
             settings.scan.scan_kr_market = legacy_config.SCAN_KR_MARKET
+        if hasattr(legacy_config, 'SCAN_OPEN_OFFSET_MINUTES'):
+            settings.scan.open_offset_minutes = legacy_config.SCAN_OPEN_OFFSET_MINUTES
+        if hasattr(legacy_config, 'SCAN_CLOSE_OFFSET_MINUTES'):
+            settings.scan.close_offset_minutes = legacy_config.SCAN_CLOSE_OFFSET_MINUTES
+        if hasattr(legacy_config, 'US_FETCH_CONCURRENCY'):
+            settings.scan.us_fetch_concurrency = legacy_config.US_FETCH_CONCURRENCY
+        if hasattr(legacy_config, 'KR_FETCH_CONCURRENCY'):
+            settings.scan.kr_fetch_concurrency = legacy_config.KR_FETCH_CONCURRENCY
+        if hasattr(legacy_config, 'SCAN_ANALYSIS_WORKERS'):
+            settings.scan.analysis_workers = legacy_config.SCAN_ANALYSIS_WORKERS
+        if hasattr(legacy_config, 'QUEUE_SIZE'):
+            settings.scan.queue_size = legacy_config.QUEUE_SIZE
+        if hasattr(legacy_config, 'NOTIFY_INTERVAL'):
+            settings.scan.notify_interval = legacy_config.NOTIFY_INTERVAL
+        if hasattr(legacy_config, 'MANUAL_SCAN_POLICY'):
+            settings.scan.manual_scan_policy = legacy_config.MANUAL_SCAN_POLICY
+        if hasattr(legacy_config, 'SIGNAL_SUPPRESS_HOURS'):
+            settings.scan.signal_suppress_hours = legacy_config.SIGNAL_SUPPRESS_HOURS
+
+        # 데이터 설정
+        if hasattr(legacy_config, 'BAR_CACHE_DIR'):
+            settings.data.cache_dir = legacy_config.BAR_CACHE_DIR
+        if hasattr(legacy_config, 'US_BATCH_SIZE'):
+            settings.data.us_batch_size = legacy_config.US_BATCH_SIZE
+        if hasattr(legacy_config, 'US_BATCH_THREADS'):
+            settings.data.us_batch_threads = legacy_config.US_BATCH_THREADS
+        if hasattr(legacy_config, 'KR_INGEST_MODE'):
+            settings.data.kr_ingest_mode = legacy_config.KR_INGEST_MODE
+        if hasattr(legacy_config, 'BACKTEST_CACHE_DIR'):
+            settings.data.backtest_cache_dir = legacy_config.BACKTEST_CACHE_DIR
+        if hasattr(legacy_config, 'BACKTEST_CACHE_MAX_MB'):
+            settings.data.backtest_cache_max_mb = legacy_config.BACKTEST_CACHE_MAX_MB
 
         # 패턴 설정
         if hasattr(legacy_config, 'VOLUME_SURGE_MIN'):
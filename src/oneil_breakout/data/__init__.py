@@ -1,5 +1,20 @@
 """데이터 수집 모듈"""
-from .us_stock import get_us_stock_data
+from .cache import BarStore, configure_bar_store, get_bar_store
+from .us_stock import get_us_stock_data, get_us_stocks_data
 from .kr_stock import get_kr_stock_data, get_kr_stock_name
+from .kr_names import configure_kr_name_index, get_kr_name_index
+from .kr_snapshot import get_kr_snapshot_data, ingest_kr_snapshots
 
-__all__ = ['get_us_stock_data', 'get_kr_stock_data', 'get_kr_stock_name']
+__all__ = [
+    'BarStore',
+    'configure_bar_store',
+    'get_bar_store',
+    'get_us_stock_data',
+    'get_us_stocks_data',
+    'get_kr_stock_data',
+    'get_kr_stock_name',
+    'configure_kr_name_index',
+    'get_kr_name_index',
+    'get_kr_snapshot_data',
+    'ingest_kr_snapshots',
+]
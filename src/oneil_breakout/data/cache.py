@@ -0,0 +1,326 @@
+"""OHLCV 로컬 캐시 (시장/종목별 컬럼 저장소)"""
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..market.calendar import MARKET_HOURS, get_market_calendar
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# fetch(시작일) -> 시작일 이후 전체 일봉
+Fetcher = Callable[[pd.Timestamp], pd.DataFrame | None]
+
+
+class BarStore:
+    """
+    종목별 일봉을 npz 컬럼 파일로 저장하는 증분 캐시
+
+    파일 구조: {cache_dir}/{market}/{ticker}.npz
+        index: 날짜 (int64 ns, tz가 있으면 UTC 기준)
+        tz / index_name: 인덱스 복원 정보
+        coverage_start: 캐시가 보장하는 최초 조회 시작일
+        saved_at: 저장 시각 (int64 ns, UTC) - 마지막 봉이 완성봉인지 판단
+        Open/High/Low/Close/Volume: 컬럼별 배열
+    """
+
+    def __init__(self, cache_dir: str = "cache/bars"):
+        """
+        Args:
+            cache_dir: 캐시 저장 디렉토리
+        """
+        self.cache_dir = cache_dir
+
+    def path(self, market: str, ticker: str) -> str:
+        """캐시 파일 경로"""
+        return os.path.join(self.cache_dir, market, f"{ticker}.npz")
+
+    def load(self, market: str, ticker: str) -> Tuple[pd.DataFrame | None, pd.Timestamp | None]:
+        """
+        캐시된 일봉 로드
+
+        Args:
+            market: 시장 ('US' 또는 'KR')
+            ticker: 종목 코드
+
+        Returns:
+            (OHLCV 데이터프레임, 커버리지 시작일) 또는 (None, None)
+        """
+        df, coverage_start, _ = self._read(market, ticker)
+        return df, coverage_start
+
+    def _read(self, market: str, ticker: str) -> Tuple[pd.DataFrame | None, pd.Timestamp | None, pd.Timestamp | None]:
+        """캐시 파일 읽기 (데이터프레임, 커버리지 시작일, 저장 시각 - 이전 형식 파일은 None)"""
+        path = self.path(market, ticker)
+        if not os.path.exists(path):
+            return None, None, None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                tz = str(data['tz'])
+                if tz:
+                    index = pd.to_datetime(data['index'], unit='ns', utc=True).tz_convert(tz)
+                else:
+                    index = pd.to_datetime(data['index'], unit='ns')
+                index.name = str(data['index_name']) or None
+
+                df = pd.DataFrame({col: data[col] for col in OHLCV_COLUMNS}, index=index)
+                coverage_start = pd.Timestamp(int(data['coverage_start']), unit='ns')
+                saved_at = (
+                    pd.Timestamp(int(data['saved_at']), unit='ns', tz='UTC') if 'saved_at' in data.files else None
+                )
+            return df, coverage_start, saved_at
+        except Exception as e:
+            print(f"⚠️  {ticker} 캐시 로드 실패: {e}")
+            return None, None, None
+
+    def save(self, market: str, ticker: str, df: pd.DataFrame, coverage_start: pd.Timestamp) -> bool:
+        """
+        일봉 캐시 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            market: 시장
+            ticker: 종목 코드
+            df: OHLCV 데이터프레임
+            coverage_start: 커버리지 시작일
+
+        Returns:
+            저장 성공 여부
+        """
+        path = self.path(market, ticker)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            index = pd.DatetimeIndex(df.index)
+            arrays = {col: df[col].to_numpy() for col in OHLCV_COLUMNS}
+
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    index=index.as_unit('ns').asi8,
+                    tz=np.array(str(index.tz) if index.tz is not None else ''),
+                    index_name=np.array(index.name or ''),
+                    coverage_start=np.array(pd.Timestamp(coverage_start).as_unit('ns').value),
+                    saved_at=np.array(pd.Timestamp.now(tz='UTC').as_unit('ns').value),
+                    **arrays
+                )
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"⚠️  {ticker} 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def get_bars(
+        self,
+        market: str,
+        ticker: str,
+        start: datetime,
+        fetch: Fetcher,
+        end: datetime | None = None
+    ) -> pd.DataFrame | None:
+        """
+        캐시 우선 일봉 조회
+
+        캐시에 마지막으로 저장된 완성봉 이후 구간(형성 중인 당일봉 포함)만 새로 받아
+        병합한다. 겹치는 완성봉의 종가가 달라졌으면 (수정주가 반영) 전체를 다시 받는다.
+
+        Args:
+            market: 시장
+            ticker: 종목 코드
+            start: 조회 시작일
+            fetch: 시작일 이후 일봉을 가져오는 함수
+            end: 조회 종료일 (종료일 봉이 완성봉으로 캐시에 있으면 조회 생략)
+
+        Returns:
+            start 이후 OHLCV 데이터프레임 또는 None
+        """
+        start_day = pd.Timestamp(start).normalize()
+        cached, coverage_start, saved_at = self._read(market, ticker)
+
+        if cached is None or cached.empty or start_day < coverage_start:
+            merged = _normalize(fetch(start_day))
+            coverage_start = start_day
+        elif end is not None and _covers_final(cached, pd.Timestamp(end).normalize(), market, saved_at):
+            return _slice_from(cached, start_day)
+        else:
+            refresh_from = _refresh_from(cached)
+            fetched = _normalize(fetch(_naive_day(refresh_from)))
+
+            if fetched is None:
+                merged = None
+            elif _overlap_matches(cached, fetched, refresh_from):
+                merged = pd.concat([cached[cached.index < fetched.index[0]], fetched])
+            else:
+                print(f"  ♻️  {ticker} 수정주가 변경 감지 - 전체 재조회")
+                merged = _normalize(fetch(coverage_start))
+
+        if merged is None:
+            # 데이터 제공처 오류 시 기존 캐시로 대체
+            return _slice_from(cached, start_day) if cached is not None else None
+
+        merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        self.save(market, ticker, merged, coverage_start)
+        return _slice_from(merged, start_day)
+
+    def refresh_start(self, market: str, ticker: str, start: datetime) -> pd.Timestamp:
+        """
+        get_bars가 새로 조회할 시작일 (묶음 조회 계획용)
+
+        Args:
+            market: 시장
+            ticker: 종목 코드
+            start: 조회 시작일
+
+        Returns:
+            fetch에 전달될 시작일
+        """
+        start_day = pd.Timestamp(start).normalize()
+        cached, coverage_start = self.load(market, ticker)
+        if cached is None or cached.empty or start_day < coverage_start:
+            return start_day
+        return _naive_day(_refresh_from(cached))
+
+
+def _refresh_from(cached: pd.DataFrame) -> pd.Timestamp:
+    """다시 받을 첫 봉 (마지막 완성봉, 형성 중인 봉은 그 다음)"""
+    return cached.index[-2] if len(cached) >= 2 else cached.index[-1]
+
+
+def _covers_final(cached: pd.DataFrame, end_day: pd.Timestamp, market: str, saved_at: pd.Timestamp | None) -> bool:
+    """
+    종료일까지의 봉이 모두 완성봉으로 캐시에 있는지 확인
+
+    마지막 봉이 종료일 이전이면 아직 받지 않은 봉이 있고, 종료일 봉이 마지막 봉이면
+    장중에 저장된 형성 중인 봉일 수 있으므로 그 거래일 폐장 후 저장된 경우만 완성봉으로 본다.
+    """
+    last_day = _last_day(cached)
+    if last_day != end_day:
+        return last_day > end_day
+    if saved_at is None:
+        return False
+
+    if market in MARKET_HOURS:
+        session = get_market_calendar(market).session(end_day.date())
+        if session is not None:
+            return saved_at >= session[1]
+    # 시장 정보가 없으면 다음 날 이후 저장된 경우만 완성봉으로 봄
+    return _naive_day(saved_at) > end_day
+
+
+def _normalize(df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """OHLCV 컬럼만 남긴 데이터프레임 (비어 있으면 None)"""
+    if df is None or df.empty:
+        return None
+    return df[OHLCV_COLUMNS]
+
+
+def _naive_day(ts: pd.Timestamp) -> pd.Timestamp:
+    """인덱스 시각을 tz 없는 날짜로 변환"""
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def _last_day(df: pd.DataFrame) -> pd.Timestamp:
+    """마지막 봉 날짜"""
+    return _naive_day(df.index[-1])
+
+
+def _slice_from(df: pd.DataFrame, start_day: pd.Timestamp) -> pd.DataFrame | None:
+    """시작일 이후 구간"""
+    start_ts = start_day.tz_localize(df.index.tz) if df.index.tz is not None else start_day
+    sliced = df[df.index >= start_ts]
+    return sliced if not sliced.empty else None
+
+
+def slice_until(df: pd.DataFrame | None, end: datetime, inclusive: bool = True) -> pd.DataFrame | None:
+    """
+    종료일까지 구간
+
+    Args:
+        df: OHLCV 데이터프레임
+        end: 종료일
+        inclusive: 종료일 포함 여부
+
+    Returns:
+        잘라낸 데이터프레임 또는 None
+    """
+    if df is None:
+        return None
+    end_ts = pd.Timestamp(end).normalize()
+    if df.index.tz is not None:
+        end_ts = end_ts.tz_localize(df.index.tz)
+    sliced = df[df.index <= end_ts] if inclusive else df[df.index < end_ts]
+    return sliced if not sliced.empty else None
+
+
+def _overlap_matches(cached: pd.DataFrame, fetched: pd.DataFrame, ts: pd.Timestamp) -> bool:
+    """겹치는 완성봉의 종가가 캐시와 같은지 확인"""
+    if len(cached) < 2:
+        return True
+    if ts not in fetched.index:
+        return False
+    return bool(np.isclose(cached.at[ts, 'Close'], fetched.at[ts, 'Close'], rtol=1e-6))
+
+
+def period_to_start(period: str, now: datetime | None = None) -> datetime | None:
+    """
+    yfinance 기간 문자열을 시작일로 변환
+
+    Args:
+        period: 조회 기간 (예: "5d", "6mo", "1y", "ytd")
+        now: 기준 시각
+
+    Returns:
+        시작일 또는 None ("max" 등 변환 불가)
+    """
+    now = now or datetime.now()
+    if period == 'ytd':
+        return datetime(now.year, 1, 1)
+
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        return None
+
+    amount, unit = int(match.group(1)), match.group(2)
+    if unit == 'd':
+        return now - timedelta(days=amount)
+    if unit == 'wk':
+        return now - timedelta(weeks=amount)
+    if unit == 'mo':
+        return (pd.Timestamp(now) - pd.DateOffset(months=amount)).to_pydatetime()
+    return (pd.Timestamp(now) - pd.DateOffset(years=amount)).to_pydatetime()
+
+
+# ========================================
+# 기본 저장소
+# ========================================
+
+_default_store: BarStore | None = BarStore()
+
+
+def configure_bar_store(cache_dir: str | None) -> BarStore | None:
+    """
+    기본 일봉 캐시 설정
+
+    Args:
+        cache_dir: 캐시 디렉토리 (None이면 캐시 비활성화)
+
+    Returns:
+        설정된 BarStore 또는 None
+    """
+    global _default_store
+    _default_store = BarStore(cache_dir) if cache_dir else None
+    return _default_store
+
+
+def get_bar_store() -> BarStore | None:
+    """기본 일봉 캐시 조회 (비활성화 시 None)"""
+    return _default_store
@@ -0,0 +1,143 @@
+"""한국 주식 종목명 인덱스"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict
+
+from pykrx import stock
+
+_index_file = "cache/kr_names.json"
+_names: Dict[str, str] = {}
+_loaded_on: str | None = None
+_retry_at: datetime | None = None
+_lock = threading.Lock()
+
+# 일괄 조회 결과가 기존 인덱스의 이 비율보다 작으면 실패로 간주 (KRX 오류 페이지 등)
+MIN_LISTING_RATIO = 0.5
+
+# 일괄 조회 실패 후 다시 시도하기까지 기다릴 시간
+RETRY_INTERVAL = timedelta(minutes=30)
+
+
+def configure_kr_name_index(index_file: str):
+    """
+    종목명 인덱스 파일 경로 설정
+
+    Args:
+        index_file: 인덱스 저장 파일 경로
+    """
+    global _index_file, _loaded_on, _retry_at
+    with _lock:
+        _index_file = index_file
+        _loaded_on = None
+        _retry_at = None
+
+
+def _fetch_listing() -> Dict[str, str]:
+    """
+    전종목 코드/종목명 일괄 조회 (1회 요청)
+
+    pykrx는 KRX 응답 오류(로그인/HTML 페이지 등) 시 빈 결과를 반환하므로 예외로 바꾼다.
+    """
+    from pykrx.website import krx
+
+    date = stock.get_nearest_business_day_in_a_week()
+    listing = krx.get_market_ticker_and_name(date, "ALL")
+    names = {str(ticker): str(name) for ticker, name in listing.items()}
+    if not names:
+        raise ValueError("전종목 조회 결과가 비어 있습니다")
+    return names
+
+
+def _load_file() -> tuple[Dict[str, str], str | None]:
+    """인덱스 파일 로드"""
+    if os.path.exists(_index_file):
+        try:
+            with open(_index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return data.get('names', {}), data.get('date')
+        except Exception as e:
+            print(f"⚠️  종목명 인덱스 로드 실패: {e}")
+    return {}, None
+
+
+def _save_file(names: Dict[str, str], date: str):
+    """인덱스 파일 저장"""
+    try:
+        directory = os.path.dirname(_index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(_index_file, 'w', encoding='utf-8') as f:
+            json.dump({'date': date, 'names': names}, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"❌ 종목명 인덱스 저장 실패: {e}")
+
+
+def get_kr_name_index() -> Dict[str, str]:
+    """
+    종목 코드 → 종목명 인덱스 (하루 1회 갱신)
+
+    메모리 → 당일 저장 파일 → 전종목 일괄 조회 순으로 사용하며,
+    일괄 조회가 실패하면 이전 파일을 그대로 사용하고 RETRY_INTERVAL 뒤에 다시 조회한다.
+
+    Returns:
+        모든 호출처가 공유하는 {종목 코드: 종목명} 딕셔너리
+    """
+    global _loaded_on, _retry_at
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+
+    with _lock:
+        if _loaded_on == today or (_retry_at is not None and now < _retry_at):
+            return _names
+
+        names, date = _load_file()
+        if date != today:
+            try:
+                fetched = _fetch_listing()
+                if len(fetched) < len(names) * MIN_LISTING_RATIO:
+                    raise ValueError(f"조회 결과가 기존 인덱스보다 너무 적습니다 ({len(fetched)}/{len(names)}개)")
+                names = fetched
+                date = today
+                _save_file(names, date)
+                print(f"✅ 종목명 인덱스 갱신: {len(names)}개")
+            except Exception as e:
+                print(f"⚠️  종목명 일괄 조회 실패 (기존 인덱스 사용): {e}")
+
+        _names.clear()
+        _names.update(names)
+        # 당일 인덱스를 확보한 경우만 갱신 완료로 기록 (실패 시 잠시 뒤 재시도)
+        if date == today:
+            _loaded_on = today
+            _retry_at = None
+        else:
+            _retry_at = now + RETRY_INTERVAL
+        return _names
+
+
+def lookup_kr_name(ticker: str) -> str | None:
+    """
+    종목명 조회 (인덱스에 없으면 단건 조회 후 인덱스에 추가)
+
+    Args:
+        ticker: 종목 코드
+
+    Returns:
+        종목명 또는 None
+    """
+    names = get_kr_name_index()
+    name = names.get(ticker)
+    if name:
+        return name
+
+    try:
+        name = stock.get_market_ticker_name(ticker)
+    except Exception:
+        return None
+
+    if isinstance(name, str) and name:
+        with _lock:
+            _names[ticker] = name
+        return name
+    return None
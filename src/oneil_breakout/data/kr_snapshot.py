@@ -0,0 +1,234 @@
+"""한국 주식 전종목 일별 스냅샷 수집"""
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from pykrx import stock
+
+from .cache import OHLCV_COLUMNS, BarStore, get_bar_store
+from .kr_stock import KR_COLUMN_MAPPING
+
+# 스냅샷으로 만든 일봉 저장 구역 (종목별 조회와 달리 수정주가 미반영)
+SNAPSHOT_MARKET = 'KRX'
+
+# 당일 스냅샷 파일 캐시 {경로: (수정 시각, 거래일, 데이터프레임)}
+_today_cache: dict = {}
+
+
+def _state_path(store: BarStore) -> str:
+    """수집 상태 파일 경로"""
+    return os.path.join(store.cache_dir, SNAPSHOT_MARKET, '_snapshots.json')
+
+
+def _load_state(store: BarStore) -> dict:
+    """수집 완료일/휴장일 로드"""
+    path = _state_path(store)
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return {'days': set(data.get('days', [])), 'holidays': set(data.get('holidays', []))}
+        except Exception as e:
+            print(f"⚠️  스냅샷 상태 로드 실패: {e}")
+    return {'days': set(), 'holidays': set()}
+
+
+def _save_state(store: BarStore, state: dict):
+    """수집 완료일/휴장일 저장"""
+    path = _state_path(store)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            'days': sorted(state['days']),
+            'holidays': sorted(state['holidays']),
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"❌ 스냅샷 상태 저장 실패: {e}")
+
+
+def _today_path(store: BarStore) -> str:
+    """당일(미확정) 스냅샷 파일 경로"""
+    return os.path.join(store.cache_dir, SNAPSHOT_MARKET, '_today.npz')
+
+
+def _save_today(store: BarStore, day: pd.Timestamp, df: pd.DataFrame):
+    """
+    당일 스냅샷을 한 파일에 저장 (종목별 일봉 파일은 거래일이 확정된 뒤에만 갱신)
+
+    Args:
+        store: 일봉 캐시
+        day: 거래일
+        df: 종목 코드 인덱스의 OHLCV 데이터프레임
+    """
+    path = _today_path(store)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                day=np.array(day.value),
+                tickers=np.asarray(df.index, dtype=str),
+                **{col: df[col].to_numpy() for col in OHLCV_COLUMNS}
+            )
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"❌ 당일 스냅샷 저장 실패: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load_today(store: BarStore) -> Tuple[pd.Timestamp | None, pd.DataFrame | None]:
+    """당일 스냅샷 로드 (파일이 바뀌었을 때만 다시 읽음)"""
+    path = _today_path(store)
+    if not os.path.exists(path):
+        return None, None
+
+    mtime = os.path.getmtime(path)
+    cached = _today_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            day = pd.Timestamp(int(data['day']), unit='ns')
+            df = pd.DataFrame({col: data[col] for col in OHLCV_COLUMNS}, index=data['tickers'].astype(object))
+    except Exception as e:
+        print(f"⚠️  당일 스냅샷 로드 실패: {e}")
+        return None, None
+
+    _today_cache[path] = (mtime, day, df)
+    return day, df
+
+
+def _fetch_snapshot(day: str) -> pd.DataFrame | None:
+    """
+    특정 일자 전종목 OHLCV 조회
+
+    Args:
+        day: 조회 일자 (YYYYMMDD)
+
+    Returns:
+        종목 코드 인덱스의 OHLCV 데이터프레임 또는 None (휴장일) - 거래정지 종목(시가, 거래량 0)은 제외
+    """
+    df = stock.get_market_ohlcv_by_ticker(day, market="ALL")
+    if df is None or df.empty:
+        return None
+
+    df = df.rename(columns=KR_COLUMN_MAPPING)[['Open', 'High', 'Low', 'Close', 'Volume']]
+    if df['Volume'].sum() == 0:
+        return None
+    return df[(df['Volume'] != 0) | (df['Open'] != 0)]
+
+
+def ingest_kr_snapshots(days: int = 120, store: BarStore | None = None) -> int:
+    """
+    전종목 일별 스냅샷을 받아 종목별 일봉으로 저장
+
+    이미 받은 거래일은 건너뛰고, 당일(형성 중인 봉)은 매번 다시 받는다.
+    요청 수는 종목 수와 무관하게 거래일 수에 비례한다.
+    당일 봉은 별도 파일 하나에만 저장하고, 종목별 일봉 파일은 확정된 거래일이 새로 들어올 때만 다시 쓴다.
+
+    Args:
+        days: 유지할 조회 기간 (일)
+        store: 일봉 캐시 (None이면 기본 캐시)
+
+    Returns:
+        새로 받은 거래일 수
+    """
+    store = store or get_bar_store()
+    if store is None:
+        print("⚠️  스냅샷 수집에는 일봉 캐시가 필요합니다.")
+        return 0
+
+    today = datetime.now()
+    today_key = today.strftime('%Y%m%d')
+    window_start = pd.Timestamp(today - timedelta(days=days)).normalize()
+
+    state = _load_state(store)
+    done = state['days'] | state['holidays']
+    pending = [
+        day for day in (d.strftime('%Y%m%d') for d in pd.bdate_range(window_start, today))
+        if day not in done or day == today_key
+    ]
+    if not pending:
+        return 0
+
+    print(f"  📥 전종목 스냅샷 수집 중 ({len(pending)}일)...")
+
+    snapshots = {}
+    fetched = 0
+    for day in pending:
+        try:
+            df = _fetch_snapshot(day)
+        except Exception as e:
+            print(f"  ❌ {day} 스냅샷 조회 실패: {e}")
+            continue
+
+        if df is None:
+            # 당일은 장 시작 전일 수 있으므로 휴장일로 기록하지 않음
+            if day != today_key:
+                state['holidays'].add(day)
+            continue
+
+        fetched += 1
+        if day == today_key:
+            # 당일 봉은 장 마감 후 다음 수집에서 확정 - 그 전까지는 당일 파일에만 보관
+            _save_today(store, pd.Timestamp(day), df)
+            continue
+        snapshots[pd.Timestamp(day)] = df
+        state['days'].add(day)
+
+    if snapshots:
+        # (날짜, 종목) 롱 포맷 → 종목별 일봉
+        panel = pd.concat(snapshots, names=['날짜', '티커'])
+        for ticker, bars in panel.groupby(level='티커'):
+            bars = bars.droplevel('티커')
+            coverage_start = window_start
+            cached, cached_start = store.load(SNAPSHOT_MARKET, ticker)
+            if cached is not None:
+                bars = pd.concat([cached, bars])
+                bars = bars[~bars.index.duplicated(keep='last')].sort_index()
+                coverage_start = min(cached_start, window_start)
+            store.save(SNAPSHOT_MARKET, ticker, bars, coverage_start)
+
+    _save_state(store, state)
+    print(f"  ✅ 스냅샷 {fetched}일 반영 완료")
+    return fetched
+
+
+def get_kr_snapshot_data(ticker: str, days: int = 120, store: BarStore | None = None) -> pd.DataFrame | None:
+    """
+    스냅샷으로 만든 한국 주식 일봉 조회 (네트워크 요청 없음)
+
+    Args:
+        ticker: 종목 코드 (예: "005930")
+        days: 조회할 일수
+        store: 일봉 캐시 (None이면 기본 캐시)
+
+    Returns:
+        OHLCV 데이터프레임 또는 None
+    """
+    store = store or get_bar_store()
+    if store is None:
+        return None
+
+    df, _ = store.load(SNAPSHOT_MARKET, ticker)
+
+    # 아직 확정되지 않은 당일 봉 덧붙이기
+    today_day, today_df = _load_today(store)
+    if today_df is not None and ticker in today_df.index and (df is None or df.empty or df.index[-1] < today_day):
+        today_bar = today_df.loc[[ticker]].set_axis(pd.DatetimeIndex([today_day], name='날짜'))
+        df = today_bar if df is None or df.empty else pd.concat([df, today_bar])
+    if df is None:
+        return None
+
+    start = pd.Timestamp(datetime.now() - timedelta(days=days)).normalize()
+    df = df[df.index >= start]
+    return df if not df.empty else None
@@ -4,10 +4,21 @@ from datetime import datetime, timedelta
 import pandas as pd
 from pykrx import stock
 
+from .cache import get_bar_store, slice_until
+from .kr_names import lookup_kr_name
+
+KR_COLUMN_MAPPING = {
+    '시가': 'Open',
+    '고가': 'High',
+    '저가': 'Low',
+    '종가': 'Close',
+    '거래량': 'Volume'
+}
+
 
 def get_kr_stock_name(ticker: str) -> str:
     """
-    한국 주식 종목명 가져오기
+    한국 주식 종목명 가져오기 (종목명 인덱스 사용)
 
     Args:
         ticker: 종목 코드 (예: "005930")
@@ -15,17 +26,28 @@ def get_kr_stock_name(ticker: str) -> str:
     Returns:
         종목명 또는 ticker
     """
-    try:
-        name = stock.get_market_ticker_name(ticker)
-        return name if name else ticker
-    except:
-        return ticker
+    name = lookup_kr_name(ticker)
+    return name if name else ticker
+
+
+def _fetch_kr_history(ticker: str, start: pd.Timestamp) -> pd.DataFrame | None:
+    """시작일 이후 일봉 조회 (캐시 보충용)"""
+    df = stock.get_market_ohlcv_by_date(
+        start.strftime("%Y%m%d"),
+        datetime.now().strftime("%Y%m%d"),
+        ticker
+    )
+    if df.empty:
+        return None
+    return df.rename(columns=KR_COLUMN_MAPPING)[['Open', 'High', 'Low', 'Close', 'Volume']]
 
 
 def get_kr_stock_data(ticker: str, days: int = 120) -> pd.DataFrame | None:
     """
     한국 주식 데이터 가져오기
 
+    로컬 캐시가 활성화되어 있으면 캐시 이후 구간만 새로 조회한다.
+
     Args:
         ticker: 종목 코드 (예: "005930")
         days: 조회할 일수
@@ -37,6 +59,10 @@ def get_kr_stock_data(ticker: str, days: int = 120) -> pd.DataFrame | None:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
+        store = get_bar_store()
+        if store is not None:
+            return store.get_bars('KR', ticker, start_date, lambda s: _fetch_kr_history(ticker, s))
+
         df = stock.get_market_ohlcv_by_date(
             start_date.strftime("%Y%m%d"),
             end_date.strftime("%Y%m%d"),
@@ -46,15 +72,7 @@ def get_kr_stock_data(ticker: str, days: int = 120) -> pd.DataFrame | None:
         if df.empty:
             return None
 
-        column_mapping = {
-            '시가': 'Open',
-            '고가': 'High',
-            '저가': 'Low',
-            '종가': 'Close',
-            '거래량': 'Volume'
-        }
-
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=KR_COLUMN_MAPPING)
         required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
         df = df[required_columns]
 
@@ -77,6 +95,15 @@ def get_kr_stock_data_by_date(ticker: str, start_date: str, end_date: str) -> pd
         OHLCV 데이터프레임 또는 None
     """
     try:
+        store = get_bar_store()
+        if store is not None:
+            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            df = store.get_bars(
+                'KR', ticker, start_dt, lambda s: _fetch_kr_history(ticker, s), end=end_dt
+            )
+            return slice_until(df, end_dt)
+
         start = datetime.strptime(start_date, '%Y-%m-%d').strftime("%Y%m%d")
         end = datetime.strptime(end_date, '%Y-%m-%d').strftime("%Y%m%d")
 
@@ -84,14 +111,7 @@ def get_kr_stock_data_by_date(ticker: str, start_date: str, end_date: str) -> pd
         if df.empty:
             return None
 
-        column_mapping = {
-            '시가': 'Open',
-            '고가': 'High',
-            '저가': 'Low',
-            '종가': 'Close',
-            '거래량': 'Volume'
-        }
-        df = df.rename(columns=column_mapping)
+        df = df.rename(columns=KR_COLUMN_MAPPING)
         return df[['Open', 'High', 'Low', 'Close', 'Volume']]
     except Exception as e:
         print(f"❌ {ticker} 데이터 조회 실패: {e}")
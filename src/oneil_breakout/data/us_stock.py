@@ -1,12 +1,25 @@
 """미국 주식 데이터 수집"""
+from datetime import datetime, timedelta
+from typing import Dict, List
+
 import pandas as pd
 import yfinance as yf
 
+from .cache import get_bar_store, period_to_start, slice_until
+
+
+def _fetch_us_history(ticker: str, start: pd.Timestamp) -> pd.DataFrame | None:
+    """시작일 이후 일봉 조회 (캐시 보충용)"""
+    df = yf.Ticker(ticker).history(start=start.strftime('%Y-%m-%d'))
+    return df if not df.empty else None
+
 
 def get_us_stock_data(ticker: str, period: str = "6mo") -> pd.DataFrame | None:
     """
     미국 주식 데이터 가져오기
 
+    로컬 캐시가 활성화되어 있으면 캐시 이후 구간만 새로 조회한다.
+
     Args:
         ticker: 종목 코드 (예: "AAPL")
         period: 조회 기간 (예: "6mo", "1y")
@@ -15,6 +28,11 @@ def get_us_stock_data(ticker: str, period: str = "6mo") -> pd.DataFrame | None:
         OHLCV 데이터프레임 또는 None
     """
     try:
+        store = get_bar_store()
+        start = period_to_start(period)
+        if store is not None and start is not None:
+            return store.get_bars('US', ticker, start, lambda s: _fetch_us_history(ticker, s))
+
         stock_obj = yf.Ticker(ticker)
         df = stock_obj.history(period=period)
         if df.empty:
@@ -25,6 +43,111 @@ def get_us_stock_data(ticker: str, period: str = "6mo") -> pd.DataFrame | None:
         return None
 
 
+def _download_us_chunk(
+    tickers: List[str],
+    threads: int,
+    start: pd.Timestamp | None = None,
+    period: str | None = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    yfinance 다중 종목 다운로드 (1회 요청)
+
+    Returns:
+        {종목 코드: OHLCV 데이터프레임}
+    """
+    span = {'start': start.strftime('%Y-%m-%d')} if start is not None else {'period': period}
+    # 단건 조회(Ticker.history)와 같은 수정주가로 캐시에 저장 (구버전 download 기본값은 False)
+    raw = yf.download(
+        tickers,
+        group_by='ticker',
+        auto_adjust=True,
+        threads=threads,
+        ignore_tz=False,
+        progress=False,
+        **span
+    )
+    if raw is None or raw.empty:
+        return {}
+
+    frames = {}
+    for ticker in tickers:
+        if isinstance(raw.columns, pd.MultiIndex):
+            if ticker not in raw.columns.get_level_values(0):
+                continue
+            df = raw[ticker]
+        else:
+            df = raw
+        df = df.dropna(how='all')
+        if not df.empty:
+            frames[ticker] = df
+    return frames
+
+
+def get_us_stocks_data(
+    tickers: List[str],
+    period: str = "6mo",
+    chunk_size: int = 100,
+    threads: int = 8
+) -> Dict[str, pd.DataFrame]:
+    """
+    미국 주식 데이터 묶음 조회
+
+    종목을 chunk_size 단위로 나눠 yfinance 다중 종목 다운로드로 가져온다.
+    캐시가 활성화되어 있으면 새로 받을 시작일이 같은 종목끼리 묶어 조회한다.
+
+    Args:
+        tickers: 종목 코드 리스트
+        period: 조회 기간 (예: "6mo", "1y")
+        chunk_size: 한 번에 요청할 종목 수
+        threads: 다운로드 스레드 수
+
+    Returns:
+        {종목 코드: OHLCV 데이터프레임} (조회 실패 종목은 제외)
+    """
+    store = get_bar_store()
+    start = period_to_start(period)
+    frames: Dict[str, pd.DataFrame] = {}
+
+    # 새로 받을 시작일별로 종목 묶기
+    groups: Dict[pd.Timestamp | None, List[str]] = {}
+    for ticker in tickers:
+        fetch_start = store.refresh_start('US', ticker, start) if store and start else None
+        groups.setdefault(fetch_start, []).append(ticker)
+
+    for fetch_start, group in groups.items():
+        for i in range(0, len(group), chunk_size):
+            chunk = group[i:i + chunk_size]
+            try:
+                downloaded = _download_us_chunk(chunk, threads, start=fetch_start, period=period)
+            except Exception as e:
+                print(f"❌ 묶음 조회 실패 ({len(chunk)}개): {e}")
+                downloaded = {}
+
+            for ticker in chunk:
+                if fetch_start is None:
+                    if ticker in downloaded:
+                        frames[ticker] = downloaded[ticker]
+                    continue
+
+                def fetch(s: pd.Timestamp, ticker=ticker, chunk_start=fetch_start) -> pd.DataFrame | None:
+                    # 묶음 결과로 충분하면 재사용, 아니면 (전체 재조회 등) 단건 조회
+                    if s >= chunk_start and ticker in downloaded:
+                        df = downloaded[ticker]
+                        s = s.tz_localize(df.index.tz) if df.index.tz is not None else s
+                        return df[df.index >= s]
+                    return _fetch_us_history(ticker, s)
+
+                try:
+                    df = store.get_bars('US', ticker, start, fetch)
+                except Exception as e:
+                    print(f"❌ {ticker} 데이터 조회 실패: {e}")
+                    df = None
+                if df is not None:
+                    frames[ticker] = df
+
+    return frames
+
+
 def get_us_stock_data_by_date(ticker: str, start_date: str, end_date: str) -> pd.DataFrame | None:
     """
     미국 주식 데이터 기간별 조회
@@ -38,6 +161,17 @@ def get_us_stock_data_by_date(ticker: str, start_date: str, end_date: str) -> pd
         OHLCV 데이터프레임 또는 None
     """
     try:
+        store = get_bar_store()
+        if store is not None:
+            start = datetime.strptime(start_date, '%Y-%m-%d')
+            end = datetime.strptime(end_date, '%Y-%m-%d')
+            df = store.get_bars(
+                'US', ticker, start, lambda s: _fetch_us_history(ticker, s),
+                end=end - timedelta(days=1)
+            )
+            # yfinance와 동일하게 종료일은 포함하지 않음
+            return slice_until(df, end, inclusive=False)
+
         stock_obj = yf.Ticker(ticker)
         df = stock_obj.history(start=start_date, end=end_date)
         if df.empty:
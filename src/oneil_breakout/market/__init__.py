@@ -1,4 +1,5 @@
 """시장 상태 모듈"""
+from .calendar import MarketCalendar, get_market_calendar, next_scan_time
 from .status import get_market_status
 
-__all__ = ['get_market_status']
+__all__ = ['MarketCalendar', 'get_market_calendar', 'get_market_status', 'next_scan_time']
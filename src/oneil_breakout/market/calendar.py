@@ -0,0 +1,268 @@
+"""
+거래소 거래일 달력과 스캔 시각
+- exchange_calendars가 설치되어 있으면 XKRX/XNYS 달력 사용 (음력 공휴일, 임시 휴장, 조기 폐장 포함)
+- 없으면 기본 규칙: 현지 시간대(zoneinfo, 서머타임 반영) 정규장 + 주말 + NYSE 휴장일/조기 폐장 규칙
+  + KRX 양력 공휴일 (설날/추석/부처님오신날 등 음력 공휴일은 exchange_calendars 필요)
+- 스캔 시각: 개장 후 open_offset, 이후 interval 간격, 폐장 전 close_offset
+"""
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from zoneinfo import ZoneInfo
+
+try:
+    import exchange_calendars
+except ImportError:
+    exchange_calendars = None
+
+MARKET_HOURS = {
+    'KR': {'code': 'XKRX', 'tz': 'Asia/Seoul', 'open': dt_time(9, 0), 'close': dt_time(15, 30)},
+    'US': {'code': 'XNYS', 'tz': 'America/New_York', 'open': dt_time(9, 30), 'close': dt_time(16, 0),
+           'early_close': dt_time(13, 0)}
+}
+
+# 다음 거래일을 찾을 때 최대 탐색 일수 (설/추석 연휴 포함)
+MAX_CLOSED_DAYS = 15
+
+Session = Tuple[datetime, datetime]
+
+
+# ========================================
+# 기본 휴장일 규칙
+# ========================================
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """month월의 n번째 weekday (n=-1이면 마지막)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, 익명 알고리즘)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = (h + l - 7 * m + 114) % 31 + 1
+    return date(year, month, day)
+
+
+def _observed(day: date) -> date:
+    """토요일 공휴일은 금요일, 일요일 공휴일은 월요일에 휴장"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def _nyse_holidays(year: int) -> frozenset:
+    """NYSE 휴장일"""
+    days = {
+        _nth_weekday(year, 1, 0, 3),  # 마틴 루서 킹 데이
+        _nth_weekday(year, 2, 0, 3),  # 대통령의 날
+        _easter(year) - timedelta(days=2),  # 성금요일
+        _nth_weekday(year, 5, 0, -1),  # 현충일
+        _observed(date(year, 7, 4)),  # 독립기념일
+        _nth_weekday(year, 9, 0, 1),  # 노동절
+        _nth_weekday(year, 11, 3, 4),  # 추수감사절
+        _observed(date(year, 12, 25))  # 성탄절
+    }
+    # 신정 (토요일이면 전년도 12/31에 휴장하지 않음)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))  # 준틴스
+    return frozenset(days)
+
+
+@lru_cache(maxsize=None)
+def _nyse_early_closes(year: int) -> frozenset:
+    """NYSE 조기 폐장일 (13:00): 독립기념일 전날, 추수감사절 다음 날, 성탄절 전날"""
+    holidays = _nyse_holidays(year)
+    candidates = (
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24)
+    )
+    return frozenset(day for day in candidates if day.weekday() < 5 and day not in holidays)
+
+
+@lru_cache(maxsize=None)
+def _krx_holidays(year: int) -> frozenset:
+    """KRX 휴장일 (양력 공휴일 + 근로자의 날 + 연말 휴장일)"""
+    fixed = ((1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25), (12, 31))
+    return frozenset(date(year, month, day) for month, day in fixed)
+
+
+# ========================================
+# 달력
+# ========================================
+
+class MarketCalendar:
+    """시장 하나의 거래일/정규장 시각"""
+
+    def __init__(self, market: str, use_exchange_calendars: bool = True):
+        """
+        Args:
+            market: 시장 ('US' 또는 'KR')
+            use_exchange_calendars: exchange_calendars가 설치되어 있으면 사용할지 여부
+        """
+        spec = MARKET_HOURS[market]
+        self.market = market
+        self.tz = ZoneInfo(spec['tz'])
+        self._spec = spec
+        self._calendar = None
+        if use_exchange_calendars and exchange_calendars is not None:
+            try:
+                self._calendar = exchange_calendars.get_calendar(spec['code'])
+            except Exception as e:
+                print(f"⚠️  {spec['code']} 거래소 달력 로드 실패, 기본 규칙 사용: {e}")
+        if self._calendar is None and market == 'KR':
+            print("ℹ️  exchange_calendars 없음 - 한국 음력 공휴일/임시 휴장일은 반영되지 않습니다 "
+                  "(pip install exchange_calendars)")
+
+    def session(self, day: date) -> Session | None:
+        """
+        거래일의 정규장 시각
+
+        Args:
+            day: 현지 날짜
+
+        Returns:
+            (개장, 폐장) UTC 시각 (휴장일이면 None)
+        """
+        if self._calendar is not None:
+            try:
+                if not self._calendar.is_session(day.isoformat()):
+                    return None
+                open_, close = self._calendar.session_open_close(day.isoformat())
+                return open_.to_pydatetime(), close.to_pydatetime()
+            except ValueError:
+                # 달력 범위 밖 (기본 규칙으로 계산)
+                pass
+
+        if day.weekday() >= 5:
+            return None
+        if self.market == 'US':
+            if day in _nyse_holidays(day.year):
+                return None
+            close = self._spec['early_close'] if day in _nyse_early_closes(day.year) else self._spec['close']
+        else:
+            if day in _krx_holidays(day.year):
+                return None
+            close = self._spec['close']
+
+        return (
+            datetime.combine(day, self._spec['open'], self.tz).astimezone(timezone.utc),
+            datetime.combine(day, close, self.tz).astimezone(timezone.utc)
+        )
+
+    def current_or_next_session(self, now: datetime) -> Session:
+        """now가 장중이면 현재 정규장, 아니면 다음 정규장 (UTC)"""
+        day = now.astimezone(self.tz).date()
+        for offset in range(MAX_CLOSED_DAYS + 1):
+            session = self.session(day + timedelta(days=offset))
+            if session is not None and session[1] > now:
+                return session
+        raise ValueError(f"{self.market} 다음 거래일을 찾을 수 없습니다 ({day} 이후 {MAX_CLOSED_DAYS}일)")
+
+    def is_open(self, now: datetime) -> bool:
+        """정규장 여부"""
+        open_, close = self.current_or_next_session(now)
+        return open_ <= now < close
+
+
+@lru_cache(maxsize=None)
+def get_market_calendar(market: str) -> MarketCalendar:
+    """시장별 달력 (프로세스 안에서 재사용)"""
+    return MarketCalendar(market)
+
+
+# ========================================
+# 스캔 시각
+# ========================================
+
+def session_scan_times(
+    session: Session,
+    interval_seconds: int,
+    open_offset_minutes: float = 5,
+    close_offset_minutes: float = 10
+) -> List[datetime]:
+    """
+    정규장 하나의 스캔 시각
+
+    Args:
+        session: (개장, 폐장) 시각
+        interval_seconds: 장중 스캔 간격 (초)
+        open_offset_minutes: 개장 후 첫 스캔까지 (분)
+        close_offset_minutes: 폐장 전 마지막 스캔 (분)
+
+    Returns:
+        시각 리스트 (개장 + open_offset부터 interval 간격, 마지막은 폐장 - close_offset)
+    """
+    open_, close = session
+    first = open_ + timedelta(minutes=open_offset_minutes)
+    last = close - timedelta(minutes=close_offset_minutes)
+    if last < first:
+        return [first] if first < close else []
+
+    times = []
+    step = timedelta(seconds=max(interval_seconds, 1))
+    current = first
+    while current < last:
+        times.append(current)
+        current += step
+    times.append(last)
+    return times
+
+
+def next_scan_time(
+    now: datetime,
+    markets: List[str],
+    interval_seconds: int,
+    open_offset_minutes: float = 5,
+    close_offset_minutes: float = 10
+) -> Tuple[datetime, List[str]]:
+    """
+    다음 스캔 시각
+
+    Args:
+        now: 현재 시각 (timezone 포함)
+        markets: 스캔할 시장 리스트 ('US', 'KR')
+        interval_seconds: 장중 스캔 간격 (초)
+        open_offset_minutes: 개장 후 첫 스캔까지 (분)
+        close_offset_minutes: 폐장 전 마지막 스캔 (분)
+
+    Returns:
+        (다음 스캔 시각, 그 시각에 스캔할 시장 리스트)
+    """
+    upcoming: Dict[str, datetime] = {}
+    for market in markets:
+        calendar = get_market_calendar(market)
+        probe = now
+        while market not in upcoming:
+            session = calendar.current_or_next_session(probe)
+            times = [t for t in session_scan_times(
+                session, interval_seconds, open_offset_minutes, close_offset_minutes
+            ) if t > now]
+            if times:
+                upcoming[market] = times[0]
+            else:
+                # 이번 정규장의 남은 스캔이 없으면 다음 정규장
+                probe = session[1]
+
+    if not upcoming:
+        raise ValueError("스캔할 시장이 없습니다")
+    when = min(upcoming.values())
+    return when, [market for market, t in upcoming.items() if t == when]
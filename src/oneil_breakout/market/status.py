@@ -1,52 +1,43 @@
 """시장 상태 확인"""
-from datetime import datetime, time as dt_time
+from datetime import datetime, timezone
 from typing import Dict
+from zoneinfo import ZoneInfo
 
+from .calendar import get_market_calendar
 
-def get_market_status() -> Dict[str, bool | str | int]:
+KST = ZoneInfo('Asia/Seoul')
+
+
+def get_market_status(now: datetime | None = None) -> Dict[str, bool | str | int]:
     """
-    현재 시간에 따른 시장 상태 확인
+    현재 시간에 따른 시장 상태 확인 (거래소 달력 기준: 휴장일, 조기 폐장, 서머타임 반영)
+
+    Args:
+        now: 기준 시각 (None이면 현재, timezone 없으면 로컬 시각)
 
     Returns:
         {
             'kr': bool - 한국 장중 여부,
             'us': bool - 미국 장중 여부,
+            'kr_session': str - 한국 현재/다음 정규장 (한국 시간, 예: "09:00-15:30"),
+            'us_session': str - 미국 현재/다음 정규장 (한국 시간, 예: "23:30-06:00"),
             'time': str - 현재 시간,
             'weekday': int - 요일 (0=월요일, 6=일요일)
         }
     """
-    now = datetime.now()
-    current_time = now.time()
-    weekday = now.weekday()
-
-    # 주말 체크
-    is_weekend = weekday >= 5
-
-    # 한국 장중: 08:00 - 17:00 (평일)
-    kr_open = dt_time(8, 0)
-    kr_close = dt_time(17, 0)
-    is_kr_market = (not is_weekend) and (kr_open <= current_time <= kr_close)
-
-    # 미국 장중 (한국 시간): 17:30 - 07:00 다음날
-    us_open_night = dt_time(17, 30)
-    us_close_morning = dt_time(7, 0)
-
-    is_us_market = False
+    now = now or datetime.now()
+    moment = now.astimezone(timezone.utc)
 
-    if not is_weekend:
-        # 17:30 이후 (당일 밤)
-        if current_time >= us_open_night:
-            is_us_market = True
-        # 07:00 이전 (다음날 새벽)
-        elif current_time <= us_close_morning:
-            is_us_market = True
+    status = {}
+    for market in ('kr', 'us'):
+        calendar = get_market_calendar(market.upper())
+        open_, close = calendar.current_or_next_session(moment)
+        status[market] = open_ <= moment < close
+        status[f'{market}_session'] = f"{open_.astimezone(KST):%H:%M}-{close.astimezone(KST):%H:%M}"
 
-    return {
-        'kr': is_kr_market,
-        'us': is_us_market,
-        'time': now.strftime('%H:%M:%S'),
-        'weekday': weekday
-    }
+    status['time'] = now.strftime('%H:%M:%S')
+    status['weekday'] = now.weekday()
+    return status
 
 
 def format_market_status_message(market_status: Dict, kr_count: int, us_count: int, is_scanning: bool = False) -> str:
@@ -66,13 +57,13 @@ def format_market_status_message(market_status: Dict, kr_count: int, us_count: i
     msg += f"⏰ 현재 시간: {market_status['time']}\n\n"
 
     if market_status['kr']:
-        msg += "🇰🇷 한국 장중 (09:00-15:30)\n"
+        msg += f"🇰🇷 한국 장중 ({market_status.get('kr_session', '09:00-15:30')})\n"
         msg += f"   감시 중: {kr_count}개 종목\n"
     else:
         msg += "🇰🇷 한국 장 마감\n"
 
     if market_status['us']:
-        msg += "🇺🇸 미국 장중 (22:30-06:00)\n"
+        msg += f"🇺🇸 미국 장중 ({market_status.get('us_session', '22:30-06:00')})\n"
         msg += f"   감시 중: {us_count}개 종목\n"
     else:
         msg += "🇺🇸 미국 장 마감\n"
@@ -1,6 +1,24 @@
 """패턴 감지 모듈"""
-from .pivot import detect_pivot_breakout
-from .cup_handle import detect_cup_and_handle
-from .base import detect_base_breakout
+from .pivot import detect_pivot_breakout, detect_pivot_breakout_series
+from .cup_handle import detect_cup_and_handle, detect_cup_and_handle_series
+from .base import detect_base_breakout, detect_base_breakout_series
+from .features import FeatureCache, FeatureSet, get_feature_cache
+from .panel import build_panel, detect_breakouts_panel, split_gapped, stack_tails
+from .streaming import PivotBreakoutState
 
-__all__ = ['detect_pivot_breakout', 'detect_cup_and_handle', 'detect_base_breakout']
+__all__ = [
+    'detect_pivot_breakout',
+    'detect_pivot_breakout_series',
+    'detect_cup_and_handle',
+    'detect_cup_and_handle_series',
+    'detect_base_breakout',
+    'detect_base_breakout_series',
+    'FeatureSet',
+    'FeatureCache',
+    'get_feature_cache',
+    'build_panel',
+    'detect_breakouts_panel',
+    'split_gapped',
+    'stack_tails',
+    'PivotBreakoutState',
+]
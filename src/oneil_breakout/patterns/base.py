@@ -2,6 +2,9 @@
 import numpy as np
 import pandas as pd
 
+from .features import FeatureSet
+from .rolling import shift
+
 
 def detect_base_breakout(
     df: pd.DataFrame,
@@ -52,3 +55,63 @@ def detect_base_breakout(
         pass
 
     return False, 0
+
+
+def detect_base_breakout_series(
+    df: pd.DataFrame,
+    volatility_max: float = 15,
+    volume_surge_min: float = 40,
+    breakout_max: float = 7,
+    features: FeatureSet | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    전체 구간 베이스 돌파 감지 (백테스트용)
+
+    detect_base_breakout을 모든 인덱스에 적용한 것과 같은 결과를
+    이동 구간 배열 연산으로 한 번에 계산한다.
+
+    Args:
+        df: OHLCV 데이터프레임
+        volatility_max: 베이스 최대 변동성 (%)
+        volume_surge_min: 최소 거래량 증가율 (%)
+        breakout_max: 최대 돌파율 (%)
+        features: 공유 지표 (None이면 df로 새로 계산)
+
+    Returns:
+        (신호 배열, 저항선 배열) - 신호가 없는 인덱스의 저항선은 0
+    """
+    if features is None:
+        features = FeatureSet.from_frame(df)
+    return _base_kernel(features, volatility_max, volume_surge_min, breakout_max)
+
+
+def _base_kernel(
+    features: FeatureSet,
+    volatility_max: float,
+    volume_surge_min: float,
+    breakout_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    베이스 돌파 배열 연산 (마지막 축이 일자)
+
+    i번째 봉 기준: i-29 ~ i-5 구간(25개)을 베이스로 보고 고가/저가/평균 거래량 계산
+    """
+    close, volume = features.close, features.volume
+    base_high = shift(features.rolling_max('close', 25), 5)
+    base_low = shift(features.rolling_min('close', 25), 5)
+    avg_volume = shift(features.rolling_mean('volume', 25), 5)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        base_volatility = ((base_high - base_low) / base_low) * 100
+        breakout_pct = ((close - base_high) / base_high) * 100
+        volume_surge = (volume / avg_volume - 1) * 100
+
+    signal = (
+        (features.bar_index() >= 40)
+        & (base_volatility < volatility_max)
+        & (close > base_high)
+        & (volume_surge >= volume_surge_min)
+        & (breakout_pct > 0)
+        & (breakout_pct <= breakout_max)
+    )
+    return signal, np.where(signal, base_high, 0.0)
@@ -2,6 +2,9 @@
 import numpy as np
 import pandas as pd
 
+from .features import FeatureSet
+from .rolling import shift
+
 
 def detect_cup_and_handle(
     df: pd.DataFrame,
@@ -53,3 +56,64 @@ def detect_cup_and_handle(
         pass
 
     return False, 0
+
+
+def detect_cup_and_handle_series(
+    df: pd.DataFrame,
+    cup_depth_min: float = 12,
+    cup_depth_max: float = 40,
+    handle_depth_max: float = 12,
+    features: FeatureSet | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    전체 구간 컵앤핸들 패턴 감지 (백테스트용)
+
+    detect_cup_and_handle을 모든 인덱스에 적용한 것과 같은 결과를
+    이동 구간 최댓값/최솟값으로 한 번에 계산한다.
+
+    Args:
+        df: OHLCV 데이터프레임
+        cup_depth_min: 컵 최소 깊이 (%)
+        cup_depth_max: 컵 최대 깊이 (%)
+        handle_depth_max: 핸들 최대 깊이 (%)
+        features: 공유 지표 (None이면 df로 새로 계산)
+
+    Returns:
+        (신호 배열, 저항선 배열) - 신호가 없는 인덱스의 저항선은 0
+    """
+    if features is None:
+        features = FeatureSet.from_frame(df)
+    return _cup_handle_kernel(features, cup_depth_min, cup_depth_max, handle_depth_max)
+
+
+def _cup_handle_kernel(
+    features: FeatureSet,
+    cup_depth_min: float,
+    cup_depth_max: float,
+    handle_depth_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    컵앤핸들 배열 연산 (마지막 축이 일자)
+
+    i번째 봉 기준 61개 구간: 앞 30개 최고가(왼쪽 고점), 가운데 20개 최저가(바닥),
+    마지막 10개(핸들), 마지막 20개 최고가(저항선)
+    """
+    close = features.close
+    left_peak = shift(features.rolling_max('close', 30), 31)
+    bottom = shift(features.rolling_min('close', 20), 21)
+    handle_high = features.rolling_max('close', 10)
+    handle_low = features.rolling_min('close', 10)
+    resistance = features.rolling_max('close', 20)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cup_depth = ((left_peak - bottom) / left_peak) * 100
+        handle_depth = ((handle_high - handle_low) / handle_high) * 100
+
+    signal = (
+        (features.bar_index() >= 60)
+        & (cup_depth >= cup_depth_min)
+        & (cup_depth <= cup_depth_max)
+        & (handle_depth < handle_depth_max)
+        & (close >= resistance * 0.99)
+    )
+    return signal, np.where(signal, resistance, 0.0)
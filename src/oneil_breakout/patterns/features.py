@@ -0,0 +1,165 @@
+"""종목별 이동 구간 지표 캐시 (패턴 감지 공통)"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List
+
+import numpy as np
+import pandas as pd
+
+from .rolling import bar_index, rolling_max, rolling_mean, rolling_min
+
+
+class FeatureSet:
+    """
+    종가/거래량 배열과 그로부터 계산한 이동 구간 지표 모음
+
+    같은 (지표, 컬럼, 구간) 조합은 한 번만 계산하고 이후에는 저장된 배열을 돌려준다.
+    1차원 시계열과 (종목 × 일자) 패널 모두 지원한다.
+    """
+
+    def __init__(self, close: np.ndarray, volume: np.ndarray):
+        """
+        Args:
+            close: 종가 배열 (마지막 축이 일자)
+            volume: 거래량 배열 (마지막 축이 일자)
+        """
+        self.close = np.asarray(close, dtype=float)
+        self.volume = np.asarray(volume, dtype=float)
+        self._memo: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'FeatureSet':
+        """OHLCV 데이터프레임으로 생성"""
+        return cls(df['Close'].to_numpy(dtype=float), df['Volume'].to_numpy(dtype=float))
+
+    def _cached(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        values = self._memo.get(key)
+        if values is None:
+            values = compute()
+            # 여러 패턴이 같은 배열을 공유하므로 수정 불가로 고정
+            values.flags.writeable = False
+            self._memo[key] = values
+        return values
+
+    def _column(self, column: str) -> np.ndarray:
+        if column == 'close':
+            return self.close
+        if column == 'volume':
+            return self.volume
+        raise ValueError(f"지원하지 않는 컬럼: {column}")
+
+    def rolling_max(self, column: str, window: int) -> np.ndarray:
+        """i번째 봉으로 끝나는 window개 구간 최댓값"""
+        return self._cached(('max', column, window), lambda: rolling_max(self._column(column), window))
+
+    def rolling_min(self, column: str, window: int) -> np.ndarray:
+        """i번째 봉으로 끝나는 window개 구간 최솟값"""
+        return self._cached(('min', column, window), lambda: rolling_min(self._column(column), window))
+
+    def rolling_mean(self, column: str, window: int) -> np.ndarray:
+        """i번째 봉으로 끝나는 window개 구간 평균 (NaN 제외)"""
+        return self._cached(('mean', column, window), lambda: rolling_mean(self._column(column), window))
+
+    def bar_index(self) -> np.ndarray:
+        """첫 유효 봉을 0으로 하는 봉 번호"""
+        return self._cached(('bar_index',), lambda: bar_index(self.close))
+
+
+class FeatureCache:
+    """
+    (종목, 마지막 봉 시각, 봉 개수, 종가/거래량 해시) 기준 FeatureSet LRU 캐시
+
+    새 봉이 생기거나 과거 봉이 수정되면 (수정주가 등) 키가 바뀌어 다시 계산하고,
+    오래 쓰지 않은 종목부터 제거한다.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: 보관할 최대 종목(패널) 수
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Hashable, build: Callable[[], FeatureSet]) -> FeatureSet:
+        with self._lock:
+            features = self._entries.get(key)
+            if features is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return features
+
+        features = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = features
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return features
+
+    def get(self, ticker: str, df: pd.DataFrame) -> FeatureSet:
+        """
+        종목 지표 조회 (없으면 생성)
+
+        Args:
+            ticker: 종목 코드
+            df: OHLCV 데이터프레임
+
+        Returns:
+            FeatureSet
+        """
+        features = FeatureSet.from_frame(df)
+        key = ('series', ticker, df.index[-1] if len(df) else None, len(df), _digest(features))
+        return self._lookup(key, lambda: features)
+
+    def get_panel(
+        self,
+        tickers: List[str],
+        dates: pd.DatetimeIndex,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> FeatureSet:
+        """
+        (종목 × 일자) 패널 지표 조회 (없으면 생성)
+
+        Args:
+            tickers: 종목 리스트 (패널 행 순서)
+            dates: 거래일
+            close: 종가 배열
+            volume: 거래량 배열
+
+        Returns:
+            FeatureSet
+        """
+        features = FeatureSet(close, volume)
+        key = ('panel', tuple(tickers), dates[-1] if len(dates) else None, len(dates), _digest(features))
+        return self._lookup(key, lambda: features)
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _digest(features: FeatureSet) -> bytes:
+    """종가/거래량 배열 해시 (캐시 키용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(features.close).tobytes())
+    digest.update(np.ascontiguousarray(features.volume).tobytes())
+    return digest.digest()
+
+
+_default_cache = FeatureCache()
+
+
+def get_feature_cache() -> FeatureCache:
+    """기본 지표 캐시 (같은 프로세스의 엔진/감지기가 공유)"""
+    return _default_cache
@@ -0,0 +1,156 @@
+"""종목 × 일자 패널 단위 패턴 감지"""
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PatternSettings
+from .base import _base_kernel
+from .cup_handle import _cup_handle_kernel
+from .features import FeatureSet
+from .pivot import _pivot_kernel
+
+PATTERN_KEYS = ('cup', 'pivot', 'base')
+
+
+def build_panel(
+    frames: Dict[str, pd.DataFrame]
+) -> Tuple[List[str], pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """
+    종목별 OHLCV를 합친 거래일 기준 (종목 × 일자) 배열로 변환
+
+    상장 전/상장 폐지 후처럼 데이터가 없는 날은 NaN으로 채운다.
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임}
+
+    Returns:
+        (종목 리스트, 거래일, 종가 배열, 거래량 배열)
+    """
+    tickers = [ticker for ticker, df in frames.items() if df is not None and not df.empty]
+    if not tickers:
+        return [], pd.DatetimeIndex([]), np.empty((0, 0)), np.empty((0, 0))
+
+    dates = frames[tickers[0]].index
+    for ticker in tickers[1:]:
+        dates = dates.union(frames[ticker].index)
+
+    close = np.vstack([frames[t]['Close'].reindex(dates).to_numpy(dtype=float) for t in tickers])
+    volume = np.vstack([frames[t]['Volume'].reindex(dates).to_numpy(dtype=float) for t in tickers])
+    return tickers, dates, close, volume
+
+
+def split_gapped(frames: Dict[str, pd.DataFrame]) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """
+    패널로 계산할 종목과 종목별로 계산할 종목 분리
+
+    합친 거래일 중간에 빠진 봉이 있는 종목(거래정지 등)은 패널 행에 NaN 구간이 생겨
+    이동 구간 결과가 종목별 감지와 달라지므로 패널에서 제외한다.
+    앞뒤(상장 전/상장 폐지 후)만 비는 종목은 패널 결과가 같다.
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임}
+
+    Returns:
+        ({종목 코드: 데이터프레임} 패널 대상, [거래일이 빠진 종목 코드])
+    """
+    tickers = [ticker for ticker, df in frames.items() if df is not None and not df.empty]
+    if not tickers:
+        return {}, []
+
+    dates = frames[tickers[0]].index
+    for ticker in tickers[1:]:
+        dates = dates.union(frames[ticker].index)
+
+    contiguous, gapped = {}, []
+    for ticker in tickers:
+        positions = dates.get_indexer(frames[ticker].index)
+        if positions[-1] - positions[0] + 1 == len(positions):
+            contiguous[ticker] = frames[ticker]
+        else:
+            gapped.append(ticker)
+    return contiguous, gapped
+
+
+def stack_tails(
+    frames: Dict[str, pd.DataFrame],
+    length: int
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    종목별 최근 length개 봉을 오른쪽 정렬로 쌓은 배열 (실시간 스캔용)
+
+    거래일을 맞추지 않고 각 종목의 마지막 봉을 같은 열에 두므로
+    마지막 열의 결과가 종목별 단건 감지와 같다. 봉이 부족한 종목은 앞쪽이 NaN.
+
+    Args:
+        frames: {종목 코드: OHLCV 데이터프레임}
+        length: 쌓을 봉 개수
+
+    Returns:
+        (종목 리스트, 종가 배열, 거래량 배열)
+    """
+    tickers = [ticker for ticker, df in frames.items() if df is not None and not df.empty]
+    close = np.full((len(tickers), length), np.nan)
+    volume = np.full((len(tickers), length), np.nan)
+
+    for row, ticker in enumerate(tickers):
+        tail = frames[ticker].tail(length)
+        close[row, length - len(tail):] = tail['Close'].to_numpy(dtype=float)
+        volume[row, length - len(tail):] = tail['Volume'].to_numpy(dtype=float)
+
+    return tickers, close, volume
+
+
+def detect_breakouts_panel(
+    close: np.ndarray,
+    volume: np.ndarray,
+    settings: PatternSettings | None = None,
+    patterns: Sequence[str] = PATTERN_KEYS,
+    pivot_volume_window: int = 30,
+    features: FeatureSet | None = None
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    (종목 × 일자) 배열에서 패턴 신호 행렬을 한 번에 계산
+
+    각 행의 결과는 해당 종목의 *_series 함수 결과와 같다.
+    (앞쪽 NaN 구간은 상장 전으로 보고 봉 번호에서 제외)
+
+    Args:
+        close: 종가 배열 (종목 × 일자)
+        volume: 거래량 배열 (종목 × 일자)
+        settings: 패턴 감지 설정 (None이면 기본값)
+        patterns: 감지할 패턴 ('cup', 'pivot', 'base')
+        pivot_volume_window: 피벗 돌파 평균 거래량 기간
+            (백테스트 30, 실시간 detect_pivot_breakout과 동일하게 하려면 29)
+        features: close/volume으로 만든 공유 지표 (None이면 새로 계산)
+
+    Returns:
+        {패턴: (신호 행렬, 저항선 행렬)}
+    """
+    settings = settings or PatternSettings()
+    if features is None:
+        features = FeatureSet(close, volume)
+
+    results = {}
+    if 'cup' in patterns:
+        results['cup'] = _cup_handle_kernel(
+            features,
+            settings.cup_depth_min,
+            settings.cup_depth_max,
+            settings.handle_depth_max
+        )
+    if 'pivot' in patterns:
+        results['pivot'] = _pivot_kernel(
+            features,
+            pivot_volume_window,
+            settings.volume_surge_min,
+            settings.breakout_max
+        )
+    if 'base' in patterns:
+        results['base'] = _base_kernel(
+            features,
+            settings.base_volatility_max,
+            settings.base_volume_surge_min,
+            settings.base_breakout_max
+        )
+    return results
@@ -4,6 +4,9 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 
+from .features import FeatureSet
+from .rolling import shift
+
 
 def detect_pivot_breakout(
     df: pd.DataFrame,
@@ -98,3 +101,59 @@ def detect_pivot_breakout_at_index(df: pd.DataFrame, idx: int) -> tuple[bool, fl
         pass
 
     return False, 0
+
+
+def detect_pivot_breakout_series(
+    df: pd.DataFrame,
+    volume_surge_min: float = 50,
+    breakout_max: float = 5,
+    features: FeatureSet | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    전체 구간 피벗 포인트 돌파 감지 (백테스트용)
+
+    detect_pivot_breakout_at_index를 모든 인덱스에 적용한 것과 같은 결과를
+    이동 구간 배열 연산 한 번으로 계산한다.
+
+    Args:
+        df: OHLCV 데이터프레임
+        volume_surge_min: 최소 거래량 증가율 (%)
+        breakout_max: 최대 돌파율 (%)
+        features: 공유 지표 (None이면 df로 새로 계산)
+
+    Returns:
+        (신호 배열, 저항선 배열) - 신호가 없는 인덱스의 저항선은 0
+    """
+    if features is None:
+        features = FeatureSet.from_frame(df)
+    return _pivot_kernel(features, 30, volume_surge_min, breakout_max)
+
+
+def _pivot_kernel(
+    features: FeatureSet,
+    volume_window: int,
+    volume_surge_min: float,
+    breakout_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    피벗 돌파 배열 연산 (마지막 축이 일자)
+
+    i번째 봉 기준: 직전 volume_window개 평균 거래량, 직전 19개 종가 최고가를 저항선으로 사용
+    (detect_pivot_breakout_at_index는 volume_window=30, detect_pivot_breakout은 29에 해당)
+    """
+    close, volume = features.close, features.volume
+    avg_volume = shift(features.rolling_mean('volume', volume_window), 1)
+    resistance = shift(features.rolling_max('close', 19), 1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        volume_surge = (volume / avg_volume - 1) * 100
+        breakout_pct = ((close - resistance) / resistance) * 100
+
+    signal = (
+        (features.bar_index() >= volume_window)
+        & (close > resistance)
+        & (volume_surge >= volume_surge_min)
+        & (breakout_pct > 0)
+        & (breakout_pct <= breakout_max)
+    )
+    return signal, np.where(signal, resistance, 0.0)
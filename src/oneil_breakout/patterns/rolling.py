@@ -0,0 +1,84 @@
+"""이동 구간 배열 연산 (시계열/패널 공통)"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    i번째 값으로 끝나는 window개 구간의 최댓값 (마지막 축 기준)
+
+    Args:
+        values: 1차원 시계열 또는 (종목 × 일자) 2차원 배열
+        window: 구간 길이
+
+    Returns:
+        같은 shape의 배열 (구간이 부족한 앞쪽은 NaN)
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(values, window, axis=-1).max(axis=-1)
+    return out
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """i번째 값으로 끝나는 window개 구간의 최솟값 (마지막 축 기준)"""
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(values, window, axis=-1).min(axis=-1)
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    i번째 값으로 끝나는 window개 구간의 평균 (마지막 축 기준)
+
+    pandas의 mean()과 같이 NaN은 제외하고 평균을 구한다.
+    구간마다 독립적으로 합산하므로 앞쪽 데이터와 무관하게 같은 값이 나온다.
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] >= window:
+        valid = ~np.isnan(values)
+        sums = sliding_window_view(np.where(valid, values, 0.0), window, axis=-1).sum(axis=-1)
+        counts = sliding_window_view(valid, window, axis=-1).sum(axis=-1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[..., window - 1:] = sums / counts
+    return out
+
+
+def bar_index(values: np.ndarray) -> np.ndarray:
+    """
+    행별 첫 유효값을 0으로 하는 봉 번호 (마지막 축 기준)
+
+    패널에서 상장 전 구간처럼 앞쪽이 NaN인 종목도 자기 데이터 기준 인덱스를 갖도록 한다.
+
+    Args:
+        values: 1차원 시계열 또는 (종목 × 일자) 2차원 배열
+
+    Returns:
+        같은 shape의 정수 배열 (첫 유효값 이전은 음수)
+    """
+    values = np.asarray(values, dtype=float)
+    first_valid = np.argmax(~np.isnan(values), axis=-1)
+    return np.arange(values.shape[-1]) - np.expand_dims(first_valid, -1)
+
+
+def shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """
+    마지막 축 기준으로 periods만큼 뒤로 민 배열 (앞쪽은 NaN)
+
+    Args:
+        values: 배열
+        periods: 이동 칸 수 (0 이상)
+
+    Returns:
+        out[..., i] = values[..., i - periods]
+    """
+    values = np.asarray(values, dtype=float)
+    if periods == 0:
+        return values
+    out = np.full(values.shape, np.nan)
+    out[..., periods:] = values[..., :-periods]
+    return out
@@ -0,0 +1,212 @@
+"""봉 단위 증분 피벗 돌파 감지 (실시간 스캔용)"""
+import math
+from collections import deque
+from typing import Dict
+
+import pandas as pd
+
+# detect_pivot_breakout과 같은 구간: 직전 19봉 최고 종가, 직전 29봉 평균 거래량
+RESISTANCE_WINDOW = 19
+VOLUME_WINDOW = 29
+
+
+class PivotBreakoutState:
+    """
+    종목별 피벗 돌파 증분 감지 상태
+
+    완성봉은 구간 상태(저항선용 단조 덱, 거래량 누적합)에 반영하고,
+    형성 중인 봉은 따로 보관해 갱신(revision)을 O(1)로 처리한다.
+    signal()은 detect_pivot_breakout(df)와 같은 신호 딕셔너리를 반환한다.
+    """
+
+    def __init__(
+        self,
+        ticker: str,
+        market: str,
+        stock_name: str | None = None,
+        volume_surge_min: float = 50,
+        breakout_max: float = 5
+    ):
+        """
+        Args:
+            ticker: 종목 코드
+            market: 시장 ('US' 또는 'KR')
+            stock_name: 종목명 (한국 주식용)
+            volume_surge_min: 최소 거래량 증가율 (%)
+            breakout_max: 최대 돌파율 (%)
+        """
+        self.ticker = ticker
+        self.market = market
+        self.stock_name = stock_name
+        self.volume_surge_min = volume_surge_min
+        self.breakout_max = breakout_max
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self._seq = 0
+        self._max_closes: deque = deque()   # (순번, 종가) 내림차순 단조 덱
+        self._nan_closes: deque = deque()   # 구간 내 NaN 종가 순번
+        self._volumes: deque = deque()
+        self._volume_sum = 0
+        self._volume_count = 0
+        self._last_close: float | None = None
+        self._forming: tuple | None = None  # (시각, 종가, 거래량)
+
+    @property
+    def bar_count(self) -> int:
+        """반영된 봉 개수 (형성 중인 봉 포함)"""
+        return self._seq + (1 if self._forming is not None else 0)
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp | None:
+        """형성 중인 봉 시각"""
+        return self._forming[0] if self._forming is not None else None
+
+    def update(self, timestamp: pd.Timestamp, close: float, volume: float):
+        """
+        봉 추가 또는 형성 중인 봉 갱신
+
+        Args:
+            timestamp: 봉 시각 (형성 중인 봉과 같으면 갱신, 이후면 새 봉)
+            close: 종가 (현재가)
+            volume: 누적 거래량
+        """
+        volume = _exact(volume)
+        if self._forming is not None:
+            forming_ts = self._forming[0]
+            if timestamp < forming_ts:
+                return
+            if timestamp > forming_ts:
+                self._commit(self._forming[1], self._forming[2])
+        self._forming = (timestamp, close, volume)
+
+    def _commit(self, close: float, volume):
+        """형성 중이던 봉을 완성봉 구간에 반영"""
+        self._seq += 1
+        seq = self._seq
+
+        # 저항선: 최근 19개 완성봉 종가 최댓값 (NaN이 있으면 np.max처럼 NaN)
+        if math.isnan(close):
+            self._nan_closes.append(seq)
+        else:
+            while self._max_closes and self._max_closes[-1][1] <= close:
+                self._max_closes.pop()
+            self._max_closes.append((seq, close))
+        while self._max_closes and self._max_closes[0][0] <= seq - RESISTANCE_WINDOW:
+            self._max_closes.popleft()
+        while self._nan_closes and self._nan_closes[0] <= seq - RESISTANCE_WINDOW:
+            self._nan_closes.popleft()
+
+        # 평균 거래량: 최근 29개 완성봉 (pandas mean처럼 NaN 제외)
+        self._volumes.append(volume)
+        if not _is_nan(volume):
+            self._volume_sum += volume
+            self._volume_count += 1
+        if len(self._volumes) > VOLUME_WINDOW:
+            expired = self._volumes.popleft()
+            if not _is_nan(expired):
+                self._volume_sum -= expired
+                self._volume_count -= 1
+
+        self._last_close = close
+
+    def sync(self, df: pd.DataFrame):
+        """
+        데이터프레임의 새 봉만 반영 (이미 반영된 구간과 어긋나면 전체 재구성)
+
+        Args:
+            df: OHLCV 데이터프레임
+        """
+        if df is None or df.empty:
+            return
+
+        start = 0
+        if self._forming is not None:
+            position = df.index.searchsorted(self._forming[0])
+            consistent = (
+                position < len(df)
+                and df.index[position] == self._forming[0]
+                and (self._last_close is None
+                     or (position > 0 and _same(df['Close'].iloc[position - 1], self._last_close)))
+            )
+            if consistent:
+                start = position
+            else:
+                self.reset()
+
+        for timestamp, close, volume in zip(
+            df.index[start:], df['Close'].to_numpy()[start:], df['Volume'].to_numpy()[start:]
+        ):
+            self.update(timestamp, float(close), volume)
+
+    def signal(self) -> Dict | None:
+        """
+        현재 (형성 중인) 봉 기준 피벗 돌파 신호
+
+        Returns:
+            detect_pivot_breakout과 같은 신호 딕셔너리 또는 None
+        """
+        if self._forming is None or self._seq < VOLUME_WINDOW:
+            return None
+
+        _, current_price, current_volume = self._forming
+        if self._nan_closes or not self._max_closes:
+            return None
+        resistance = self._max_closes[0][1]
+
+        if self._volume_count == 0 or _is_nan(current_volume):
+            return None
+        avg_volume = self._volume_sum / self._volume_count
+        if avg_volume == 0:
+            # numpy 나눗셈과 동일하게 처리 (x/0 → inf, 0/0 → NaN)
+            volume_surge = math.inf if current_volume > 0 else math.nan
+        else:
+            volume_surge = (current_volume / avg_volume - 1) * 100
+
+        if resistance == 0:
+            return None
+        breakout = current_price > resistance
+        breakout_pct = ((current_price - resistance) / resistance) * 100
+
+        if breakout and volume_surge >= self.volume_surge_min and 0 < breakout_pct <= self.breakout_max:
+            signal = {
+                'ticker': self.ticker,
+                'pattern': '피벗돌파',
+                'market': self.market,
+                'resistance': resistance,
+                'current_price': current_price,
+                'breakout_pct': round(breakout_pct, 2),
+                'volume_surge': round(volume_surge, 2)
+            }
+
+            if self.market == 'KR' and self.stock_name:
+                signal['name'] = self.stock_name
+
+            return signal
+
+        return None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, ticker: str, market: str, **kwargs) -> 'PivotBreakoutState':
+        """데이터프레임 전체로 상태 생성"""
+        state = cls(ticker, market, **kwargs)
+        state.sync(df)
+        return state
+
+
+def _exact(volume):
+    """정수 거래량은 int로 보관해 누적합 오차를 없앰"""
+    volume = float(volume)
+    if not math.isnan(volume) and volume.is_integer():
+        return int(volume)
+    return volume
+
+
+def _is_nan(value) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _same(a: float, b: float) -> bool:
+    a, b = float(a), float(b)
+    return a == b or (math.isnan(a) and math.isnan(b))
@@ -1,5 +1,5 @@
 """텔레그램 봇 모듈"""
 from .client import TelegramClient
-from .formatter import format_signal_message, format_close_position_message
+from .formatter import format_signal_message, format_extended_message, format_close_position_message
 
-__all__ = ['TelegramClient', 'format_signal_message', 'format_close_position_message']
+__all__ = ['TelegramClient', 'format_signal_message', 'format_extended_message', 'format_close_position_message']
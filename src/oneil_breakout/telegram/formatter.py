@@ -3,12 +3,13 @@ from datetime import datetime
 from typing import Dict
 
 
-def format_signal_message(signal: Dict) -> str:
+def format_signal_message(signal: Dict, new_pivot: bool = False) -> str:
     """
     신호를 텔레그램 메시지 형식으로 변환
 
     Args:
         signal: 신호 딕셔너리
+        new_pivot: 이미 알린 종목의 새 피벗 돌파 여부 (제목만 다름)
 
     Returns:
         포맷된 HTML 메시지
@@ -26,8 +27,10 @@ def format_signal_message(signal: Dict) -> str:
         ticker_display = f"<b>{signal.get('name', ticker)} ({ticker})</b>"
         price_format = lambda x: f"{int(x):,}원"
 
+    title = "새 피벗 돌파!" if new_pivot else "피벗 포인트 돌파!"
+
     msg = f"""
-{market_emoji} <b>[피벗 포인트 돌파!]</b>
+{market_emoji} <b>[{title}]</b>
 
 📊 시장: {market_text} 주식
 🏢 종목: {ticker_display}
@@ -45,6 +48,43 @@ def format_signal_message(signal: Dict) -> str:
     return msg
 
 
+def format_extended_message(signal: Dict) -> str:
+    """
+    알린 신호의 매수 범위 이탈 메시지 포맷팅
+
+    Args:
+        signal: 알린 피벗(resistance), 현재가, 돌파율, 매수 범위(breakout_max)를 담은 딕셔너리
+
+    Returns:
+        포맷된 HTML 메시지
+    """
+    ticker = signal['ticker']
+    market = signal['market']
+
+    market_emoji = "🇺🇸" if market == 'US' else "🇰🇷"
+
+    if market == 'US':
+        ticker_display = f"<b>{ticker}</b>"
+        price_format = lambda x: f"${round(x, 2)}"
+    else:
+        ticker_display = f"<b>{signal.get('name', ticker)} ({ticker})</b>"
+        price_format = lambda x: f"{int(x):,}원"
+
+    msg = f"""
+{market_emoji} <b>[매수 범위 이탈]</b>
+
+🏢 종목: {ticker_display}
+💰 현재가: {price_format(signal['current_price'])}
+🎯 돌파가: {price_format(signal['resistance'])}
+📈 돌파율: {signal['breakout_pct']}% (매수 범위 +{signal['breakout_max']}% 초과)
+
+⚠️ 추격 매수 주의 - 다음 피벗을 기다리세요
+
+⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+    return msg
+
+
 def format_close_position_message(
     ticker: str,
     market: str,
@@ -4,7 +4,7 @@ import os
 from datetime import datetime
 from typing import List, Tuple
 
-from pykrx import stock
+from ..data.kr_stock import get_kr_stock_name
 
 
 class WatchlistManager:
@@ -86,20 +86,13 @@ class WatchlistManager:
             결과 메시지
         """
         ticker = ticker.strip()
+        stock_display = self._format_kr(ticker)
         if ticker in self.kr_watchlist:
-            try:
-                name = stock.get_market_ticker_name(ticker)
-                return f"⚠️  {name}({ticker})는 이미 감시 중입니다."
-            except:
-                return f"⚠️  {ticker}는 이미 감시 중입니다."
+            return f"⚠️  {stock_display}는 이미 감시 중입니다."
 
         self.kr_watchlist.append(ticker)
         if self._save():
-            try:
-                name = stock.get_market_ticker_name(ticker)
-                return f"✅ 🇰🇷 {name}({ticker}) 추가 완료!\n현재 한국 종목: {len(self.kr_watchlist)}개"
-            except:
-                return f"✅ 🇰🇷 {ticker} 추가 완료!\n현재 한국 종목: {len(self.kr_watchlist)}개"
+            return f"✅ 🇰🇷 {stock_display} 추가 완료!\n현재 한국 종목: {len(self.kr_watchlist)}개"
         else:
             self.kr_watchlist.remove(ticker)
             return "❌ 저장 실패"
@@ -139,11 +132,7 @@ class WatchlistManager:
         if ticker not in self.kr_watchlist:
             return f"⚠️  {ticker}는 감시 목록에 없습니다."
 
-        try:
-            name = stock.get_market_ticker_name(ticker)
-            stock_display = f"{name}({ticker})"
-        except:
-            stock_display = ticker
+        stock_display = self._format_kr(ticker)
 
         self.kr_watchlist.remove(ticker)
         if self._save():
@@ -152,6 +141,11 @@ class WatchlistManager:
             self.kr_watchlist.append(ticker)
             return "❌ 저장 실패"
 
+    def _format_kr(self, ticker: str) -> str:
+        """한국 종목 표시명 (종목명 인덱스 사용)"""
+        name = get_kr_stock_name(ticker)
+        return f"{name}({ticker})" if name != ticker else ticker
+
     def get_us(self) -> List[str]:
         """미국 감시 종목 조회"""
         return self.us_watchlist.copy()
@@ -185,14 +179,7 @@ class WatchlistManager:
 
         msg += f"\n\n🇰🇷 <b>한국 주식</b> ({len(self.kr_watchlist)}개)\n"
         if self.kr_watchlist:
-            kr_names = []
-            for ticker in self.kr_watchlist:
-                try:
-                    name = stock.get_market_ticker_name(ticker)
-                    kr_names.append(f"{name}({ticker})")
-                except:
-                    kr_names.append(ticker)
-            msg += ", ".join(kr_names)
+            msg += ", ".join(self._format_kr(ticker) for ticker in self.kr_watchlist)
         else:
             msg += "없음"
 
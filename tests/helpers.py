@@ -0,0 +1,37 @@
+"""테스트용 임의 일봉 생성"""
+import numpy as np
+import pandas as pd
+
+
+def make_frame(seed: int, length: int = 400, nan_ratio: float = 0.0, int_volume: bool = True) -> pd.DataFrame:
+    """
+    횡보/급등 구간이 섞인 임의 일봉
+
+    Args:
+        seed: 난수 시드
+        length: 봉 수
+        nan_ratio: 종가/거래량에 넣을 NaN 비율
+        int_volume: 거래량을 정수로 만들지 여부
+    """
+    rng = np.random.default_rng(seed)
+    # 변동성이 작은 구간과 큰 구간을 번갈아 만들어 베이스/컵 형태가 생기도록 함
+    scale = np.repeat(rng.choice([0.003, 0.01, 0.03], size=length // 20 + 1), 20)[:length]
+    returns = rng.normal(0.0005, scale)
+    jumps = rng.random(length) < 0.04
+    returns[jumps] += rng.uniform(0.005, 0.05, jumps.sum())
+    close = 100 * np.exp(np.cumsum(returns))
+
+    volume = rng.integers(100_000, 200_000, length)
+    volume[jumps] *= rng.integers(2, 4, jumps.sum())
+    volume = volume if int_volume else volume.astype(float) * rng.uniform(0.9, 1.1, length)
+
+    df = pd.DataFrame(
+        {'Close': close, 'Volume': volume},
+        index=pd.bdate_range('2020-01-01', periods=length)
+    )
+    if nan_ratio:
+        for column in ('Close', 'Volume'):
+            mask = rng.random(length) < nan_ratio
+            df[column] = df[column].astype(float)
+            df.loc[mask, column] = np.nan
+    return df
@@ -0,0 +1,35 @@
+"""다중 종목 패널 신호와 종목별 신호 비교"""
+import numpy as np
+
+from oneil_breakout.backtest.engine import BacktestEngine
+from oneil_breakout.patterns.panel import split_gapped
+
+from helpers import make_frame
+
+
+def make_frames() -> dict:
+    """상장일이 다른 종목, 상장 폐지 종목, 중간에 거래정지된 종목이 섞인 데이터"""
+    frames = {f"T{seed}": make_frame(seed) for seed in range(6)}
+    frames['LATE'] = make_frame(10).iloc[120:]
+    frames['DELISTED'] = make_frame(11).iloc[:250]
+    halted = make_frame(12)
+    frames['HALTED'] = halted.drop(halted.index[150:160])
+    return frames
+
+
+def test_split_gapped_separates_halted_tickers():
+    contiguous, gapped = split_gapped(make_frames())
+    assert gapped == ['HALTED']
+    assert 'LATE' in contiguous and 'DELISTED' in contiguous
+
+
+def test_panel_signals_match_per_ticker():
+    frames = make_frames()
+    engine = BacktestEngine()
+    panel = engine.detect_signals_panel(frames)
+
+    assert list(panel) == list(frames)
+    for ticker, df in frames.items():
+        expected = engine.detect_signals(df)
+        for key in ('cup', 'pivot', 'base'):
+            np.testing.assert_array_equal(panel[ticker][key], expected[key], err_msg=f"{ticker} {key}")
@@ -0,0 +1,88 @@
+"""전체 구간 패턴 감지(배열 연산)와 인덱스별 감지 결과 비교"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from oneil_breakout.patterns.base import detect_base_breakout, detect_base_breakout_series
+from oneil_breakout.patterns.cup_handle import detect_cup_and_handle, detect_cup_and_handle_series
+from oneil_breakout.patterns.pivot import detect_pivot_breakout_at_index, detect_pivot_breakout_series
+
+from helpers import make_frame
+
+SEEDS = range(20)
+
+
+def assert_parity(df: pd.DataFrame, series_result, at_index) -> int:
+    """배열 연산 결과가 인덱스별 결과와 봉 단위로 같은지 확인 (신호 수 반환)"""
+    signals, resistance = series_result
+    assert len(signals) == len(df)
+
+    for idx in range(len(df)):
+        expected_signal, expected_resistance = at_index(df, idx)
+        assert bool(signals[idx]) == bool(expected_signal), f"신호 불일치 (idx={idx})"
+        if expected_signal:
+            assert resistance[idx] == pytest.approx(expected_resistance, rel=1e-12), f"저항선 불일치 (idx={idx})"
+        else:
+            assert resistance[idx] == 0
+    return int(np.count_nonzero(signals))
+
+
+@pytest.mark.parametrize('nan_ratio', [0.0, 0.02])
+@pytest.mark.parametrize('int_volume', [True, False])
+def test_pivot_series_matches_at_index(nan_ratio, int_volume):
+    total = 0
+    for seed in SEEDS:
+        df = make_frame(seed, nan_ratio=nan_ratio, int_volume=int_volume)
+        total += assert_parity(df, detect_pivot_breakout_series(df), detect_pivot_breakout_at_index)
+    if not nan_ratio:
+        assert total > 0
+
+
+@pytest.mark.parametrize('nan_ratio', [0.0, 0.02])
+@pytest.mark.parametrize('int_volume', [True, False])
+def test_cup_and_handle_series_matches_at_index(nan_ratio, int_volume):
+    total = 0
+    for seed in SEEDS:
+        df = make_frame(seed, nan_ratio=nan_ratio, int_volume=int_volume)
+        total += assert_parity(df, detect_cup_and_handle_series(df), detect_cup_and_handle)
+    if not nan_ratio:
+        assert total > 0
+
+
+@pytest.mark.parametrize('nan_ratio', [0.0, 0.02])
+@pytest.mark.parametrize('int_volume', [True, False])
+def test_base_breakout_series_matches_at_index(nan_ratio, int_volume):
+    total = 0
+    for seed in SEEDS:
+        df = make_frame(seed, nan_ratio=nan_ratio, int_volume=int_volume)
+        total += assert_parity(df, detect_base_breakout_series(df), detect_base_breakout)
+    if not nan_ratio:
+        assert total > 0
+
+
+def test_custom_thresholds_match_at_index():
+    """기본값이 아닌 기준값도 같은 결과"""
+    for seed in SEEDS:
+        df = make_frame(seed, nan_ratio=0.01)
+        assert_parity(
+            df,
+            detect_cup_and_handle_series(df, cup_depth_min=5, cup_depth_max=30, handle_depth_max=8),
+            lambda frame, idx: detect_cup_and_handle(frame, idx, 5, 30, 8)
+        )
+        assert_parity(
+            df,
+            detect_base_breakout_series(df, volatility_max=10, volume_surge_min=20, breakout_max=4),
+            lambda frame, idx: detect_base_breakout(frame, idx, 10, 20, 4)
+        )
+
+
+def test_short_series_has_no_signals():
+    """감지 구간보다 짧은 데이터는 신호 없음"""
+    df = make_frame(0, length=25)
+    for signals, resistance in (
+        detect_pivot_breakout_series(df),
+        detect_cup_and_handle_series(df),
+        detect_base_breakout_series(df)
+    ):
+        assert not signals.any()
+        assert not resistance.any()